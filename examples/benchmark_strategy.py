@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Benchmarks of df.ta.strategy() on data/SPY_D.csv
+#
+# Usage: python examples/benchmark_strategy.py [runs]
+import sys
+import tracemalloc
+from time import perf_counter
+
+import pandas as pd
+import pandas_ta as ta
+
+
+def load(path: str = "data/SPY_D.csv") -> pd.DataFrame:
+    df = pd.read_csv(path, index_col="date", parse_dates=True)
+    return df.drop(columns=["Unnamed: 0"], errors="ignore")
+
+
+def measure(fn, runs: int = 3) -> tuple:
+    """Returns the best time in seconds and the peak traced memory in MB."""
+    best = float("inf")
+    for _ in range(runs):
+        stime = perf_counter()
+        fn()
+        best = min(best, perf_counter() - stime)
+
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak / 1024 ** 2
+
+
+def append_columns(df: pd.DataFrame, runs: int = 3) -> None:
+    """Result assembly of the All strategy: inserting the result columns one
+    at a time versus attaching them at once as strategy() does."""
+    result = df.copy()
+    result.ta.cores = 0
+    result.ta.strategy(ta.AllStrategy)
+    columns = [(c, result[c].copy()) for c in result.columns[df.shape[1]:]]
+
+    def one_at_a_time():
+        frame = df.copy()
+        for name, values in columns:
+            frame[name] = values
+        return frame
+
+    def assembled():
+        frame = df.copy()
+        with frame.ta._assemble():
+            for name, values in columns:
+                frame.ta._set_column(frame, name, values)
+        return frame
+
+    print(f"[+] All Strategy result assembly: {len(columns)} columns, {df.shape[0]} rows")
+    for name, fn in [("One at a time", one_at_a_time), ("Assembled", assembled)]:
+        seconds, peak = measure(fn, runs)
+        blocks = fn()._mgr.nblocks
+        print(f"[i] {name:>14}: {seconds:.4f}s, peak {peak:.1f} MB, {blocks} block(s)")
+
+
+def indicators(df: pd.DataFrame, names: list, runs: int = 3) -> None:
+    """Single indicators, like td_seq which was excluded from the All
+    strategy while it was slow."""
+    for name in names:
+        seconds, peak = measure(lambda: getattr(df.ta, name)(), runs)
+        print(f"[+] {name}: {seconds:.4f}s, peak {peak:.1f} MB")
+
+
+def all_strategy(df: pd.DataFrame, runs: int = 1) -> None:
+    """The All strategy without multiprocessing."""
+    def fn():
+        frame = df.copy()
+        frame.ta.cores = 0
+        frame.ta.strategy(ta.AllStrategy)
+
+    seconds, peak = measure(fn, runs)
+    print(f"[+] All Strategy (cores=0): {seconds:.4f}s, peak {peak:.1f} MB")
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    df = load()
+    append_columns(df, runs)
+    indicators(df, ["td_seq", "ema"], runs)
+    all_strategy(df)
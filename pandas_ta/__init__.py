@@ -114,3 +114,5 @@ RATE = {
 }
 
 from pandas_ta.core import *
+
+from pandas_ta import stream
@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+from numpy import add as npAdd
+from numpy import array as npArray
+from numpy import asarray as npAsarray
+from numpy import concatenate as npConcatenate
+from numpy import cumsum as npCumsum
+from numpy import diff as npDiff
+from numpy import empty as npEmpty
+from numpy import flatnonzero as npFlatnonzero
+from numpy import floor as npFloor
+from numpy import int64 as npInt64
+from numpy import maximum as npMaximum
+from numpy import minimum as npMinimum
+from numpy import ndim as npNdim
+from numpy import ones as npOnes
+from pandas import DataFrame, DatetimeIndex, Index, Timedelta, Timestamp
+
+from pandas_ta import CANGLE_AGG
+
+# The kinds of bars and their default sizes
+BAR_KINDS = {"time": "1min", "tick": 100, "volume": 10_000, "dollar": 1_000_000}
+# The columns of the bars: those of CANGLE_AGG and the number of trades
+BAR_COLUMNS = [*CANGLE_AGG, "trades"]
+
+
+class BarBuilder(object):
+    """Tick to Bar Aggregator
+
+    Builds the OHLCV bars of a stream of trades, aggregated as CANGLE_AGG
+    does, with the number of trades of each bar:
+    * time: the trades of each 'size' period, like "1min", labelled by its
+      start like df.resample(). A bar completes with the first trade of a
+      later period, or with flush(partial=True).
+    * tick: every 'size' trades.
+    * volume: every 'size' units traded.
+    * dollar: every 'size' of price * volume traded.
+
+    The volume and dollar bars complete with the trade that reaches a
+    multiple of 'size' of the cumulative measure, so what a trade adds past
+    it counts toward the next bar, and a bar never splits a trade. They are
+    labelled by the timestamp of their last trade.
+
+    Completed bars are pushed to the 'streams', a Stream, StreamingStrategy
+    or a list of them, and held in a preallocated buffer until flush()
+    returns them as a DataFrame. With 'on_batch', a full buffer is flushed
+    to it; otherwise the buffer grows.
+
+    Trades are expected in time order. Pass them as arrays, in batches, for
+    throughput: a batch is aggregated with NumPy without a Python loop per
+    trade. A single trade is aggregated in Python for live data. Timestamps
+    with a timezone are aggregated in UTC, and the bars are labelled in
+    the timezone of the trades.
+
+    >>> builder = ta.BarBuilder("volume", 5000, streams=live)
+    >>> builder.update(prices, volumes, timestamps)
+    >>> bars = builder.flush()
+
+    Args:
+        kind (str): "time", "tick", "volume" or "dollar". Default: "time"
+        size (str | int | float): The period of time bars, as a pandas
+            Timedelta string, or the trades, volume or dollars of a bar.
+            Default: the kind's in BAR_KINDS
+        capacity (int): Bars of the buffer. Default: 4096
+        streams (Stream | StreamingStrategy | list): Updated with every
+            completed bar. Default: None
+        on_batch (callable): Called with the DataFrame of the bars whenever
+            the buffer is full. Default: None
+    """
+
+    def __init__(self, kind: str = None, size=None, capacity: int = None, streams=None, on_batch=None):
+        kind = kind.lower() if isinstance(kind, str) else "time"
+        if kind not in BAR_KINDS:
+            print(f"[X] BarBuilder kind must be one of: {', '.join(BAR_KINDS)}")
+            kind = "time"
+        self.kind = kind
+        if kind == "time":
+            size = Timedelta(size if size is not None else BAR_KINDS[kind]).value
+        self.size = size if size is not None and size > 0 else BAR_KINDS[kind]
+        self.capacity = int(capacity) if capacity and capacity > 0 else 4096
+        self.streams = streams if isinstance(streams, list) else [] if streams is None else [streams]
+        self.on_batch = on_batch
+        self.datetime, self.tz = None, None
+        self.buffer = npEmpty((self.capacity, len(BAR_COLUMNS)))
+        self.stamps = npEmpty(self.capacity, dtype=npInt64)
+        self.count = 0
+        self.reset()
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return f"BarBuilder({self.kind}, {self.size}, bars={self.count})"
+
+    def reset(self) -> None:
+        """Discards the bar in progress and the buffered bars."""
+        # The bar in progress: its values, the timestamp of its period or
+        # last trade, its period and the measure it has filled
+        self.bar, self.stamp, self.period, self.filled = [0.0] * len(BAR_COLUMNS), 0, 0, 0.0
+        self.count = 0
+
+    def update(self, price, volume, timestamp=None) -> int:
+        """Aggregates a trade, or arrays of trades, and returns the number of
+        bars that were completed. The timestamps are datetimes or, without
+        them, the trades are numbered."""
+        if isinstance(price, (int, float)) or npNdim(price) == 0:
+            return self._update_trade(float(price), float(volume), timestamp)
+
+        prices = npAsarray(price, dtype=float)
+        volumes = npAsarray(volume, dtype=float)
+        n = prices.size
+        if n == 0: return 0
+        stamps = self._stamps(timestamp, n)
+        return self._update_trades(prices, volumes, stamps)
+
+    def flush(self, partial: bool = False) -> DataFrame:
+        """Returns the DataFrame of the completed bars and empties the
+        buffer. With 'partial', the bar in progress is completed first."""
+        if partial and self.bar[-1] > 0:
+            self._complete(npArray([self.bar]), npArray([self._label()], dtype=npInt64))
+            self.bar[-1], self.filled = 0.0, 0.0
+
+        count, self.count = self.count, 0
+        if self.datetime:
+            index = self._index(self.stamps[:count].copy()).rename("datetime")
+        else:
+            index = Index(self.stamps[:count].copy(), name="trade")
+        bars = DataFrame(self.buffer[:count].copy(), index=index, columns=BAR_COLUMNS)
+        bars["trades"] = bars["trades"].astype(npInt64)
+        return bars
+
+    # Private
+    def _index(self, stamps) -> DatetimeIndex:
+        """The DatetimeIndex of the int64 UTC nanoseconds 'stamps', in the
+        timezone of the trades."""
+        index = DatetimeIndex(stamps)
+        return index if self.tz is None else index.tz_localize("UTC").tz_convert(self.tz)
+
+    def _stamps(self, timestamp, n: int):
+        """The int64 UTC nanoseconds of the 'timestamp's of 'n' trades or,
+        when None, their numbers."""
+        if timestamp is None:
+            if self.kind == "time":
+                raise ValueError("Time bars require the timestamps of the trades")
+            self.datetime = False
+            stamps = npCumsum(npOnes(n, dtype=npInt64)) + self.stamp
+            return stamps
+
+        self.datetime = True
+        if getattr(getattr(timestamp, "dtype", None), "tz", None) is None:
+            stamps = npAsarray(timestamp)
+            if stamps.dtype.kind == "M":
+                self.tz = None
+                return stamps.astype("datetime64[ns]").view(npInt64)
+        stamps = DatetimeIndex(timestamp)
+        self.tz = stamps.tz
+        return stamps.asi8
+
+    def _label(self) -> int:
+        """The label of the bar in progress."""
+        return self.period * self.size if self.kind == "time" else self.stamp
+
+    def _measure(self, prices, volumes):
+        """What the trades add to a tick, volume or dollar bar."""
+        if self.kind == "tick": return npOnes(prices.size)
+        if self.kind == "volume": return volumes
+        return prices * volumes
+
+    def _update_trade(self, price: float, volume: float, timestamp) -> int:
+        if timestamp is None:
+            if self.kind == "time":
+                raise ValueError("Time bars require the timestamps of the trades")
+            self.datetime, stamp = False, self.stamp + 1
+        elif isinstance(timestamp, int):
+            self.datetime, self.tz, stamp = True, None, timestamp
+        else:
+            timestamp = Timestamp(timestamp)
+            self.datetime, self.tz, stamp = True, timestamp.tz, timestamp.value
+
+        completed, bar = 0, self.bar
+        if self.kind == "time":
+            period = stamp // self.size
+            if bar[-1] > 0 and period != self.period:
+                self._complete(npArray([bar]), npArray([self._label()], dtype=npInt64))
+                bar[-1], completed = 0.0, 1
+            self.period = period
+
+        if bar[-1] > 0:
+            bar[1], bar[2] = max(bar[1], price), min(bar[2], price)
+            bar[3] = price
+            bar[4] += volume
+            bar[5] += 1
+        else:
+            bar[:] = price, price, price, price, volume, 1.0
+        self.stamp = stamp
+
+        if self.kind != "time":
+            filled = self.filled + (1.0 if self.kind == "tick" else volume if self.kind == "volume" else price * volume)
+            if filled >= self.size:
+                self._complete(npArray([bar]), npArray([stamp], dtype=npInt64))
+                bar[-1], completed = 0.0, completed + 1
+                filled -= (filled // self.size) * self.size
+            self.filled = filled
+        return completed
+
+    def _update_trades(self, prices, volumes, stamps) -> int:
+        n, size, completed = prices.size, self.size, 0
+        if self.kind == "time":
+            ids = stamps // size
+            continues = self.bar[-1] > 0 and ids[0] == self.period
+            if self.bar[-1] > 0 and not continues:
+                self._complete(npArray([self.bar]), npArray([self._label()], dtype=npInt64))
+                completed = 1
+            last_complete = False
+        else:
+            totals = self.filled + npCumsum(self._measure(prices, volumes))
+            before = npEmpty(n)
+            before[0], before[1:] = self.filled, totals[:-1]
+            ids = npFloor(before / size)
+            continues = self.bar[-1] > 0
+            last_complete = totals[-1] >= (ids[-1] + 1) * size
+            self.filled = totals[-1] - npFloor(totals[-1] / size) * size
+
+        # The trades of each bar are consecutive
+        starts = npConcatenate([[0], npFlatnonzero(ids[1:] != ids[:-1]) + 1])
+        ends = npConcatenate([starts[1:], [n]])
+        bars = npEmpty((starts.size, len(BAR_COLUMNS)))
+        bars[:, 0] = prices[starts]
+        bars[:, 1] = npMaximum.reduceat(prices, starts)
+        bars[:, 2] = npMinimum.reduceat(prices, starts)
+        bars[:, 3] = prices[ends - 1]
+        bars[:, 4] = npAdd.reduceat(volumes, starts)
+        bars[:, 5] = npDiff(npConcatenate([starts, [n]]))
+        labels = ids[starts].astype(npInt64) * size if self.kind == "time" else stamps[ends - 1]
+
+        if continues:
+            bar = self.bar
+            bars[0, 0] = bar[0]
+            bars[0, 1], bars[0, 2] = max(bars[0, 1], bar[1]), min(bars[0, 2], bar[2])
+            bars[0, 4] += bar[4]
+            bars[0, 5] += bar[5]
+
+        k = starts.size if last_complete else starts.size - 1
+        if k:
+            self._complete(bars[:k], labels[:k])
+        if last_complete:
+            self.bar[-1] = 0.0
+        else:
+            self.bar = bars[-1].tolist()
+            self.period = int(ids[-1])
+        self.stamp = int(stamps[-1])
+        return completed + k
+
+    def _complete(self, bars, labels) -> None:
+        """Pushes the completed 'bars' to the streams and buffers them."""
+        if len(self.streams):
+            stamps = self._index(labels) if self.datetime else labels.tolist()
+            for values, stamp in zip(bars.tolist(), stamps):
+                bar = dict(zip(BAR_COLUMNS, values))
+                for stream in self.streams:
+                    if hasattr(stream, "push"):
+                        stream.push(*values[:5], ts=stamp)
+                    else:
+                        stream.update(*[bar[x] for x in stream.inputs])
+
+        k, i = len(labels), 0
+        while i < k:
+            if self.count == self.capacity:
+                if self.on_batch is not None:
+                    self.on_batch(self.flush())
+                else:
+                    self._grow(self.capacity + k - i)
+            j = min(k, i + self.capacity - self.count)
+            self.buffer[self.count:self.count + j - i] = bars[i:j]
+            self.stamps[self.count:self.count + j - i] = labels[i:j]
+            self.count += j - i
+            i = j
+
+    def _grow(self, capacity: int) -> None:
+        """Doubles the buffer until it holds 'capacity' bars."""
+        while self.capacity < capacity:
+            self.capacity *= 2
+        buffer, stamps = self.buffer, self.stamps
+        self.buffer = npEmpty((self.capacity, len(BAR_COLUMNS)))
+        self.stamps = npEmpty(self.capacity, dtype=npInt64)
+        self.buffer[:self.count] = buffer[:self.count]
+        self.stamps[:self.count] = stamps[:self.count]
@@ -1,31 +1,74 @@
 # -*- coding: utf-8 -*-
-from pandas import DataFrame
-from pandas_ta.utils import get_offset, verify_series
-
-
-def ha(open_, high, low, close, offset=None, **kwargs):
+from numpy import concatenate as npConcatenate
+from numpy import fmax as npFmax
+from numpy import fmin as npFmin
+from numpy import isnan as npIsnan
+from numpy import nan as npNaN
+from pandas import DataFrame, Series
+from pandas_ta.utils import get_offset, is_datetime_ordered, verify_series
+
+
+def ha_open(open_, close, ha_close) -> Series:
+    """Heikin Ashi open: the first is the mean of the first 'open_' and
+    'close', the others the mean of the previous HA open and close. This
+    first order recurrence is an ewm with alpha = 0.5 of the previous
+    'ha_close's, starting from the first HA open. Like the recurrence, a
+    NaN makes all the later HA opens NaN."""
+    x = ha_close.to_numpy(dtype=float)
+    x = npConcatenate(([0.5 * (open_.iloc[0] + close.iloc[0])], x[:-1]))
+    result = Series(x, index=ha_close.index).ewm(alpha=0.5, adjust=False).mean()
+    missing = npIsnan(x)
+    if missing.any():
+        result.iloc[missing.argmax():] = npNaN
+    return result
+
+
+def ha(open_, high, low, close, timeframe=None, offset=None, **kwargs):
     """Candle Type: Heikin Ashi"""
     # Validate Arguments
     open_ = verify_series(open_)
     high = verify_series(high)
     low = verify_series(low)
     close = verify_series(close)
+    timeframe = timeframe.upper() if timeframe and isinstance(timeframe, str) else None
     offset = get_offset(offset)
 
+    if open_ is None or high is None or low is None or close is None: return
+    if timeframe is not None and not is_datetime_ordered(close):
+        print("[X] HA timeframe requires a datetime ordered index.")
+        return
+
     # Calculate Result
-    m = close.size
+    if timeframe is None:
+        ha_close = 0.25 * (open_ + high + low + close)
+        ha_open_ = ha_open(open_, close, ha_close)
+    else:
+        # The bars of the 'timeframe' so far: the HA open of a bar only
+        # depends on the completed ones
+        period = close.index.to_period(timeframe)
+        open_ = open_.groupby(period).transform("first")
+        high = high.groupby(period).cummax()
+        low = low.groupby(period).cummin()
+
+        bars = DataFrame({
+            "open": open_.groupby(period).first(),
+            "high": high.groupby(period).last(),
+            "low": low.groupby(period).last(),
+            "close": close.groupby(period).last(),
+        })
+        bars_close = 0.25 * bars.sum(axis=1, skipna=False)
+        bars_open = ha_open(bars["open"], bars["close"], bars_close)
+
+        ha_close = 0.25 * (open_ + high + low + close)
+        ha_open_ = Series(bars_open.reindex(period).to_numpy(), index=close.index)
+
+    o, h, l, c = (x.to_numpy(dtype=float) for x in (ha_open_, high, low, ha_close))
     df = DataFrame({
-        "HA_open": 0.5 * (open_.iloc[0] + close.iloc[0]),
-        "HA_high": high,
-        "HA_low": low,
-        "HA_close": 0.25 * (open_ + high + low + close),
-    })
-
-    for i in range(1, m):
-        df["HA_open"][i] = 0.5 * (df["HA_open"][i - 1] + df["HA_close"][i - 1])
-
-    df["HA_high"] = df[["HA_open", "HA_high", "HA_close"]].max(axis=1)
-    df["HA_low"] = df[["HA_open", "HA_low", "HA_close"]].min(axis=1)
+        "HA_open": o,
+        "HA_high": npFmax(npFmax(o, h), c),
+        "HA_low": npFmin(npFmin(o, l), c),
+        "HA_close": c,
+    }, index=close.index)
 
     # Offset
     if offset != 0:
@@ -38,7 +81,9 @@ def ha(open_, high, low, close, offset=None, **kwargs):
         df.fillna(method=kwargs["fill_method"], inplace=True)
 
     # Name and Categorize it
-    df.name = "Heikin-Ashi"
+    if timeframe is not None:
+        df.columns = [f"{c}_{timeframe}" for c in df.columns]
+    df.name = "Heikin-Ashi" if timeframe is None else f"Heikin-Ashi_{timeframe}"
     df.category = "candles"
 
     return df
@@ -70,6 +115,9 @@ Calculation:
     HA_HIGH = MAX(HA_OPEN, HA_HIGH, HA_CLOSE)
     HA_LOW = MIN(HA_OPEN, HA_LOW, HA_CLOSE)
 
+    HA_OPEN is an ewm with alpha = 0.5 of the previous HA_CLOSEs starting
+    from HA_OPEN[0]. A NaN makes all the later HA_OPENs NaN.
+
     How to Calculate Heikin-Ashi
 
     Use one period to create the first Heikin-Ashi (HA) candle, using
@@ -79,11 +127,18 @@ Calculation:
     and the low will be the first HA low. With the first HA calculated,
     it is now possible to continue computing the HA candles per the formulas.
 ​​
+    With a 'timeframe', the candles are those of the 'timeframe' bar so far
+    of each bar, like vwap's anchor. The HA_OPEN only depends on the
+    completed 'timeframe' bars, so the candles do not look ahead.
+
 Args:
     open_ (pd.Series): Series of 'open's
     high (pd.Series): Series of 'high's
     low (pd.Series): Series of 'low's
     close (pd.Series): Series of 'close's
+    timeframe (str): A pandas period alias, like "W" or "4H", of the
+        higher timeframe. Requires a DatetimeIndex. Default: None
+    offset (int): How many periods to offset the result. Default: 0
 
 Kwargs:
     fillna (value, optional): pd.DataFrame.fillna(value)
@@ -1,17 +1,27 @@
 # -*- coding: utf-8 -*-
+from asyncio import FIRST_COMPLETED, get_running_loop
+from asyncio import TimeoutError as AsyncTimeoutError
+from asyncio import wait as asyncWait
+from asyncio import wait_for as asyncWaitFor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from multiprocessing import cpu_count, Pool
+from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from time import perf_counter
 from typing import List, Tuple
+from uuid import uuid4
 from warnings import simplefilter
 
 import pandas as pd
-from numpy import log10 as npLog10
 from numpy import ndarray as npNdarray
 from pandas.core.base import PandasObject
 
 from pandas_ta import Category, Imports, version
+from pandas_ta.bars import BAR_KINDS, BarBuilder
+from pandas_ta.engine import BACKENDS, RENAME_KWARGS, CostModel, Engine, SharedFrame, batch_worker, has_shared_memory, load_result, plan, schedule, select_backend
+from pandas_ta.stream import SOURCES, StreamingStrategy, advance, indicator_streams, resume, watermark
+from pandas_ta.sweep import SWEEP_KERNELS, sweep, sweep_params
 from pandas_ta.candles.cdl_pattern import ALL_PATTERNS
 from pandas_ta.candles import *
 from pandas_ta.cycles import *
@@ -27,6 +37,10 @@ from pandas_ta.utils import *
 
 df = pd.DataFrame()
 
+# Number of appended columns that a strategy packs together, releasing their
+# results, while it assembles the DataFrame
+ASSEMBLY_CHUNK = 32
+
 # Strategy DataClass
 @dataclass
 class Strategy:
@@ -110,6 +124,158 @@ CommonStrategy = Strategy(
 )
 
 
+def strategy_many(dfs: dict, *args, **kwargs) -> dict:
+    """Strategy Many
+
+    Runs a strategy, like df.ta.strategy(), over many DataFrames, for
+    instance the tickers of a watchlist, with one Multiprocessing Pool. The
+    (ticker x indicator) tasks are batched per ticker, balanced by the
+    indicators' costs and the tickers' lengths, and scheduled costliest
+    batch first so that the workers stay busy until the end. The results are appended
+    to each DataFrame in the same order as df.ta.strategy().
+
+    >>> results = ta.strategy_many({"SPY": spy, "QQQ": qqq}, ta.CommonStrategy, cores=4)
+
+    Args:
+        dfs (dict): DataFrames keyed by ticker.
+        *args: The strategy, as for df.ta.strategy(). Default: All
+
+    Kwargs:
+        cores (int): Number of worker processes. When 0, the strategies run
+            without multiprocessing. Default: cpu_count()
+        cost_model (CostModel): Estimates the indicators' costs to balance
+            the batches. Default: CostModel() from the COST_HINTS
+        engine (Engine): Use the warm workers of a persistent ta.Engine
+            instead of starting a new Pool. Default: None
+        exclude (list): List of indicator names to exclude.
+        shm (bool): Share the DataFrames and results with the workers
+            through shared memory. Default: False
+        timed (bool): Show the process time. Default: False
+        verbose (bool): Provide some additional insight on the progress.
+            Default: False
+
+    Returns:
+        dict: The DataFrames, with the indicators appended, keyed by ticker.
+    """
+    cores = kwargs.pop("cores", cpu_count())
+    engine = kwargs.pop("engine", None)
+    cost_model = kwargs.pop("cost_model", None) or CostModel()
+    use_shm = kwargs.pop("shm", False) and has_shared_memory()
+    timed = kwargs.pop("timed", False)
+    verbose = kwargs.pop("verbose", False)
+    user_excluded = kwargs.pop("exclude", [])
+    kwargs.pop("returns", None)
+    kwargs["append"] = True
+
+    if timed:
+        stime = perf_counter()
+
+    # Plan the tasks of each ticker; Custom Strategies are copied since
+    # strategy() removes indicators that are longer than the DataFrame
+    plans = {}
+    for ticker, df in dfs.items():
+        _args = args
+        if len(args) and isinstance(args[0], Strategy) and args[0].ta is not None:
+            _args = (Strategy(args[0].name, [dict(x) for x in args[0].ta], args[0].description), *args[1:])
+        strategy_tasks = df.ta._strategy_tasks(*_args, exclude=list(user_excluded), **kwargs)
+        if strategy_tasks is None: return None
+        name, _, _, _, tasks = strategy_tasks
+        plans[ticker] = (tasks, plan(tasks, df.columns)[0])
+
+    total_tasks = sum(len(w) for tasks, waves in plans.values() for w in waves)
+    if verbose:
+        print(f"[+] Strategy: {name}\n[i] {total_tasks} tasks for {len(dfs)} tickers.")
+
+    if engine is None and cores == 0:
+        for ticker, (tasks, waves) in plans.items():
+            dfs[ticker].ta._serial_run(tasks, waves)
+    else:
+        owned = engine is None
+        engine = Engine(cores) if owned else engine
+        completed = {ticker: {} for ticker in plans}
+        remaining = {ticker: sorted(i for wave in waves for i in wave) for ticker, (_, waves) in plans.items()}
+        try:
+            for w in range(max((len(waves) for _, waves in plans.values()), default=0)):
+                wave_costs = {
+                    ticker: [cost_model.cost(tasks[i][0], dfs[ticker].shape[0]) for i in waves[w]]
+                    for ticker, (tasks, waves) in plans.items() if w < len(waves)
+                }
+                # About four batches per core balance the workers' completion times
+                target = sum(sum(c) for c in wave_costs.values()) / (4 * engine.cores)
+
+                batches, shared, run = [], {}, uuid4().hex
+                for ticker, costs in wave_costs.items():
+                    tasks, waves = plans[ticker]
+                    if use_shm: shared[ticker] = SharedFrame(dfs[ticker], run=run)
+                    source = shared[ticker].descriptor if use_shm else dfs[ticker]
+                    for batch in schedule(costs, target):
+                        chunk = [waves[w][j] for j in batch]
+                        batches.append((sum(costs[j] for j in batch), (ticker, chunk), source, [tasks[i] for i in chunk]))
+
+                # Load Balance: costliest batches first
+                batches.sort(key=lambda x: x[0], reverse=True)
+                if verbose:
+                    print(f"[i] Wave {w + 1}: {len(batches)} batches with {engine.cores}/{cpu_count()} cpus.")
+
+                try:
+                    for (ticker, chunk), batch in engine.pool.imap_unordered(batch_worker, [b[1:] for b in batches]):
+                        index = dfs[ticker].index
+                        for i, (result, _) in zip(chunk, batch):
+                            completed[ticker][i] = load_result(result, index) if use_shm else result
+                finally:
+                    for frame in shared.values(): frame.close()
+
+                # Append in the order of the strategy
+                for ticker in wave_costs:
+                    dfs[ticker].ta._append_completed(plans[ticker][0], completed[ticker], remaining[ticker], **kwargs)
+        finally:
+            if owned: engine.shutdown()
+
+    last_run = get_time(to_string=True)
+    for df in dfs.values():
+        df.ta._last_run = last_run
+    if verbose:
+        print(f"[i] Last Run: {last_run}")
+    if timed:
+        print(f"[i] Runtime: {final_time(stime)}")
+    return dfs
+
+
+async def acompute(kind: str, df: pd.DataFrame, *args, **kwargs):
+    """Asynchronous Compute
+
+    Awaitable df.ta(kind, ...) that computes the indicator 'kind' in an
+    'executor' instead of blocking the event loop.
+
+    >>> rsi = await ta.acompute("rsi", df, length=14, timeout=5)
+
+    Args:
+        kind (str): The indicator.
+        df (pd.DataFrame): The DataFrame with the indicator's sources.
+        *args: The indicator's arguments.
+
+    Kwargs:
+        executor (concurrent.futures.Executor): The executor that computes
+            the indicator. Default: None, the event loop's default Thread
+            Pool Executor.
+        timeout (float): Seconds before raising asyncio.TimeoutError. The
+            indicator can not be interrupted once it runs. Default: None
+        kwargs: The indicator's keyword arguments, as for df.ta(kind).
+
+    Returns:
+        The result of the indicator.
+    """
+    loop = get_running_loop()
+    executor = kwargs.pop("executor", None)
+    timeout = kwargs.pop("timeout", None)
+    future = loop.run_in_executor(executor, _compute, kind, df, args, kwargs)
+    return await asyncWaitFor(future, timeout)
+
+
+def _compute(kind: str, df: pd.DataFrame, args: tuple, kwargs: dict):
+    return getattr(df.ta, kind.lower())(*args, **kwargs)
+
+
 # Base Class for extending a Pandas DataFrame
 class BasePandasObject(PandasObject):
     """Simple PandasObject Extension
@@ -250,6 +416,8 @@ class AnalysisIndicators(BasePandasObject):
     _exchange = "NYSE"
     _time_range = "years"
     _last_run = get_time(_exchange, to_string=True)
+    _pending = None
+    _packed = None
 
     def __init__(self, pandas_obj):
         self._validate(pandas_obj)
@@ -411,19 +579,111 @@ class AnalysisIndicators(BasePandasObject):
                     if "col_names" in kwargs and isinstance(kwargs["col_names"], tuple):
                         if len(kwargs["col_names"]) >= len(result.columns):
                             for col, ind_name in zip(result.columns, kwargs["col_names"]):
-                                df[ind_name] = result.loc[:, col]
+                                self._set_column(df, ind_name, result.loc[:, col])
                         else:
                             print(f"Not enough col_names were specified : got {len(kwargs['col_names'])}, expected {len(result.columns)}.")
                             return
                     else:
                         for i, column in enumerate(result.columns):
-                            df[column] = result.iloc[:, i]
+                            self._set_column(df, column, result.iloc[:, i])
                 else:
                     ind_name = (
                         kwargs["col_names"][0] if "col_names" in kwargs and
                         isinstance(kwargs["col_names"], tuple) else result.name
                     )
-                    df[ind_name] = result
+                    self._set_column(df, ind_name, result)
+
+    @contextmanager
+    def _assemble(self):
+        """Defers the columns appended within the context and attaches them
+        to the DataFrame at once on exit, instead of inserting them one at a
+        time which fragments the DataFrame. Columns that already exist are
+        replaced in place as before. The deferred results are packed into
+        blocks of ASSEMBLY_CHUNK columns as they arrive and released."""
+        if self._pending is not None:
+            yield; return  # Already assembling
+        self._pending, self._packed = {}, []
+        try:
+            yield
+        finally:
+            pending, packed = self._pending, self._packed
+            self._pending = self._packed = None
+            df = self._df
+            for name in [x for x in pending if x in df.columns]:
+                df[name] = pending.pop(name)
+            # Results of columns that were packed already replace them after
+            packed_names = set(x for block in packed for x in block.columns)
+            replaced = {x: pending.pop(x) for x in list(pending) if x in packed_names}
+            if len(pending):
+                packed.append(self._pack(pending))
+            if len(packed):
+                # Swap in the combined columns so 'df' remains the same object.
+                # pandas has no public concat in place and df[names] = block
+                # inserts a block per column, the fragmentation this avoids,
+                # so its private _update_inplace() is tried first.
+                combined = pd.concat([df, *packed], axis=1, copy=True)
+                try:
+                    df._update_inplace(combined)
+                except (AttributeError, TypeError):
+                    pass
+                if not df.columns.equals(combined.columns):
+                    del combined
+                    for block in packed:
+                        df[list(block.columns)] = block
+            for name, values in replaced.items():
+                df[name] = values
+
+    def _pack(self, columns: dict) -> pd.DataFrame:
+        """Copies the deferred 'columns' into a DataFrame aligned with the
+        DataFrame's index, one block per dtype."""
+        df = self._df
+        return pd.DataFrame({
+            name: x if x.index.equals(df.index) else x.reindex(df.index)
+            for name, x in columns.items()
+        }, index=df.index, copy=True)
+
+    def _serial_run(self, tasks: list, waves: list, progress: bool = False) -> int:
+        """Runs the planned (method, args, kwargs) tasks in order without
+        Multiprocessing and returns the number of shared sub-indicators. The
+        results are assembled in segments; a chained task starts a new one so
+        that the results before it are appended."""
+        chained = set(i for wave in waves[1:] for i in wave)
+        segments = [[]]
+        for i in sorted(i for wave in waves for i in wave):
+            if i in chained and len(segments[-1]): segments.append([])
+            segments[-1].append(i)
+
+        bar = None
+        if Imports["tqdm"] and progress:
+            from tqdm import tqdm
+            bar = tqdm(total=sum(len(x) for x in segments), desc=f"[i] Progress")
+
+        cache, hits = cache_scope(), 0
+        for k, segment in enumerate(segments):
+            with self._assemble():
+                with cache:
+                    for i in segment:
+                        method, params, kwds = tasks[i]
+                        getattr(self, method)(*params, **kwds)
+                        if bar is not None: bar.update()
+                if k == len(segments) - 1:
+                    # Release the sub-indicators before the results are assembled
+                    hits, cache = cache.hits, None
+        if bar is not None: bar.close()
+        return hits
+
+    def _set_column(self, df: pd.DataFrame, name, values: pd.Series) -> None:
+        """Sets or, while assembling, defers the column 'name' of 'df'."""
+        if self._pending is not None and df is self._df:
+            pending = self._pending
+            pending[name] = values
+            if len(pending) >= ASSEMBLY_CHUNK:
+                packed_names = set(x for block in self._packed for x in block.columns)
+                names = [x for x in pending if x not in df.columns and x not in packed_names]
+                if len(names) >= ASSEMBLY_CHUNK:
+                    self._packed.append(self._pack({x: pending.pop(x) for x in names}))
+        else:
+            df[name] = values
 
     def _check_na_columns(self, stdout: bool = True):
         """Returns the columns in which all it's values are na."""
@@ -455,18 +715,139 @@ class AnalysisIndicators(BasePandasObject):
                 NOT_FOUND = f"[X] Ooops!!! It's {series not in df.columns}, the series '{series}' was not found in {cols}"
                 return df.iloc[:, match[0]] if len(match) else print(NOT_FOUND)
 
+    def _incremental_run(self, tasks: list) -> tuple:
+        """Advances the tasks with Streams whose columns are in the DataFrame
+        from their index watermark, the last row with values, over the rows
+        after it and returns the (tasks left to run in full, tasks advanced,
+        rows written). The Streams continue from their cached terminal state
+        or, without one, are seeded with the rows before the watermark:
+        windowed ones with the rows they need, recursive ones with the last
+        values of their columns or over all the rows at once."""
+        df, index = self._df, self._df.index
+        remaining, advanced, written = [], set(), 0
+        for task in tasks:
+            method, params, kwds = task
+            ind = {"kind": params[0], **kwds} if method == "sweep" else {"kind": method, "params": params, **kwds}
+            nodes = indicator_streams(ind)
+            names = [name for node in nodes for name in node[2]] if nodes is not None else []
+            sources = set(x for node in nodes for x in node[1]) if nodes is not None else set()
+
+            # Chained indicators are advanced after their sources
+            if (
+                nodes is None
+                or not all(name in df.columns for name in names) or df.columns.has_duplicates
+                or not all(x in SOURCES and x in df.columns or x in advanced for x in sources)
+            ):
+                remaining.append(task); continue
+
+            outputs = {name: df[name].to_numpy(dtype=float) for name in names}
+            start = max(watermark(x) for x in outputs.values()) + 1
+            if start == 0:
+                remaining.append(task); continue
+
+            if start < df.shape[0]:
+                inputs = {x: df[x].to_numpy(dtype=float) for x in sources}
+                for node in nodes:
+                    stream = resume(node, start, index, [outputs[name][start - 1] for name in node[2]])
+                    values = advance(node, [inputs[x] for x in node[1]], start, stream, index, outputs)
+                    for i, name in enumerate(node[2]):
+                        column = [row[i] for row in values]
+                        df.iloc[start:, df.columns.get_loc(name)] = column
+                        # The int columns of the full run, like the direction
+                        # of supertrend, that appending the rows made float
+                        if all(isinstance(x, int) for x in column) and df[name].notna().all():
+                            df[name] = df[name].astype("int64")
+                written += df.shape[0] - start
+            advanced.update(names)
+        return remaining, len(tasks) - len(remaining), written
+
     def _indicators_by_category(self, name: str) -> list:
         """Returns indicators by Categorical name."""
         return Category[name] if name in self.categories else None
 
-    def _mp_worker(self, arguments: tuple):
-        """Multiprocessing Worker to handle different Methods."""
-        method, args, kwargs = arguments
-
-        if method != "ichimoku":
-            return getattr(self, method)(*args, **kwargs)
+    def _mp_run(self, tasks: list, chunksize: int = None, shm: bool = False, engine: Engine = None, cost_model: CostModel = None, threads: bool = False, verbose: bool = False) -> list:
+        """Runs the (method, args, kwargs) tasks with a Multiprocessing Pool,
+        the Pool of a persistent 'engine' or, with 'threads', a Thread Pool
+        that shares the DataFrame, and returns their (result, shared
+        sub-indicators) in a list. The tasks are dispatched costliest
+        first in batches of 'chunksize' tasks or, by default, in batches
+        balanced by the 'cost_model'."""
+        _total_ta = len(tasks)
+        cores = self.cores if engine is None else engine.cores
+        cost_model = cost_model if cost_model is not None else CostModel()
+        costs = [cost_model.cost(method, self._df.shape[0]) for method, _, _ in tasks]
+        if chunksize is not None and chunksize > 0:
+            order = sorted(range(_total_ta), key=lambda i: costs[i], reverse=True)
+            batches = [order[i:i + int(chunksize)] for i in range(0, _total_ta, int(chunksize))]
         else:
-            return getattr(self, method)(*args, **kwargs)[0]
+            # About four batches per core balance the workers' completion times
+            batches = schedule(costs, sum(costs) / (4 * max(cores, 1)))
+
+        if threads:
+            shm, engine = False, None
+        # Share before forking so the workers use the resource tracker of the parent
+        shared = SharedFrame(self._df) if shm else None
+        if engine is not None:
+            pool = engine.pool
+        else:
+            pool = ThreadPool(cores) if threads else Pool(cores)
+        try:
+            if verbose:
+                _engine_msg = "" if engine is None else " of a persistent Engine"
+                _workers = "threads" if threads else "cpus"
+                print(f"[i] Running {_total_ta} indicators in {len(batches)} batches with {cores}/{cpu_count()} {_workers}{_engine_msg}.")
+                if shared is not None:
+                    print(f"[i] Sharing {len(shared.descriptor['blocks'])} DataFrame block(s) in shared memory.")
+
+            source = self._df if shared is None else shared.descriptor
+            work = [(batch, source, [tasks[i] for i in batch]) for batch in batches]
+            if threads:
+                # The threads share the sub-indicators of the run
+                cache = IndicatorCache()
+                work = [(*x, cache) for x in work]
+            completed = pool.imap_unordered(batch_worker, work)
+            if Imports["tqdm"]:
+                from tqdm import tqdm
+                completed = tqdm(completed, total=len(work))
+
+            results = [None] * _total_ta
+            for batch, batch_results in completed:
+                for i, (result, hits) in zip(batch, batch_results):
+                    if shared is not None:
+                        result = load_result(result, self._df.index)
+                    results[i] = (result, hits)
+            if engine is None:
+                pool.close()
+                pool.join()
+        finally:
+            if engine is None: pool.terminate()
+            if shared is not None: shared.close()
+        return [(i, *results[i]) for i in range(_total_ta)]
+
+    def _append_completed(self, tasks: list, completed: dict, remaining: list, processed: bool = False, **kwargs) -> None:
+        """Appends the 'completed' results of the tasks, by task index, in the
+        order of the 'remaining' task indices up to the first task that has
+        not completed, like a serial run would have. With 'processed', the
+        results are already post processed and only renamed and appended."""
+        with self._assemble():
+            while len(remaining) and remaining[0] in completed:
+                i = remaining.pop(0)
+                method, _, kwds = tasks[i]
+                if processed:
+                    self._append(completed.pop(i), **{**kwargs, **{k: kwds[k] for k in RENAME_KWARGS if k in kwds}})
+                else:
+                    self._post_process_task(completed.pop(i), method, kwds, **kwargs)
+
+    def _post_process_task(self, result, method: str, task_kwargs: dict, **kwargs):
+        """Post processes the result of a task that ran in a worker like the
+        method would have, renaming and selecting its columns with the
+        task's RENAME_KWARGS, and appends it."""
+        kwargs = {**kwargs, **{k: task_kwargs[k] for k in RENAME_KWARGS if k in task_kwargs}}
+        if method == "ichimoku":
+            self._add_prefix_suffix(result, **kwargs)
+            self._append(result, **kwargs)
+            return result
+        return self._post_process(result, **kwargs)
 
     def _post_process(self, result, **kwargs) -> Tuple[pd.Series, pd.DataFrame]:
         """Applies any additional modifications to the DataFrame
@@ -515,7 +896,155 @@ class AnalysisIndicators(BasePandasObject):
 
         return name, mode
 
+    def _strategy_tasks(self, *args, **kwargs) -> tuple:
+        """Helper method to collect the indicators of a strategy and their
+        (method, args, kwargs) tasks. Returns tuple: (name:str, mode:dict,
+        excluded:list, ta:list, tasks:list) or None if not a strategy."""
+        excluded = [
+            "above",
+            "above_value",
+            "below",
+            "below_value",
+            "cross",
+            "cross_value",
+            # "data", # reserved
+            "long_run",
+            "short_run",
+            "tsignals",
+            "vp",
+            "xsignals",
+        ]
+
+        # Get the Strategy Name and mode
+        name, mode = self._strategy_mode(*args)
+
+        # If All or a Category, exclude user list if any
+        user_excluded = kwargs.pop("exclude", [])
+        if mode["all"] or mode["category"]:
+            excluded += user_excluded
+
+        # Collect the indicators, remove excluded or include kwarg["append"]
+        if mode["category"]:
+            ta = self._indicators_by_category(name.lower())
+            [ta.remove(x) for x in excluded if x in ta]
+        elif mode["custom"]:
+            ta = args[0].ta
+            for kwds in ta:
+                kwds["append"] = True
+        elif mode["all"]:
+            ta = self.indicators(as_list=True, exclude=excluded)
+        else:
+            print(f"[X] Not an available strategy.")
+            return None
+
+        # Remove Custom indicators with "length" keyword when larger than the DataFrame
+        # Possible to have other indicator main window lengths to be included
+        removal = []
+        for kwds in ta:
+            _ = False
+            if "length" in kwds and not sweep_params(kwds) and kwds["length"] > self._df.shape[0]: _ = True
+            if _: removal.append(kwds)
+        if len(removal) > 0: [ta.remove(x) for x in removal]
+
+        if mode["custom"]:
+            tasks = [(
+                ind["kind"],
+                ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else (),
+                {**ind, **kwargs},
+            ) if not sweep_params(ind) else (
+                # Indicators with an iterable parameter are swept
+                "sweep", (ind["kind"],), {k: v for k, v in {**ind, **kwargs}.items() if k != "kind"},
+            ) for ind in ta]
+        else:
+            tasks = [(ind, tuple(), kwargs) for ind in ta]
+        return name, mode, excluded, ta, tasks
+
     # Public DataFrame Methods
+    async def astrategy(self, *args, **kwargs):
+        """Asynchronous Strategy
+
+        Awaitable df.ta.strategy() that runs the indicators in an 'executor'
+        instead of blocking the event loop. The results are appended, like
+        strategy(), as the indicators finish. See astream() for the Kwargs.
+
+        >>> await df.ta.astrategy(ta.CommonStrategy, timeout=10)
+
+        Kwargs:
+            returns (bool): Return the DataFrame. Default: False
+        """
+        returns = kwargs.pop("returns", False)
+        async for _ in self.astream(*args, **kwargs):
+            pass
+        if returns: return self._df
+
+    async def astream(self, *args, **kwargs):
+        """Asynchronous Strategy Stream
+
+        An async iterator of the (kind, result) of each indicator of a
+        strategy, as each finishes, so consumers can start before the whole
+        strategy completes. The results are also appended to the DataFrame,
+        in the order of the strategy, like strategy(). They are appended once
+        all the indicators of their wave have finished, since those read the
+        DataFrame while they run, so chained indicators see them.
+
+        >>> async for kind, result in df.ta.astream("momentum"):
+        ...     print(kind, result.name)
+
+        Cancelling the consumer, or a 'timeout', cancels the indicators that
+        have not started. Those already running finish in the executor and
+        are discarded, as are the results of their wave.
+
+        Kwargs:
+            executor (concurrent.futures.Executor): The executor that runs the
+                indicators. Default: None, the event loop's default Thread
+                Pool Executor, which shares the DataFrame without copying.
+            exclude (list): List of indicator names to exclude.
+            timeout (float): Seconds for the whole strategy before raising
+                asyncio.TimeoutError. Default: None
+        """
+        loop = get_running_loop()
+        executor = kwargs.pop("executor", None)
+        timeout = kwargs.pop("timeout", None)
+        for key in ["backend", "chunksize", "cost_model", "engine", "ordered", "returns", "shm", "timed", "verbose"]:
+            kwargs.pop(key, None)
+        kwargs["append"] = True
+
+        user_excluded = kwargs.pop("exclude", [])
+        strategy_tasks = self._strategy_tasks(*args, exclude=user_excluded, **kwargs)
+        if strategy_tasks is None: return
+        tasks = strategy_tasks[4]
+        waves, _ = plan(tasks, self._df.columns)
+        deadline = None if timeout is None else loop.time() + timeout
+
+        # The indicators share the sub-indicators of the run, and those still
+        # running after a timeout or cancellation hold it until they finish
+        cache = IndicatorCache()
+        completed, remaining = {}, sorted(i for wave in waves for i in wave)
+        for wave in waves:
+            pending = set(
+                loop.run_in_executor(executor, batch_worker, (i, self._df, [tasks[i]], cache))
+                for i in wave
+            )
+            try:
+                while len(pending):
+                    wait_for = None if deadline is None else max(deadline - loop.time(), 0)
+                    done, pending = await asyncWait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+                    if not len(done):
+                        raise AsyncTimeoutError(f"ta.astream() did not finish within {timeout} seconds")
+                    for future in sorted(done, key=lambda f: f.result()[0]):
+                        i, ((result, _),) = future.result()
+                        method, _, kwds = tasks[i]
+                        if result is not None:
+                            result = self._post_process_task(result, method, kwds, **{**kwargs, "append": False})
+                        completed[i] = result
+                        yield method, result
+                # Append once none of the wave's indicators reads the DataFrame
+                self._append_completed(tasks, completed, remaining, processed=True, **kwargs)
+            finally:
+                for future in pending:
+                    future.cancel()
+        self._last_run = get_time(self.exchange, to_string=True)
+
     def constants(self, append: bool, values: list):
         """Constants
 
@@ -568,7 +1097,7 @@ class AnalysisIndicators(BasePandasObject):
         """
         as_list = kwargs.setdefault("as_list", False)
         # Public non-indicator methods
-        helper_methods = ["constants", "indicators", "strategy"]
+        helper_methods = ["astrategy", "astream", "constants", "indicators", "strategy", "sweep"]
         # Public df.ta.properties
         ta_properties = [
             "adjusted",
@@ -619,16 +1148,46 @@ class AnalysisIndicators(BasePandasObject):
 
 
         Kwargs:
-            chunksize (bool): Adjust the chunksize for the Multiprocessing Pool.
-                Default: Number of cores of the OS
+            backend (str): How to run the indicators: "processes" with a
+                Multiprocessing Pool, "threads" with a Thread Pool sharing the
+                DataFrame, or "serial". Default: None, selected by the data
+                size and the indicators; indicators looping in Python hold the
+                GIL and need processes while vectorised ones run in threads.
+                See select_backend().
+            chunksize (int): Number of indicators per Multiprocessing task.
+                Default: None, batches are sized by the cost model so that
+                the workers finish at about the same time.
+            cost_model (CostModel): Estimates the indicators' costs to
+                dispatch the costliest first and balance the batches, see
+                ta.CostModel. Default: CostModel() from the COST_HINTS
             exclude (list): List of indicator names to exclude. Some are
                 excluded by default for various reasons; they require additional
-                sources, performance (td_seq), not a ohlcv chart (vp) etc.
+                sources, not a ohlcv chart (vp) etc.
+            incremental (bool): For bars appended to a DataFrame that has the
+                strategy's columns, compute only the rows after each
+                indicator's last row with values, its index watermark, and
+                write just those rows. Indicators with a Stream (see
+                ta.stream.STREAMS) continue from the terminal state cached in
+                the process by the previous incremental run or, without one,
+                as in a new process, warm up on the rows their window needs
+                or, when recursive, on the last values of their columns and
+                the rows before at once. The others are recomputed in full.
+                Default: False
             name (str): Select all indicators or indicators by
                 Category such as: "candles", "cycles", "momentum", "overlap",
                 "performance", "statistics", "trend", "volatility", "volume", or
                 "all". Default: "all"
-            ordered (bool): Whether to run "all" in order. Default: True
+            engine (Engine): Run the Multiprocessing tasks with the warm
+                workers of a persistent ta.Engine, instead of starting a new
+                Pool. Its cores are used instead of df.ta.cores.
+                Default: None
+            ordered (bool): Deprecated. The results are always appended in
+                the order of the strategy.
+            shm (bool): Multiprocessing shares the numeric columns of the
+                DataFrame with the workers once through shared memory, instead
+                of pickling the DataFrame with every chunk, and the results
+                return through shared memory instead of being pickled.
+                Requires Python 3.8+. Default: False
             timed (bool): Show the process time of the strategy().
                 Default: False
             verbose (bool): Provide some additional insight on the progress of
@@ -639,158 +1198,86 @@ class AnalysisIndicators(BasePandasObject):
         # cpus = cpu_count()
         # Ensure indicators are appended to the DataFrame
         kwargs["append"] = True
-        all_ordered = kwargs.pop("ordered", True)
-        mp_chunksize = kwargs.pop("chunksize", self.cores)
+        kwargs.pop("ordered", None)
+        mp_chunksize = kwargs.pop("chunksize", None)
+        cost_model = kwargs.pop("cost_model", None)
+        backend = kwargs.pop("backend", None)
+        if backend is not None and backend not in BACKENDS:
+            print(f"[X] backend must be one of: {', '.join(BACKENDS)}")
+            return None
+        use_shm = kwargs.pop("shm", False) and has_shared_memory()
+        engine = kwargs.pop("engine", None)
+        incremental = kwargs.pop("incremental", False)
+
+        verbose = kwargs.pop("verbose", False)
+        timed = kwargs.pop("timed", False)
 
         # Initialize
         initial_column_count = len(self._df.columns)
-        excluded = [
-            "above",
-            "above_value",
-            "below",
-            "below_value",
-            "cross",
-            "cross_value",
-            # "data", # reserved
-            "long_run",
-            "short_run",
-            "td_seq", # Performance exclusion
-            "tsignals",
-            "vp",
-            "xsignals",
-        ]
-
-        # Get the Strategy Name and mode
-        name, mode = self._strategy_mode(*args)
-
-        # If All or a Category, exclude user list if any
         user_excluded = kwargs.pop("exclude", [])
-        if mode["all"] or mode["category"]:
-            excluded += user_excluded
-
-        # Collect the indicators, remove excluded or include kwarg["append"]
-        if mode["category"]:
-            ta = self._indicators_by_category(name.lower())
-            [ta.remove(x) for x in excluded if x in ta]
-        elif mode["custom"]:
-            ta = args[0].ta
-            for kwds in ta:
-                kwds["append"] = True
-        elif mode["all"]:
-            ta = self.indicators(as_list=True, exclude=excluded)
-        else:
-            print(f"[X] Not an available strategy.")
-            return None
-
-        # Remove Custom indicators with "length" keyword when larger than the DataFrame
-        # Possible to have other indicator main window lengths to be included
-        removal = []
-        for kwds in ta:
-            _ = False
-            if "length" in kwds and kwds["length"] > self._df.shape[0]: _ = True
-            if _: removal.append(kwds)
-        if len(removal) > 0: [ta.remove(x) for x in removal]
+        strategy_tasks = self._strategy_tasks(*args, exclude=user_excluded, **kwargs)
+        if strategy_tasks is None: return None
+        name, mode, excluded, ta, tasks = strategy_tasks
 
-        verbose = kwargs.pop("verbose", False)
         if verbose:
             print(f"[+] Strategy: {name}\n[i] Indicator arguments: {kwargs}")
             if mode["all"] or mode["category"]:
                 excluded_str = ", ".join(excluded)
                 print(f"[i] Excluded[{len(excluded)}]: {excluded_str}")
 
-        timed = kwargs.pop("timed", False)
-        results = []
-        use_multiprocessing = True if self.cores > 0 else False
-        has_col_names = False
-
         if timed:
             stime = perf_counter()
 
-        if use_multiprocessing and mode["custom"]:
-            # Determine if the Custom Model has 'col_names' parameter
-            has_col_names = (True if len([
-                True for x in ta
-                if "col_names" in x and isinstance(x["col_names"], tuple)
-            ]) else False)
-
-            if has_col_names:
-                use_multiprocessing = False
+        if incremental:
+            tasks, advanced, written = self._incremental_run(tasks)
+            if verbose:
+                print(f"[i] Incremental: {advanced} indicators advanced, {written} rows written.")
 
-        if Imports["tqdm"]:
-            # from tqdm import tqdm
-            from tqdm import tqdm
+        # Remove duplicate tasks and order chained tasks into waves
+        waves, duplicates = plan(tasks, self._df.columns)
+        shared_nodes = 0
+        if verbose:
+            print(f"[i] Planned {len(tasks) - duplicates} nodes in {len(waves)} wave(s), {duplicates} duplicate(s) removed.")
+
+        # Select the backend
+        if backend is not None:
+            reason = "requested"
+        elif engine is not None or use_shm:
+            backend, reason = "processes", "engine" if engine is not None else "shared memory"
+        elif self.cores == 0:
+            backend, reason = "serial", "cores = 0"
+        else:
+            methods = [tasks[i][0] for wave in waves for i in wave]
+            backend, reason = select_backend(methods, self._df.shape[0], self.cores, cost_model)
 
-        if use_multiprocessing:
-            _total_ta = len(ta)
-            with Pool(self.cores) as pool:
-                # Some magic to optimize chunksize for speed based on total ta indicators
-                _chunksize = mp_chunksize - 1 if mp_chunksize > _total_ta else int(npLog10(_total_ta)) + 1
-                if verbose:
-                    print(f"[i] Multiprocessing {_total_ta} indicators with {_chunksize} chunks and {self.cores}/{cpu_count()} cpus.")
-
-                results = None
-                if mode["custom"]:
-                    # Create a list of all the custom indicators into a list
-                    custom_ta = [(
-                        ind["kind"],
-                        ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else (),
-                        {**ind, **kwargs},
-                    ) for ind in ta]
-                    # Custom multiprocessing pool. Must be ordered for Chained Strategies
-                    # May fix this to cpus if Chaining/Composition if it remains
-                    results = pool.imap(self._mp_worker, custom_ta, _chunksize)
-                else:
-                    default_ta = [(ind, tuple(), kwargs) for ind in ta]
-                    # All and Categorical multiprocessing pool.
-                    if all_ordered:
-                        if Imports["tqdm"]:
-                            results = tqdm(pool.imap(self._mp_worker, default_ta, _chunksize)) # Order over Speed
-                        else:
-                            results = pool.imap(self._mp_worker, default_ta, _chunksize) # Order over Speed
-                    else:
-                        if Imports["tqdm"]:
-                            results = tqdm(pool.imap_unordered(self._mp_worker, default_ta, _chunksize)) # Speed over Order
-                        else:
-                            results = pool.imap_unordered(self._mp_worker, default_ta, _chunksize) # Speed over Order
+        if verbose:
+            print(f"[i] Backend: {backend} ({reason}).")
+
+        if backend != "serial":
+            completed, remaining = {}, sorted(i for wave in waves for i in wave)
+            for wave in waves:
+                results = self._mp_run(
+                    [tasks[i] for i in wave], mp_chunksize,
+                    shm=use_shm, engine=engine, cost_model=cost_model,
+                    threads=backend == "threads", verbose=verbose
+                )
                 if results is None:
                     print(f"[X] ta.strategy('{name}') has no results.")
                     return
 
-                pool.close()
-                pool.join()
-                self._last_run = get_time(self.exchange, to_string=True)
+                for i, result, hits in results:
+                    completed[wave[i]] = result
+                    shared_nodes += hits
+                # Apply prefixes/suffixes and appends indicator results to the  DataFrame
+                self._append_completed(tasks, completed, remaining, **kwargs)
+            self._last_run = get_time(self.exchange, to_string=True)
 
         else:
-            # Without multiprocessing:
-            if verbose:
-                _col_msg = f"[i] No mulitproccessing (cores = 0)."
-                if has_col_names:
-                    _col_msg = f"[i] No mulitproccessing support for 'col_names' option."
-                print(_col_msg)
-
-            if mode["custom"]:
-                if Imports["tqdm"] and verbose:
-                    pbar = tqdm(ta, f"[i] Progress")
-                    for ind in pbar:
-                        params = ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else tuple()
-                        getattr(self, ind["kind"])(*params, **{**ind, **kwargs})
-                else:
-                    for ind in ta:
-                        params = ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else tuple()
-                        getattr(self, ind["kind"])(*params, **{**ind, **kwargs})
-            else:
-                if Imports["tqdm"] and verbose:
-                    pbar = tqdm(ta, f"[i] Progress")
-                    for ind in pbar:
-                        getattr(self, ind)(*tuple(), **kwargs)
-                else:
-                    for ind in ta:
-                        getattr(self, ind)(*tuple(), **kwargs)
-                self._last_run = get_time(self.exchange, to_string=True)
-
-        # Apply prefixes/suffixes and appends indicator results to the  DataFrame
-        [self._post_process(r, **kwargs) for r in results]
+            shared_nodes = self._serial_run(tasks, waves, progress=verbose)
+            self._last_run = get_time(self.exchange, to_string=True)
 
+        if verbose:
+            print(f"[i] Shared sub-indicator nodes: {shared_nodes}")
         if verbose:
             print(f"[i] Total indicators: {len(ta)}")
             print(f"[i] Columns added: {len(self._df.columns) - initial_column_count}")
@@ -800,6 +1287,41 @@ class AnalysisIndicators(BasePandasObject):
 
         if returns: return self._df
 
+    def sweep(self, kind: str, **kwargs):
+        """Parameter Sweep
+
+        Computes the indicator 'kind' over the values of the parameter given
+        an iterable and returns, or appends, a column per value. See
+        help(ta.sweep).
+
+        >>> df.ta.sweep("sma", length=range(5, 400), append=True)
+
+        In a Custom Strategy, an indicator with an iterable parameter is
+        swept:
+
+        >>> ta.Strategy("Sweep", [{"kind": "ema", "length": range(5, 50)}])
+
+        Args:
+            kind (str): The indicator name.
+
+        Kwargs:
+            close (str): The source column of the indicators in
+                SWEEP_KERNELS. Default: "close"
+            append (bool): Append the columns. Default: False
+
+        Returns:
+            pd.DataFrame: A column per value.
+        """
+        params = {k: v for k, v in kwargs.items() if k not in RENAME_KWARGS + ("append", "params", "verbose")}
+        result = None
+        if kind in SWEEP_KERNELS:
+            close = self._get_column(params.pop("close", "close"))
+            result = sweep(kind, close, **params)
+        elif kind in self.indicators(as_list=True):
+            result = sweep(getattr(self, kind), **params, append=False)
+
+        with self._assemble():
+            return self._post_process(result, **kwargs)
 
     def ticker(self, ticker: str, **kwargs):
         """ticker
@@ -1358,9 +1880,9 @@ class AnalysisIndicators(BasePandasObject):
         result = kurtosis(close=close, length=length, offset=offset, **kwargs)
         return self._post_process(result, **kwargs)
 
-    def mad(self, length=None, offset=None, **kwargs):
+    def mad(self, length=None, median=None, offset=None, **kwargs):
         close = self._get_column(kwargs.pop("close", "close"))
-        result = mad(close=close, length=length, offset=offset, **kwargs)
+        result = mad(close=close, length=length, median=median, offset=offset, **kwargs)
         return self._post_process(result, **kwargs)
 
     def median(self, length=None, offset=None, **kwargs):
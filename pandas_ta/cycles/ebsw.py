@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
+from numpy import concatenate as npConcatenate
 from numpy import cos as npCos
+from numpy import errstate as npErrstate
 from numpy import exp as npExp
+from numpy import full as npFull
 from numpy import nan as npNaN
 from numpy import pi as npPi
 from numpy import sin as npSin
 from numpy import sqrt as npSqrt
 from pandas import Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, iir, verify_series
 
 
 def ebsw(close, length=None, bars=None, offset=None, **kwargs):
@@ -19,45 +22,33 @@ def ebsw(close, length=None, bars=None, offset=None, **kwargs):
 
     if close is None: return
 
-    # variables
-    alpha1 = HP = 0 # alpha and HighPass
-    a1 = b1 = c1 = c2 = c3 = 0
-    Filt = Pwr = Wave = 0
-
-    lastClose = lastHP = 0
-    FilterHist = [0, 0]   # Filter history
-
     # Calculate Result
-    m = close.size
-    result = [npNaN for _ in range(0, length - 1)] + [0]
-    for i in range(length, m):
-        # HighPass filter cyclic components whose periods are shorter than Duration input
-        alpha1 = (1 - npSin(360 / length)) / npCos(360 / length)
-        HP = 0.5 * (1 + alpha1) * (close[i] - lastClose) + alpha1 * lastHP
-
-        # Smooth with a Super Smoother Filter from equation 3-3
-        a1 = npExp(-npSqrt(2) * npPi / bars)
-        b1 = 2 * a1 * npCos(npSqrt(2) * 180 / bars)
-        c2 = b1
-        c3 = -1 * a1 * a1
-        c1 = 1 - c2 - c3
-        Filt = c1 * (HP + lastHP) / 2 + c2 * FilterHist[1] + c3 * FilterHist[0]
-        # Filt = float("{:.8f}".format(float(Filt))) # to fix for small scientific notations, the big ones fail
-
-        # 3 Bar average of Wave amplitude and power
-        Wave = (Filt + FilterHist[1] + FilterHist[0]) / 3
-        Pwr = (Filt * Filt + FilterHist[1] * FilterHist[1] + FilterHist[0] * FilterHist[0]) / 3
-
-        # Normalize the Average Wave to Square Root of the Average Power
-        Wave = Wave / npSqrt(Pwr)
-
-        # update storage, result
-        FilterHist.append(Filt)  # append new Filt value
-        FilterHist.pop(0)  # remove first element of list (left) -> updating/trim
-        lastHP = HP
-        lastClose = close[i]
-        result.append(Wave)
-
+    # HighPass filter cyclic components whose periods are shorter than Duration input
+    alpha1 = (1 - npSin(360 / length)) / npCos(360 / length)
+
+    # Smooth with a Super Smoother Filter from equation 3-3
+    a1 = npExp(-npSqrt(2) * npPi / bars)
+    b1 = 2 * a1 * npCos(npSqrt(2) * 180 / bars)
+    c2 = b1
+    c3 = -1 * a1 * a1
+    c1 = 1 - c2 - c3
+
+    # Both start at rest, from a last close of zero, on bar 'length'
+    x = close.to_numpy(dtype=float)[length:]
+    hp, _ = iir(x, [0.5 * (1 + alpha1), -0.5 * (1 + alpha1)], [1, -alpha1])
+    filt, _ = iir(hp, [0.5 * c1, 0.5 * c1], [1, -c2, -c3])
+
+    # 3 Bar average of Wave amplitude and power
+    filt1 = npConcatenate(([0.0], filt[:-1]))
+    filt0 = npConcatenate(([0.0, 0.0], filt[:-2]))[:filt.size]
+    wave = (filt + filt1 + filt0) / 3
+    pwr = (filt * filt + filt1 * filt1 + filt0 * filt0) / 3
+
+    # Normalize the Average Wave to Square Root of the Average Power
+    result = npFull(close.size, npNaN)
+    result[length - 1] = 0
+    with npErrstate(divide="ignore", invalid="ignore"):
+        result[length:] = wave / npSqrt(pwr)
     ebsw = Series(result, index=close.index)
 
     # Offset
@@ -0,0 +1,543 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+from gc import collect as gcCollect
+from json import dump as jsonDump
+from json import load as jsonLoad
+from multiprocessing import cpu_count, Pool
+from time import perf_counter
+from uuid import uuid4
+
+from numpy import dtype as npDtype
+from numpy import ndarray as npNdarray
+from pandas import DataFrame, DatetimeIndex, Index, RangeIndex, Series, concat
+from pandas_ta.utils import IndicatorCache, call_key, kernel_backend, release_worker_cache, thread_hits, worker_cache
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:  # Python < 3.8
+    resource_tracker = shared_memory = None
+
+
+# Keyword arguments of the DataFrame extension that select source columns
+SOURCE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# Relative cost per row of the indicators that are slower than a typical
+# vectorised indicator, which costs 1. Mostly those that loop in Python.
+COST_HINTS = {
+    "qqe": 70, "stc": 70, "cdl_pattern": 40, "jma": 25, "psar": 20,
+    "supertrend": 20, "rvgi": 15, "vidya": 15, "aberration": 10,
+    "fisher": 10, "adx": 8, "kama": 8, "rsx": 7, "brar": 6, "hwc": 6,
+    "mcgd": 6, "aobv": 5, "ebsw": 5, "hilo": 5, "inertia": 5, "kvo": 5,
+    "squeeze_pro": 5, "amat": 4, "hwma": 4, "squeeze": 4, "ichimoku": 3,
+    "ssf": 3, "stoch": 3, "vwap": 3,
+}
+
+# Indicators whose loop is a Kernel, which releases the GIL when compiled
+# by the numba kernel backend
+KERNEL_INDICATORS = (
+    "ebsw", "fisher", "hilo", "hwma", "jma", "kama", "mcgd", "psar", "qqe",
+    "rsx", "ssf", "supertrend", "vidya",
+)
+
+# Indicators with a hint of at least GIL_BOUND loop in Python and hold the
+# GIL; the others mostly run in pandas, NumPy or TA-Lib kernels.
+GIL_BOUND = 10
+
+BACKENDS = ("processes", "serial", "threads")
+
+# Keyword arguments that rename or select the result columns. Workers return
+# the results as is and the parent applies these when it appends them.
+RENAME_KWARGS = ("col_names", "col_numbers", "delimiter", "prefix", "suffix")
+
+# The shared frames a worker keeps attached between the tasks of a run
+_attached = OrderedDict()
+_attached_run = None
+
+
+class Engine(object):
+    """Persistent Multiprocessing Engine
+
+    Keeps a Multiprocessing Pool of warm workers, with pandas_ta imported and
+    the DataFrame extension's indicators resolved, for reuse by subsequent
+    strategy() calls instead of starting and stopping a Pool with every call.
+    Use it as a context manager or shutdown() when finished.
+
+    >>> with ta.Engine(cores=4) as engine:
+    ...     for df in dfs:
+    ...         df.ta.strategy(engine=engine)
+
+    Args:
+        cores (int): Number of worker processes. Default: cpu_count()
+        maxtasksperchild (int): Tasks a worker completes before it is
+            replaced by a fresh worker. Default: None (never)
+    """
+
+    def __init__(self, cores: int = None, maxtasksperchild: int = None):
+        cpus = cpu_count()
+        self.cores = int(cores) if cores is not None and 0 < cores <= cpus else cpus
+        # Workers must share the parent's resource tracker, otherwise theirs
+        # unlinks the shared memory results when a worker exits.
+        if resource_tracker is not None:
+            resource_tracker.ensure_running()
+        self._pool = Pool(self.cores, initializer=_warm, maxtasksperchild=maxtasksperchild)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+
+    def __repr__(self):
+        state = "running" if self.running else "shutdown"
+        return f"Engine(cores={self.cores}, {state})"
+
+    @property
+    def pool(self) -> Pool:
+        """The Multiprocessing Pool of the Engine."""
+        if self._pool is None:
+            raise RuntimeError("Engine has been shutdown")
+        return self._pool
+
+    @property
+    def running(self) -> bool:
+        """True until the Engine is shutdown."""
+        return self._pool is not None
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops the workers. With 'wait', pending tasks are finished first,
+        otherwise the workers are terminated immediately."""
+        if self._pool is None: return
+        pool, self._pool = self._pool, None
+        if wait:
+            pool.close()
+        else:
+            pool.terminate()
+        pool.join()
+
+
+class CostModel(object):
+    """Indicator Cost Model
+
+    Estimates the cost of the indicators to schedule a strategy's tasks. The
+    costs are derived from the COST_HINTS or, once calibrated, measured in
+    seconds per row. Indicators that are not calibrated are scaled from
+    their hints by the median measured to hint ratio. Calibrations can be
+    saved to and loaded from a JSON file.
+
+    >>> model = ta.CostModel().calibrate(df)
+    >>> model.save("costs.json")
+    >>> df.ta.strategy(cost_model=ta.CostModel.load("costs.json"))
+
+    Args:
+        costs (dict): Measured costs, in seconds per row, by indicator.
+            Default: None
+    """
+
+    def __init__(self, costs: dict = None):
+        self.costs = dict(costs) if costs is not None else {}
+        self._ratio = None
+
+    def __repr__(self):
+        return f"CostModel(calibrated={len(self.costs)})"
+
+    def cost(self, method: str, nrows: int = 1) -> float:
+        """Returns the estimated cost of 'method' for 'nrows' rows."""
+        nrows = max(int(nrows), 1)
+        if method in self.costs:
+            return self.costs[method] * nrows
+        return COST_HINTS.get(method, 1) * self._scale() * nrows
+
+    def calibrate(self, df: DataFrame, *args, repeat: int = 1, **kwargs):
+        """Measures the costs of the indicators of a strategy, All by
+        default, on the DataFrame 'df'. Returns the CostModel."""
+        _, _, _, _, tasks = df.ta._strategy_tasks(*args, **kwargs)
+        nrows = max(df.shape[0], 1)
+        for method, params, kwds in tasks:
+            kwds = {**kwds, "append": False}
+            seconds = float("inf")
+            for _ in range(max(int(repeat), 1)):
+                stime = perf_counter()
+                try:
+                    getattr(df.ta, method)(*params, **kwds)
+                except Exception:
+                    break
+                seconds = min(seconds, perf_counter() - stime)
+            if seconds < float("inf"):
+                self.costs[method] = seconds / nrows
+        self._ratio = None
+        return self
+
+    def save(self, path: str) -> None:
+        """Saves the calibrated costs as JSON."""
+        with open(path, "w") as f:
+            jsonDump({"costs": self.costs}, f, indent=2, sort_keys=True)
+
+    @classmethod
+    def load(cls, path: str):
+        """Loads a CostModel saved with save()."""
+        with open(path) as f:
+            return cls(jsonLoad(f)["costs"])
+
+    def _scale(self) -> float:
+        if self._ratio is None:
+            ratios = sorted(c / COST_HINTS.get(m, 1) for m, c in self.costs.items())
+            self._ratio = ratios[len(ratios) // 2] if len(ratios) else 1
+        return self._ratio
+
+
+def schedule(costs: list, target: float) -> list:
+    """Packs tasks, by their 'costs', into batches of about the 'target'
+    cost. Returns the lists of task indices, costliest batch first, so that
+    the longest tasks are dispatched first and the short ones fill in."""
+    batches, batch, total = [], [], 0
+    for i in sorted(range(len(costs)), key=lambda i: costs[i], reverse=True):
+        if len(batch) and total + costs[i] > target:
+            batches.append((total, batch))
+            batch, total = [], 0
+        batch.append(i)
+        total += costs[i]
+    if len(batch): batches.append((total, batch))
+    return [batch for _, batch in sorted(batches, key=lambda x: x[0], reverse=True)]
+
+
+def select_backend(methods: list, nrows: int, cores: int, cost_model: CostModel = None) -> tuple:
+    """Selects the execution backend of a strategy's 'methods'.
+
+    * serial: fewer than two cores or tasks, or too little data to share.
+    * processes: GIL bound indicators, that loop in Python, are the bulk of
+      the estimated cost so only processes run them in parallel.
+    * threads: otherwise. The kernels release the GIL and threads share the
+      DataFrame without copying it or starting processes.
+
+    Returns:
+        tuple: (backend, reason)
+    """
+    if cores < 2 or len(methods) < 2:
+        return "serial", f"{cores} core(s) and {len(methods)} task(s)"
+    if nrows < 100:
+        return "serial", f"only {nrows} rows"
+
+    cost_model = cost_model if cost_model is not None else CostModel()
+    costs = [cost_model.cost(m, nrows) for m in methods]
+    nogil = KERNEL_INDICATORS if kernel_backend() == "numba" else ()
+    gil_bound = sum(c for m, c in zip(methods, costs) if COST_HINTS.get(m, 1) >= GIL_BOUND and m not in nogil)
+    share = gil_bound / sum(costs) if sum(costs) > 0 else 0
+    if share > 0.5:
+        return "processes", f"{100 * share:.0f}% of the cost holds the GIL"
+    return "threads", f"{100 * share:.0f}% of the cost holds the GIL"
+
+
+def has_shared_memory() -> bool:
+    """Returns True if multiprocessing.shared_memory is available."""
+    return shared_memory is not None
+
+
+class SharedFrame(object):
+    """Shared Memory DataFrame
+
+    Copies the numeric columns of a DataFrame, one block per dtype, and its
+    index into shared memory. Only the small 'descriptor' is pickled to the
+    workers which attach zero-copy NumPy views of the blocks with
+    attach_frame(descriptor). The creator owns the blocks and must close()
+    them; as a context manager, it closes them on exit. Workers keep the
+    frames of a 'run' attached until a frame of another run arrives.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to share.
+        index (bool): Share the index as well. Default: True
+        run (str): Identifies the run, the frames shared for the same
+            tasks. Default: None, a run of its own
+    """
+
+    def __init__(self, df: DataFrame, index: bool = True, run: str = None):
+        self._shms = []
+        blocks = []
+        for dtype, columns in _dtype_groups(df):
+            shm, values = self._create((len(columns), df.shape[0]), dtype)
+            values[:] = df[columns].to_numpy(dtype=dtype).T
+            blocks.append((shm.name, dtype.str, tuple(columns)))
+
+        self.descriptor = {
+            "blocks": blocks,
+            "index": self._share_index(df.index) if index else None,
+            "nrows": df.shape[0],
+            "run": run if run is not None else uuid4().hex,
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _create(self, shape: tuple, dtype: npDtype) -> tuple:
+        nbytes = max(int(shape[0] * shape[1] * dtype.itemsize), 1)
+        shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        self._shms.append(shm)
+        return shm, npNdarray(shape, dtype=dtype, buffer=shm.buf)
+
+    def _share_index(self, index: Index) -> tuple:
+        if isinstance(index, RangeIndex):
+            return ("range", (index.start, index.stop, index.step), index.name)
+        if isinstance(index, DatetimeIndex):
+            shm, values = self._create((1, index.size), npDtype("int64"))
+            values[0] = index.asi8
+            tz = str(index.tz) if index.tz is not None else None
+            return ("datetime", (shm.name, tz), index.name)
+        if index.dtype.kind in "iuf":
+            shm, values = self._create((1, index.size), index.dtype)
+            values[0] = index.to_numpy()
+            return ("numeric", (shm.name, index.dtype.str), index.name)
+        return ("object", index, index.name)
+
+    def close(self) -> None:
+        """Closes and releases the shared memory blocks."""
+        _close(self._shms, unlink=True)
+        self._shms = []
+
+
+def attach_frame(descriptor: dict) -> DataFrame:
+    """Attaches a DataFrame from a SharedFrame descriptor without copying
+    the column data. The views are read only and the DataFrame is kept
+    attached for subsequent tasks of the same run. The frames of previous
+    runs, which their creator has released, are detached."""
+    global _attached_run
+    if descriptor.get("run") != _attached_run:
+        detach_frames()
+        _attached_run = descriptor.get("run")
+
+    key = tuple(b[0] for b in descriptor["blocks"])
+    if key not in _attached:
+        df, shms = _attach_frame(descriptor)
+        _attached[key] = (shms, df)
+    return _attached[key][1]
+
+
+def detach_frames() -> None:
+    """Closes the shared frames attached by attach_frame() and releases
+    the worker cache of their indicators."""
+    if not len(_attached): return
+    shms = []
+    while len(_attached):
+        _, (frame_shms, df) = _attached.popitem()
+        release_worker_cache(df)
+        # The DataFrame and its cached accessor reference each other
+        df.__dict__.pop("ta", None)
+        shms.extend(frame_shms)
+    del df
+    if len(_close(shms)):
+        # Referenced by other cycles, close them once they are collected
+        gcCollect()
+        _close(shms)
+
+
+def share_result(result, index: Index):
+    """Moves an indicator result into shared memory and returns a picklable
+    descriptor for load_result(). Results that can not be shared, e.g.
+    non-numeric columns, are returned as is and pickled instead."""
+    if not isinstance(result, (Series, DataFrame)):
+        return result
+
+    is_series = isinstance(result, Series)
+    frame = result.to_frame(name=0) if is_series else result
+    shareable = sum(len(c) for _, c in _dtype_groups(frame))
+    if not frame.columns.is_unique or shareable != frame.shape[1]:
+        return result
+
+    same_index = result.index is index or result.index.equals(index)
+    shared = SharedFrame(frame, index=not same_index)
+    # The parent unlinks the blocks in load_result(); only close ours.
+    _close(shared._shms)
+
+    return {
+        "_shared_result": shared.descriptor,
+        "series": is_series,
+        "name": result.name if is_series else getattr(result, "name", None),
+        "category": getattr(result, "category", None),
+        "columns": list(frame.columns),
+    }
+
+
+def load_result(shared, index: Index):
+    """Copies a shared result back into a Series or DataFrame and releases
+    its shared memory blocks. Returns non-shared results unchanged."""
+    if not isinstance(shared, dict) or "_shared_result" not in shared:
+        return shared
+
+    descriptor = shared["_shared_result"]
+    df, shms = _attach_frame(descriptor)
+    df = df[shared["columns"]].copy()
+    # Nothing may reference the blocks once they are released
+    df.index = index if descriptor["index"] is None else df.index.copy(deep=True)
+
+    _close(shms, unlink=True)
+
+    if shared["series"]:
+        result = df.iloc[:, 0]
+        result.name = shared["name"]
+    else:
+        result = df
+        if shared["name"] is not None:
+            result.name = shared["name"]
+    if shared["category"] is not None:
+        result.category = shared["category"]
+    return result
+
+
+def plan(tasks: list, columns: Index) -> tuple:
+    """Strategy Planner
+
+    Builds the execution plan of a Strategy's (method, args, kwargs) tasks as
+    a DAG. Identical tasks are nodes that run once. A task that reads a
+    source column that is not in 'columns', like a chained indicator of a
+    Custom Strategy, depends on the tasks before it. It runs in a later wave,
+    after the results of the previous waves are appended. Sub-indicators
+    shared by the tasks, for instance the 'atr' of 'natr' and 'supertrend',
+    are shared at run time with an IndicatorCache.
+
+    Args:
+        tasks (list): List of (method, args, kwargs) tuples.
+        columns (pd.Index): The columns of the DataFrame.
+
+    Returns:
+        tuple: (waves, duplicates) where waves is a list of lists of task
+            indices and duplicates is the number of tasks removed.
+    """
+    waves, seen, duplicates = [], set(), 0
+    for i, (method, args, kwargs) in enumerate(tasks):
+        refs = []
+        key = call_key(method, {"args": args, **kwargs}, refs, ignore=())
+        if key is not None and len(refs) == 0:
+            if key in seen:
+                duplicates += 1
+                continue
+            seen.add(key)
+
+        depends = any(
+            isinstance(kwargs.get(c), str) and not _has_column(columns, kwargs[c])
+            for c in SOURCE_COLUMNS
+        )
+        wave = len(waves) if depends else 0
+        if wave == len(waves):
+            waves.append([])
+        waves[wave].append(i)
+    return waves, duplicates
+
+
+def batch_worker(arguments: tuple):
+    """Multiprocessing Worker for a batch of tasks of one DataFrame. The
+    source is the DataFrame or a SharedFrame
+    descriptor. Returns the key with the (result, shared sub-indicators) of
+    each task; shared sources return their results in shared memory. An
+    optional fourth argument is the IndicatorCache of a run in threads,
+    which they share instead of the process wide worker_cache(), so that it
+    goes with the run even when some of them outlive it."""
+    key, source, tasks, cache = arguments if len(arguments) > 3 else (*arguments, None)
+    shm = isinstance(source, dict)
+    df = attach_frame(source) if shm else source
+    results = []
+    for method, args, kwargs in tasks:
+        result, hits = _run_task(df, method, args, kwargs, cache)
+        results.append((share_result(result, df.index) if shm else result, hits))
+    return key, results
+
+
+# Private
+def _warm() -> None:
+    """Pool initializer: imports pandas_ta and resolves the indicators."""
+    import pandas_ta
+    for method in DataFrame().ta.indicators(as_list=True):
+        getattr(pandas_ta, method, None)
+
+
+def _run_task(df: DataFrame, method: str, args: tuple, kwargs: dict, cache: IndicatorCache = None) -> tuple:
+    hits = thread_hits()
+    with cache if cache is not None else worker_cache(df):
+        # The parent renames and appends the results; keep the worker's
+        # DataFrame as is.
+        kwargs = {k: v for k, v in kwargs.items() if k not in RENAME_KWARGS}
+        result = getattr(df.ta, method)(*args, **{**kwargs, "append": False})
+    if method == "ichimoku":
+        result = result[0]
+    if result is df:
+        result = None  # _post_process() returns the DataFrame without a result
+    return result, thread_hits() - hits
+
+
+def _attach(name: str, shape: tuple, dtype: str) -> tuple:
+    shm = shared_memory.SharedMemory(name=name)
+    values = npNdarray(shape, dtype=npDtype(dtype), buffer=shm.buf)
+    values.flags.writeable = False
+    return shm, values
+
+
+def _close(shms: list, unlink: bool = False) -> list:
+    """Closes, and optionally unlinks, the shared memory blocks. Returns
+    those that are still referenced, released when garbage collected."""
+    referenced = []
+    for shm in shms:
+        try:
+            shm.close()
+        except BufferError:
+            referenced.append(shm)
+        if unlink:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+    return referenced
+
+
+def _attach_frame(descriptor: dict) -> tuple:
+    shms, frames = [], []
+    for name, dtype, columns in descriptor["blocks"]:
+        shm, values = _attach(name, (len(columns), descriptor["nrows"]), dtype)
+        shms.append(shm)
+        frames.append(DataFrame(values.T, columns=list(columns), copy=False))
+
+    if len(frames) == 1:
+        df = frames[0]
+    elif len(frames) > 1:
+        df = concat(frames, axis=1, copy=False)
+    else:
+        df = DataFrame(index=RangeIndex(descriptor["nrows"]))
+
+    if descriptor["index"] is not None:
+        index, index_shm = _attach_index(descriptor["index"], descriptor["nrows"])
+        if index_shm is not None: shms.append(index_shm)
+        df.index = index
+    return df, shms
+
+
+def _attach_index(shared: tuple, nrows: int) -> tuple:
+    kind, data, name = shared
+    if kind == "range":
+        return RangeIndex(*data, name=name), None
+    if kind == "datetime":
+        shm, values = _attach(data[0], (1, nrows), "int64")
+        index = DatetimeIndex(values[0].view("M8[ns]"), name=name)
+        if data[1] is not None:
+            index = index.tz_localize("UTC").tz_convert(data[1])
+        return index, shm
+    if kind == "numeric":
+        shm, values = _attach(data[0], (1, nrows), data[1])
+        return Index(values[0], name=name), shm
+    return data, None
+
+
+def _has_column(columns: Index, name: str) -> bool:
+    """Mirrors the column matching of AnalysisIndicators._get_column()."""
+    if name in columns: return True
+    try:
+        return bool(columns.str.match(name, case=False).any())
+    except AttributeError:
+        return False
+
+
+def _dtype_groups(df: DataFrame):
+    """Yields (dtype, columns) for the numeric and boolean columns."""
+    groups = OrderedDict()
+    for column, dtype in df.dtypes.items():
+        if dtype.kind in "biuf":
+            groups.setdefault(npDtype(dtype), []).append(column)
+    return groups.items()
@@ -1,9 +1,25 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
 from numpy import log as nplog
 from numpy import nan as npNaN
 from pandas import DataFrame, Series
 from pandas_ta.overlap import hl2
-from pandas_ta.utils import get_offset, high_low_range, verify_series
+from pandas_ta.utils import get_offset, high_low_range, iir, kernel, rolling_minmax, verify_series
+
+
+@kernel
+def fisher_kernel(position, length):
+    """The clipped, smoothed 'position' of the Fisher Transform from bar
+    'length'."""
+    m = len(position)
+    result = npFull(m, npNaN)
+    v = 0.0
+    for i in range(length, m):
+        v = 0.66 * position[i] + 0.67 * v
+        if v < -0.99: v = -0.999
+        if v > 0.99: v = 0.999
+        result[i] = v
+    return result
 
 
 def fisher(high, low, length=None, signal=None, offset=None, **kwargs):
@@ -20,22 +36,19 @@ def fisher(high, low, length=None, signal=None, offset=None, **kwargs):
 
     # Calculate Result
     hl2_ = hl2(high, low)
-    highest_hl2 = hl2_.rolling(length).max()
-    lowest_hl2 = hl2_.rolling(length).min()
+    highest_hl2, lowest_hl2 = rolling_minmax(hl2_, length)[:2]
 
     hlr = high_low_range(highest_hl2, lowest_hl2)
     hlr[hlr < 0.001] = 0.001
 
     position = ((hl2_ - lowest_hl2) / hlr) - 0.5
 
-    v = 0
-    m = high.size
-    result = [npNaN for _ in range(0, length - 1)] + [0]
-    for i in range(length, m):
-        v = 0.66 * position.iloc[i] + 0.67 * v
-        if v < -0.99: v = -0.999
-        if v > 0.99: v = 0.999
-        result.append(0.5 * (nplog((1 + v) / (1 - v)) + result[i - 1]))
+    # Only the smoothing is clipped, the transform is a linear recurrence
+    # from zero on bar 'length' - 1
+    v = fisher_kernel(position.to_numpy(dtype=float), length)[length:]
+    result = npFull(v.size + length, npNaN)
+    result[length - 1] = 0
+    result[length:], _ = iir(nplog((1 + v) / (1 - v)), [0.5], [1, -0.5])
     fisher = Series(result, index=high.index)
     signalma = fisher.shift(signal)
 
@@ -1,12 +1,62 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
+from numpy import int64 as npInt64
 from numpy import maximum as npMaximum
 from numpy import minimum as npMinimum
 from numpy import nan as npNaN
+from numpy import ones as npOnes
+from numpy import zeros as npZeros
 from pandas import DataFrame, Series
 
 from .rsi import rsi
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import get_drift, get_offset, kernel, verify_series
+
+
+@kernel
+def qqe_kernel(rsi_ma, upperband, lowerband):
+    """QQE recurrence of the long and short lines. Returns the qqe, long
+    and short."""
+    m = len(rsi_ma)
+    long, short = npZeros(m), npZeros(m)
+    trend = npOnes(m, dtype=npInt64)
+    qqe = npFull(m, rsi_ma[0])
+    qqe_long, qqe_short = npFull(m, npNaN), npFull(m, npNaN)
+
+    for i in range(1, m):
+        c_rsi, p_rsi = rsi_ma[i], rsi_ma[i - 1]
+        c_long, p_long = long[i - 1], long[i - 2]
+        c_short, p_short = short[i - 1], short[i - 2]
+
+        # Long Line
+        if p_rsi > c_long and c_rsi > c_long:
+            long[i] = npMaximum(c_long, lowerband[i])
+        else:
+            long[i] = lowerband[i]
+
+        # Short Line
+        if p_rsi < c_short and c_rsi < c_short:
+            short[i] = npMinimum(c_short, upperband[i])
+        else:
+            short[i] = upperband[i]
+
+        # Trend & QQE Calculation
+        # Long: Current RSI_MA value Crosses the Prior Short Line Value
+        # Short: Current RSI_MA Crosses the Prior Long Line Value
+        if (c_rsi > c_short and p_rsi < p_short) or (c_rsi <= c_short and p_rsi >= p_short):
+            trend[i] = 1
+            qqe[i] = qqe_long[i] = long[i]
+        elif (c_rsi > c_long and p_rsi < p_long) or (c_rsi <= c_long and p_rsi >= p_long):
+            trend[i] = -1
+            qqe[i] = qqe_short[i] = short[i]
+        else:
+            trend[i] = trend[i - 1]
+            if trend[i] == 1:
+                qqe[i] = qqe_long[i] = long[i]
+            else:
+                qqe[i] = qqe_short[i] = short[i]
+
+    return qqe, qqe_long, qqe_short
 
 
 def qqe(close, length=None, smooth=None, factor=None, mamode=None, drift=None, offset=None, **kwargs):
@@ -40,53 +90,19 @@ def qqe(close, length=None, smooth=None, factor=None, mamode=None, drift=None, o
     upperband = rsi_ma + dar
     lowerband = rsi_ma - dar
 
-    m = close.size
-    long = Series(0, index=close.index)
-    short = Series(0, index=close.index)
-    trend = Series(1, index=close.index)
-    qqe = Series(rsi_ma.iloc[0], index=close.index)
-    qqe_long = Series(npNaN, index=close.index)
-    qqe_short = Series(npNaN, index=close.index)
-
-    for i in range(1, m):
-        c_rsi, p_rsi = rsi_ma.iloc[i], rsi_ma.iloc[i - 1]
-        c_long, p_long = long.iloc[i - 1], long.iloc[i - 2]
-        c_short, p_short = short.iloc[i - 1], short.iloc[i - 2]
-
-        # Long Line
-        if p_rsi > c_long and c_rsi > c_long:
-            long.iloc[i] = npMaximum(c_long, lowerband.iloc[i])
-        else:
-            long.iloc[i] = lowerband.iloc[i]
-
-        # Short Line
-        if p_rsi < c_short and c_rsi < c_short:
-            short.iloc[i] = npMinimum(c_short, upperband.iloc[i])
-        else:
-            short.iloc[i] = upperband.iloc[i]
-
-        # Trend & QQE Calculation
-        # Long: Current RSI_MA value Crosses the Prior Short Line Value
-        # Short: Current RSI_MA Crosses the Prior Long Line Value
-        if (c_rsi > c_short and p_rsi < p_short) or (c_rsi <= c_short and p_rsi >= p_short):
-            trend.iloc[i] = 1
-            qqe.iloc[i] = qqe_long.iloc[i] = long.iloc[i]
-        elif (c_rsi > c_long and p_rsi < p_long) or (c_rsi <= c_long and p_rsi >= p_long):
-            trend.iloc[i] = -1
-            qqe.iloc[i] = qqe_short.iloc[i] = short.iloc[i]
-        else:
-            trend.iloc[i] = trend.iloc[i - 1]
-            if trend.iloc[i] == 1:
-                qqe.iloc[i] = qqe_long.iloc[i] = long.iloc[i]
-            else:
-                qqe.iloc[i] = qqe_short.iloc[i]  = short.iloc[i]
+    qqe, qqe_long, qqe_short = qqe_kernel(
+        rsi_ma.to_numpy(dtype=float),
+        upperband.to_numpy(dtype=float),
+        lowerband.to_numpy(dtype=float),
+    )
+    qqe = Series(qqe, index=close.index)
+    qqe_long = Series(qqe_long, index=close.index)
+    qqe_short = Series(qqe_short, index=close.index)
 
     # Offset
     if offset != 0:
         rsi_ma = rsi_ma.shift(offset)
         qqe = qqe.shift(offset)
-        long = long.shift(offset)
-        short = short.shift(offset)
 
     # Handle fills
     if "fillna" in kwargs:
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 from .mom import mom
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import cached, get_offset, verify_series
 
 
+@cached
 def roc(close, length=None, scalar=None, talib=None, offset=None, **kwargs):
     """Indicator: Rate of Change (ROC)"""
     # Validate Arguments
@@ -1,7 +1,17 @@
 # -*- coding: utf-8 -*-
+from numpy import abs as npAbs
+from numpy import arange as npArange
+from numpy import clip as npClip
+from numpy import concatenate as npConcatenate
+from numpy import cumsum as npCumsum
+from numpy import errstate as npErrstate
+from numpy import full as npFull
+from numpy import isin as npIsin
 from numpy import nan as npNaN
+from numpy import stack as npStack
+from numpy import where as npWhere
 from pandas import concat, DataFrame, Series
-from pandas_ta.utils import get_drift, get_offset, verify_series, signals
+from pandas_ta.utils import get_drift, get_offset, iir, verify_series, signals
 
 
 def rsx(close, length=None, drift=None, offset=None, **kwargs):
@@ -14,69 +24,35 @@ def rsx(close, length=None, drift=None, offset=None, **kwargs):
 
     if close is None: return
 
-    # variables
-    vC, v1C = 0, 0
-    v4, v8, v10, v14, v18, v20 = 0, 0, 0, 0, 0, 0
-
-    f0, f8, f10, f18, f20, f28, f30, f38 = 0, 0, 0, 0, 0, 0, 0, 0
-    f40, f48, f50, f58, f60, f68, f70, f78 = 0, 0, 0, 0, 0, 0, 0, 0
-    f80, f88, f90 = 0, 0, 0
-
     # Calculate Result
-    m = close.size
-    result = [npNaN for _ in range(0, length - 1)] + [0]
-    for i in range(length, m):
-        if f90 == 0:
-            f90 = 1.0
-            f0 = 0.0
-            if length - 1.0 >= 5:
-                f88 = length - 1.0
-            else:
-                f88 = 5.0
-            f8 = 100.0 * close.iloc[i]
-            f18 = 3.0 / (length + 2.0)
-            f20 = 1.0 - f18
-        else:
-            if f88 <= f90:
-                f90 = f88 + 1
-            else:
-                f90 = f90 + 1
-            f10 = f8
-            f8 = 100 * close.iloc[i]
-            v8 = f8 - f10
-            f28 = f20 * f28 + f18 * v8
-            f30 = f18 * f28 + f20 * f30
-            vC = 1.5 * f28 - 0.5 * f30
-            f38 = f20 * f38 + f18 * vC
-            f40 = f18 * f38 + f20 * f40
-            v10 = 1.5 * f38 - 0.5 * f40
-            f48 = f20 * f48 + f18 * v10
-            f50 = f18 * f48 + f20 * f50
-            v14 = 1.5 * f48 - 0.5 * f50
-            f58 = f20 * f58 + f18 * abs(v8)
-            f60 = f18 * f58 + f20 * f60
-            v18 = 1.5 * f58 - 0.5 * f60
-            f68 = f20 * f68 + f18 * v18
-            f70 = f18 * f68 + f20 * f70
-            v1C = 1.5 * f68 - 0.5 * f70
-            f78 = f20 * f78 + f18 * v1C
-            f80 = f18 * f78 + f20 * f80
-            v20 = 1.5 * f78 - 0.5 * f80
-
-            if f88 >= f90 and f8 != f10:
-                f0 = 1.0
-            if f88 == f90 and f0 == 0.0:
-                f90 = 0.0
-
-        if f88 < f90 and v20 > 0.0000000001:
-            v4 = (v14 / v20 + 1.0) * 50.0
-            if v4 > 100.0:
-                v4 = 100.0
-            if v4 < 0.0:
-                v4 = 0.0
-        else:
-            v4 = 50.0
-        result.append(v4)
+    x = close.to_numpy(dtype=float)
+    m = x.size
+    f88 = max(length - 1, 5)
+    f18 = 3.0 / (length + 2.0)
+    f20 = 1.0 - f18
+
+    # A cycle starts on bar 'length' and restarts 'f88' bars later when the
+    # close did not change in between. Its first bar only sets the last close.
+    changed = npConcatenate(([0], npCumsum(x[1:] != x[:-1])))
+    starts = [length]
+    while starts[-1] + f88 - 1 < m and changed[starts[-1] + f88 - 1] == changed[starts[-1]]:
+        starts.append(starts[-1] + f88)
+
+    # The momentum and its magnitude through three double smoothings
+    bars = npArange(length, m)
+    bars = bars[~npIsin(bars, starts)]
+    momentum = 100 * x[bars] - 100 * x[bars - 1]
+    v = npStack((momentum, npAbs(momentum)), axis=1)
+    for _ in range(3):
+        v, _ = iir(v, [1.5 * f18 - 0.5 * f18 * f18, -1.5 * f18 * f20], [1, -2 * f20, f20 * f20])
+
+    result = npFull(m, npNaN)
+    result[length - 1] = 0
+    result[length:] = 50.0
+    ready = bars >= starts[-1] + f88
+    v14, v20 = v[ready, 0], v[ready, 1]
+    with npErrstate(divide="ignore", invalid="ignore"):
+        result[bars[ready]] = npWhere(v20 > 1e-10, npClip((v14 / v20 + 1) * 50, 0, 100), 50.0)
     rsx = Series(result, index=close.index)
 
     # Offset
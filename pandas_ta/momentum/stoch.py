@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_offset, non_zero_range, verify_series
+from pandas_ta.utils import get_offset, non_zero_range, rolling_minmax, verify_series
 
 
 def stoch(high, low, close, k=None, d=None, smooth_k=None, mamode=None, offset=None, **kwargs):
@@ -20,8 +20,8 @@ def stoch(high, low, close, k=None, d=None, smooth_k=None, mamode=None, offset=N
     if high is None or low is None or close is None: return
 
     # Calculate Result
-    lowest_low = low.rolling(k).min()
-    highest_high = high.rolling(k).max()
+    lowest_low = rolling_minmax(low, k)[1]
+    highest_high = rolling_minmax(high, k)[0]
 
     stoch = 100 * (close - lowest_low)
     stoch /= non_zero_range(highest_high, lowest_low)
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
-# import numpy as np
+from numpy import cumsum as npCumsum
+from numpy import maximum as npMaximum
+from numpy import minimum as npMinimum
 from numpy import where as npWhere
 from pandas import DataFrame, Series
 from pandas_ta.utils import get_offset, verify_series
@@ -13,21 +15,13 @@ def td_seq(close, asint=None, offset=None, **kwargs):
     asint = asint if isinstance(asint, bool) else False
     show_all = kwargs.setdefault("show_all", True)
 
-    def true_sequence_count(series: Series):
-        index = series.where(series == False).last_valid_index()
-
-        if index is None:
-            return series.count()
-        else:
-            s = series[series.index > index]
-            return s.count()
-
     def calc_td(series: Series, direction: str, show_all: bool):
         td_bool = series.diff(4) > 0 if direction=="up" else series.diff(4) < 0
-        td_num = npWhere(
-            td_bool, td_bool.rolling(13, min_periods=0).apply(true_sequence_count), 0
-        )
-        td_num = Series(td_num)
+        # Length of the run of Trues ending at each bar, up to 13
+        td_bool = td_bool.to_numpy()
+        count = npCumsum(td_bool)
+        run = count - npMaximum.accumulate(npWhere(td_bool, 0, count))
+        td_num = Series(npMinimum(run, 13), index=series.index, dtype=float)
 
         if show_all:
             td_num = td_num.mask(td_num == 0)
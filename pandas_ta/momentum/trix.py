@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
-from pandas_ta.overlap.ema import ema
+from pandas_ta.overlap.ema import ema, ema_chain
 from pandas_ta.utils import get_drift, get_offset, verify_series
 
 
@@ -17,9 +17,13 @@ def trix(close, length=None, signal=None, scalar=None, drift=None, offset=None,
     if close is None: return
 
     # Calculate Result
-    ema1 = ema(close=close, length=length, **kwargs)
-    ema2 = ema(close=ema1, length=length, **kwargs)
-    ema3 = ema(close=ema2, length=length, **kwargs)
+    emas = ema_chain(close, length, 3, **kwargs)
+    if emas is None:
+        ema1 = ema(close=close, length=length, **kwargs)
+        ema2 = ema(close=ema1, length=length, **kwargs)
+        ema3 = ema(close=ema2, length=length, **kwargs)
+    else:
+        ema3 = emas[-1]
     trix = scalar * ema3.pct_change(drift)
 
     trix_signal = trix.rolling(signal).mean()
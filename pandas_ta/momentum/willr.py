@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_minmax, verify_series
 
 
 def willr(high, low, close, length=None, talib=None, offset=None, **kwargs):
@@ -22,8 +22,8 @@ def willr(high, low, close, length=None, talib=None, offset=None, **kwargs):
         from talib import WILLR
         willr = WILLR(high, low, close, length)
     else:
-        lowest_low = low.rolling(length, min_periods=min_periods).min()
-        highest_high = high.rolling(length, min_periods=min_periods).max()
+        lowest_low = rolling_minmax(low, length, min_periods)[1]
+        highest_high = rolling_minmax(high, length, min_periods)[0]
 
         willr = 100 * ((close - lowest_low) / (highest_high - lowest_low) - 1)
 
@@ -9,11 +9,11 @@ from .hlc3 import hlc3
 from .hma import hma
 from .hwma import hwma
 from .ichimoku import ichimoku
-from .jma import jma
+from .jma import jma, JMA
 from .kama import kama
 from .linreg import linreg
 from .ma import ma
-from .mcgd import mcgd
+from .mcgd import mcgd, MCGD
 from .midpoint import midpoint
 from .midprice import midprice
 from .ohlc4 import ohlc4
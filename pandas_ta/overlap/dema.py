@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from .ema import ema
+from .ema import ema, ema_chain
 from pandas_ta import Imports
 from pandas_ta.utils import get_offset, verify_series
 
@@ -19,8 +19,12 @@ def dema(close, length=None, talib=None, offset=None, **kwargs):
         from talib import DEMA
         dema = DEMA(close, length)
     else:
-        ema1 = ema(close=close, length=length)
-        ema2 = ema(close=ema1, length=length)
+        emas = ema_chain(close, length, 2)
+        if emas is None:
+            ema1 = ema(close=close, length=length)
+            ema2 = ema(close=ema1, length=length)
+        else:
+            ema1, ema2 = emas
         dema = 2 * ema1 - ema2
 
     # Offset
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
+from numpy import isnan as npIsnan
 from numpy import nan as npNaN
+from pandas import Series
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import cached, get_offset, iir, iir_state, verify_series
 
 
+@cached
 def ema(close, length=None, talib=None, offset=None, **kwargs):
     """Indicator: Exponential Moving Average (EMA)"""
     # Validate Arguments
@@ -45,6 +49,40 @@ def ema(close, length=None, talib=None, offset=None, **kwargs):
     return ema
 
 
+def ema_chain(close, length, depth, **kwargs) -> list:
+    """The first 'depth' emas of a chain, each the ema() of the previous one
+    with the same arguments, by iir(). Returns None when they are TA Lib's,
+    adjusted, filled or the source has gaps, for ema() itself.
+
+    With the seed of the first ema, every ema of the chain starts at it on
+    the same bar and continues as the ewm of the previous one.
+    """
+    talib = kwargs.get("talib")
+    mode_tal = bool(talib) if isinstance(talib, bool) else True
+    if Imports["talib"] and mode_tal: return
+    if kwargs.get("adjust", False) or "fillna" in kwargs or "fill_method" in kwargs: return
+
+    x = close.to_numpy(dtype=float)
+    if npIsnan(x).any(): return
+
+    if kwargs.get("sma", True):
+        start, seed = length - 1, close[0:length].mean()
+    else:
+        start, seed = 0, x[0]
+    alpha = 2.0 / (length + 1)
+    b, a = [alpha], [1, alpha - 1]
+    state = iir_state(b, a, y=[seed])
+
+    emas, source = [], x[start + 1:]
+    for _ in range(depth):
+        result = npFull(x.size, npNaN)
+        result[start] = seed
+        result[start + 1:], _ = iir(source, b, a, state)
+        source = result[start + 1:]
+        emas.append(Series(result, index=close.index))
+    return emas
+
+
 ema.__doc__ = \
 """Exponential Moving Average (EMA)
 
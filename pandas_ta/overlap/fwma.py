@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import fibonacci, get_offset, verify_series, weights
+from pandas_ta.utils import fibonacci, fir, get_offset, verify_series
 
 
 def fwma(close, length=None, asc=None, offset=None, **kwargs):
@@ -14,7 +14,7 @@ def fwma(close, length=None, asc=None, offset=None, **kwargs):
 
     # Calculate Result
     fibs = fibonacci(n=length, weighted=True)
-    fwma = close.rolling(length, min_periods=length).apply(weights(fibs), raw=True)
+    fwma = fir(close, fibs)
 
     # Offset
     if offset != 0:
@@ -1,8 +1,27 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
 from numpy import nan as npNaN
 from pandas import DataFrame, Series
 from .ma import ma
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, kernel, verify_series
+
+
+@kernel
+def hilo_kernel(close, high_ma, low_ma):
+    """Gann HiLo recurrence. Returns the hilo, long and short."""
+    m = len(close)
+    hilo, long, short = npFull(m, npNaN), npFull(m, npNaN), npFull(m, npNaN)
+
+    for i in range(1, m):
+        if close[i] > high_ma[i - 1]:
+            hilo[i] = long[i] = low_ma[i]
+        elif close[i] < low_ma[i - 1]:
+            hilo[i] = short[i] = high_ma[i]
+        else:
+            hilo[i] = hilo[i - 1]
+            long[i] = short[i] = hilo[i - 1]
+
+    return hilo, long, short
 
 
 def hilo(high, low, close, high_length=None, low_length=None, mamode=None, offset=None, **kwargs):
@@ -20,22 +39,17 @@ def hilo(high, low, close, high_length=None, low_length=None, mamode=None, offse
     if high is None or low is None or close is None: return
 
     # Calculate Result
-    m = close.size
-    hilo = Series(npNaN, index=close.index)
-    long = Series(npNaN, index=close.index)
-    short = Series(npNaN, index=close.index)
-
     high_ma = ma(mamode, high, length=high_length)
     low_ma = ma(mamode, low, length=low_length)
 
-    for i in range(1, m):
-        if close.iloc[i] > high_ma.iloc[i - 1]:
-            hilo.iloc[i] = long.iloc[i] = low_ma.iloc[i]
-        elif close.iloc[i] < low_ma.iloc[i - 1]:
-            hilo.iloc[i] = short.iloc[i] = high_ma.iloc[i]
-        else:
-            hilo.iloc[i] = hilo.iloc[i - 1]
-            long.iloc[i] = short.iloc[i] = hilo.iloc[i - 1]
+    hilo, long, short = hilo_kernel(
+        close.to_numpy(dtype=float),
+        high_ma.to_numpy(dtype=float),
+        low_ma.to_numpy(dtype=float),
+    )
+    hilo = Series(hilo, index=close.index)
+    long = Series(long, index=close.index)
+    short = Series(short, index=close.index)
 
     # Offset
     if offset != 0:
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import cached, get_offset, verify_series
 
 
+@cached
 def hlc3(high, low, close, talib=None, offset=None, **kwargs):
     """Indicator: HLC3"""
     # Validate Arguments
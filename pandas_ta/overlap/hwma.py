@@ -1,6 +1,33 @@
 # -*- coding: utf-8 -*-
+from numpy import array as npArray
+from numpy import convolve as npConvolve
+from numpy import eye as npEye
+from numpy import trace as npTrace
+from numpy.linalg import det as npDet
 from pandas import Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, iir, verify_series
+
+
+def hwma_coefficients(na: float, nb: float, nc: float) -> tuple:
+    """The (b, a) coefficients of the Holt-Winter recurrence as a linear
+    filter of the price, from the characteristic polynomial of its
+    transition and its impulse response."""
+    def step(F, V, A, price):
+        F1 = (1.0 - na) * (F + V + 0.5 * A) + na * price
+        V1 = (1.0 - nb) * (V + A) + nb * (F1 - F)
+        A1 = (1.0 - nc) * A + nc * (V1 - V)
+        return F1, V1, A1
+
+    M = npArray([step(*e, 0.0) for e in npEye(3)]).T
+    t = npTrace(M)
+    a = npArray([1.0, -t, 0.5 * (t * t - npTrace(M @ M)), -npDet(M)])
+
+    state, impulse = (0.0, 0.0, 0.0), []
+    for price in (1.0, 0.0, 0.0, 0.0):
+        state = step(*state, price)
+        impulse.append(state[0] + state[1] + 0.5 * state[2])
+    b = npConvolve(a, impulse)[:4]
+    return b, a
 
 
 def hwma(close, na=None, nb=None, nc=None, offset=None, **kwargs):
@@ -13,19 +40,10 @@ def hwma(close, na=None, nb=None, nc=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    last_a = last_v = 0
-    last_f = close.iloc[0]
-
-    result = []
-    m = close.size
-    for i in range(m):
-        F = (1.0 - na) * (last_f + last_v + 0.5 * last_a) + na * close.iloc[i]
-        V = (1.0 - nb) * (last_v + last_a) + nb * (F - last_f)
-        A = (1.0 - nc) * last_a + nc * (V - last_v)
-        result.append((F + V + 0.5 * A))
-        last_a, last_f, last_v = A, F, V # update values
-
-    hwma = Series(result, index=close.index)
+    # Starts at rest on the first close: F = close[0], V = A = 0
+    x = close.to_numpy(dtype=float)
+    result, _ = iir(x - x[0], *hwma_coefficients(na, nb, nc))
+    hwma = Series(result + x[0], index=close.index)
 
     # Offset
     if offset != 0:
@@ -1,65 +1,77 @@
 # -*- coding: utf-8 -*-
-from numpy import average as npAverage
+from math import log, sqrt
+
+from numpy import array as npArray
+from numpy import full as npFull
 from numpy import nan as npNaN
-from numpy import log as npLog
-from numpy import power as npPower
-from numpy import sqrt as npSqrt
-from numpy import zeros_like as npZeroslike
+from numpy import ndim as npNdim
+from numpy import zeros as npZeros
 from pandas import Series
-from pandas_ta.utils import get_offset, verify_series
-
+from pandas_ta.utils import get_offset, kernel, verify_series
 
-def jma(close, length=None, phase=None, offset=None, **kwargs):
-    """Indicator: Jurik Moving Average (JMA)"""
-    # Validate Arguments
-    _length = int(length) if length and length > 0 else 7
-    phase = float(phase) if phase and phase != 0 else 0
-    close = verify_series(close, _length)
-    offset = get_offset(offset)
-    if close is None: return
+# The JMA kernel's state: bars, ma1, uBand, lBand, det0, det1, jma, v_sum,
+# the sum of the last 66 v_sums, then the last 10 voltys and 66 v_sums
+JMA_STATE = 9 + 10 + 66
 
-    # Define base variables
-    jma = npZeroslike(close)
-    volty = npZeroslike(close)
-    v_sum = npZeroslike(close)
 
-    kv = det0 = det1 = ma2 = 0.0
-    jma[0] = ma1 = uBand = lBand = close[0]
+@kernel
+def jma_kernel(close, _length, phase, state):
+    """Jurik Moving Average recurrence, continued from the 'state' which is
+    updated and returned with the result. NaN until bar '_length' - 1. The
+    average of the last 66 v_sums is kept as a running sum."""
+    m = len(close)
+    result = npFull(m, npNaN)
+    if m == 0:
+        return result, state
 
     # Static variables
     sum_length = 10
     length = 0.5 * (_length - 1)
     pr = 0.5 if phase < -100 else 2.5 if phase > 100 else 1.5 + phase * 0.01
-    length1 = max((npLog(npSqrt(length)) / npLog(2.0)) + 2.0, 0)
+    length1 = max((log(sqrt(length)) / log(2.0)) + 2.0, 0) if length > 0 else 0.0
     pow1 = max(length1 - 2.0, 0.5)
-    length2 = length1 * npSqrt(length)
+    length2 = length1 * sqrt(length)
     bet = length2 / (length2 + 1)
     beta = 0.45 * (_length - 1) / (0.45 * (_length - 1) + 2.0)
+    max_volty = length1 ** (1 / pow1)
 
-    m = close.shape[0]
-    for i in range(1, m):
-        price = close[i]
+    start = 0
+    i = int(state[0])
+    if i == 0:
+        state[1] = state[2] = state[3] = state[6] = close[0]
+        if _length <= 1:
+            result[0] = close[0]
+        i, start = 1, 1
+    ma1, uBand, lBand = state[1], state[2], state[3]
+    det0, det1, jma, v_sum, v_total = state[4], state[5], state[6], state[7], state[8]
+
+    for j in range(start, m):
+        price = close[j]
 
         # Price volatility
         del1 = price - uBand
         del2 = price - lBand
-        volty[i] = max(abs(del1),abs(del2)) if abs(del1)!=abs(del2) else 0
+        volty = max(abs(del1), abs(del2)) if abs(del1) != abs(del2) else 0.0
 
         # Relative price volatility factor
-        v_sum[i] = v_sum[i - 1] + (volty[i] - volty[max(i - sum_length, 0)]) / sum_length
-        avg_volty = npAverage(v_sum[max(i - 65, 0):i + 1])
-        d_volty = 0 if avg_volty ==0 else volty[i] / avg_volty
-        r_volty = max(1.0, min(npPower(length1, 1 / pow1), d_volty))
+        k = 9 + i % sum_length
+        v_sum += (volty - state[k]) / sum_length
+        state[k] = volty
+        k = 19 + i % 66
+        v_total += v_sum - state[k]
+        state[k] = v_sum
+        avg_volty = v_total / min(i + 1, 66)
+        d_volty = 0 if avg_volty == 0 else volty / avg_volty
+        r_volty = max(1.0, min(max_volty, d_volty))
 
         # Jurik volatility bands
-        pow2 = npPower(r_volty, pow1)
-        kv = npPower(bet, npSqrt(pow2))
+        power = r_volty ** pow1
+        kv = bet ** sqrt(power)
         uBand = price if (del1 > 0) else price - (kv * del1)
         lBand = price if (del2 < 0) else price - (kv * del2)
 
         # Jurik Dynamic Factor
-        power = npPower(r_volty, pow1)
-        alpha = npPower(beta, power)
+        alpha = beta ** power
 
         # 1st stage - prelimimary smoothing by adaptive EMA
         ma1 = ((1 - alpha) * price) + (alpha * ma1)
@@ -69,11 +81,61 @@ def jma(close, length=None, phase=None, offset=None, **kwargs):
         ma2 = ma1 + pr * det0
 
         # 3rd stage - final smoothing by unique Jurik adaptive filter
-        det1 = ((ma2 - jma[i - 1]) * (1 - alpha) * (1 - alpha)) + (alpha * alpha * det1)
-        jma[i] = jma[i-1] + det1
+        det1 = ((ma2 - jma) * (1 - alpha) * (1 - alpha)) + (alpha * alpha * det1)
+        jma = jma + det1
+
+        # Remove initial lookback data
+        if i >= _length - 1:
+            result[j] = jma
+        i += 1
+
+    state[0] = i
+    state[1], state[2], state[3] = ma1, uBand, lBand
+    state[4], state[5], state[6], state[7], state[8] = det0, det1, jma, v_sum, v_total
+    return result, state
+
+
+class JMA(object):
+    """Jurik Moving Average, updated a value at a time
+
+    Continues the jma() recurrence from its state, for live data.
+
+    >>> smoother = JMA(length=7, phase=0)
+    >>> value = smoother.update(price)
+    >>> values = smoother.update(prices)  # Or a batch at once
+
+    Args:
+        length (int): Period of calculation. Default: 7
+        phase (float): How heavy/light the average is [-100, 100]. Default: 0
+    """
+
+    __slots__ = ("length", "phase", "state")
+
+    def __init__(self, length: int = None, phase: float = None):
+        self.length = int(length) if length and length > 0 else 7
+        self.phase = float(phase) if phase and phase != 0 else 0
+        self.state = npZeros(JMA_STATE)
+
+    def update(self, value):
+        """Returns the JMA of 'value', a float, or of a sequence of values."""
+        scalar = npNdim(value) == 0
+        values = npArray(value, dtype=float, ndmin=1)
+        result, state = jma_kernel(values, self.length, self.phase, self.state)
+        self.state = npArray(state, dtype=float)
+        return float(result[-1]) if scalar else result
+
+
+def jma(close, length=None, phase=None, offset=None, **kwargs):
+    """Indicator: Jurik Moving Average (JMA)"""
+    # Validate Arguments
+    _length = int(length) if length and length > 0 else 7
+    phase = float(phase) if phase and phase != 0 else 0
+    close = verify_series(close, _length)
+    offset = get_offset(offset)
+    if close is None: return
 
-    # Remove initial lookback data and convert to pandas frame
-    jma[0:_length - 1] = npNaN
+    # Calculate Result
+    jma, _ = jma_kernel(close.to_numpy(dtype=float), _length, phase, npZeros(JMA_STATE))
     jma = Series(jma, index=close.index)
 
     # Offset
@@ -1,7 +1,20 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
 from numpy import nan as npNaN
 from pandas import Series
-from pandas_ta.utils import get_drift, get_offset, non_zero_range, verify_series
+from pandas_ta.utils import get_drift, get_offset, kernel, non_zero_range, verify_series
+
+
+@kernel
+def kama_kernel(close, sc, length):
+    """KAMA recurrence by the smoothing constant 'sc'. Starts at zero on
+    bar 'length' - 1."""
+    m = len(close)
+    result = npFull(m, npNaN)
+    result[length - 1] = 0
+    for i in range(length, m):
+        result[i] = sc[i] * close[i] + (1 - sc[i]) * result[i - 1]
+    return result
 
 
 def kama(close, length=None, fast=None, slow=None, drift=None, offset=None, **kwargs):
@@ -30,11 +43,7 @@ def kama(close, length=None, fast=None, slow=None, drift=None, offset=None, **kw
     x = er * (fr - sr) + sr
     sc = x * x
 
-    m = close.size
-    result = [npNaN for _ in range(0, length - 1)] + [0]
-    for i in range(length, m):
-        result.append(sc.iloc[i] * close.iloc[i] + (1 - sc.iloc[i]) * result[i - 1])
-
+    result = kama_kernel(close.to_numpy(dtype=float), sc.to_numpy(dtype=float), length)
     kama = Series(result, index=close.index)
 
     # Offset
@@ -1,5 +1,74 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from numpy import array as npArray
+from numpy import full as npFull
+from numpy import inf as npInf
+from numpy import nan as npNaN
+from numpy import ndim as npNdim
+from numpy import zeros as npZeros
+from pandas import Series
+from pandas_ta.utils import get_offset, kernel, verify_series
+
+
+@kernel
+def mcgd_kernel(close, length, c, state):
+    """McGinley Dynamic recurrence, continued from the 'state': the bars seen,
+    the last value and close, which is updated and returned with the result.
+    A NaN close restarts it from the next close, which is NaN itself."""
+    m = len(close)
+    result = npFull(m, npNaN)
+    if m == 0:
+        return result, state
+
+    start, i, prev, last = 0, state[0], state[1], state[2]
+    if i == 0:
+        prev = last = result[0] = close[0]
+        start = 1
+
+    for j in range(start, m):
+        price = close[j]
+        if price != price or last != last:
+            prev = last = price
+            continue
+        # IEEE results, like NumPy's, of zero divisors and overflows
+        ratio = price / prev if prev != 0 else price * npInf
+        ratio *= ratio
+        denom = c * length * ratio * ratio
+        prev += (price - prev) / denom if denom != 0 else (price - prev) * npInf
+        result[j], last = prev, price
+
+    state[0], state[1], state[2] = i + m, prev, last
+    return result, state
+
+
+class MCGD(object):
+    """McGinley Dynamic, updated a value at a time
+
+    Continues the mcgd() recurrence from its state, for live data.
+
+    >>> dynamic = MCGD(length=10, c=1)
+    >>> value = dynamic.update(price)
+    >>> values = dynamic.update(prices)  # Or a batch at once
+
+    Args:
+        length (int): Indicator's period. Default: 10
+        c (float): Multiplier for the denominator, sometimes set to 0.6. Default: 1
+    """
+
+    __slots__ = ("length", "c", "state")
+
+    def __init__(self, length: int = None, c: float = None):
+        self.length = int(length) if length and length > 0 else 10
+        self.c = float(c) if c and 0 < c <= 1 else 1
+        self.state = npZeros(3)
+
+    def update(self, value):
+        """Returns the McGinley Dynamic of 'value', a float, or of a sequence
+        of values."""
+        scalar = npNdim(value) == 0
+        values = npArray(value, dtype=float, ndmin=1)
+        result, state = mcgd_kernel(values, self.length, self.c, self.state)
+        self.state = npArray(state, dtype=float)
+        return float(result[-1]) if scalar else result
 
 
 def mcgd(close, length=None, offset=None, c=None, **kwargs):
@@ -13,15 +82,8 @@ def mcgd(close, length=None, offset=None, c=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    close = close.copy()
-
-    def mcg_(series):
-        denom = (c * length * (series.iloc[1] / series.iloc[0]) ** 4)
-        series.iloc[1] = (series.iloc[0] + ((series.iloc[1] - series.iloc[0]) / denom))
-        return series.iloc[1]
-
-    mcg_cell = close[0:].rolling(2, min_periods=2).apply(mcg_, raw=False)
-    mcg_ds = close[:1].append(mcg_cell[1:])
+    mcg_ds, _ = mcgd_kernel(close.to_numpy(dtype=float), length, c, npZeros(3))
+    mcg_ds = Series(mcg_ds, index=close.index)
 
     # Offset
     if offset != 0:
@@ -60,12 +122,8 @@ Calculation:
         offset=0
         c=1
 
-    def mcg_(series):
-        denom = (constant * length * (series.iloc[1] / series.iloc[0]) ** 4)
-        series.iloc[1] = (series.iloc[0] + ((series.iloc[1] - series.iloc[0]) / denom))
-        return series.iloc[1]
-    mcg_cell = close[0:].rolling(2, min_periods=2).apply(mcg_, raw=False)
-    mcg_ds = close[:1].append(mcg_cell[1:])
+    mcgd[0] = close[0]
+    mcgd[i] = mcgd[i-1] + (close[i] - mcgd[i-1]) / (c * length * (close[i] / mcgd[i-1]) ** 4)
 
 Args:
     close (pd.Series): Series of 'close's
@@ -79,4 +137,4 @@ Kwargs:
 
 Returns:
     pd.Series: New feature generated.
-"""
\ No newline at end of file
+"""
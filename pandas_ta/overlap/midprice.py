@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_minmax, verify_series
 
 
 def midprice(high, low, length=None, talib=None, offset=None, **kwargs):
@@ -21,8 +21,8 @@ def midprice(high, low, length=None, talib=None, offset=None, **kwargs):
         from talib import MIDPRICE
         midprice = MIDPRICE(high, low, length)
     else:
-        lowest_low = low.rolling(length, min_periods=min_periods).min()
-        highest_high = high.rolling(length, min_periods=min_periods).max()
+        lowest_low = rolling_minmax(low, length, min_periods)[1]
+        highest_high = rolling_minmax(high, length, min_periods)[0]
         midprice = 0.5 * (lowest_low + highest_high)
 
     # Offset
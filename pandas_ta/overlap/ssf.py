@@ -3,7 +3,7 @@ from numpy import cos as npCos
 from numpy import exp as npExp
 from numpy import pi as npPi
 from numpy import sqrt as npSqrt
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, iir, iir_state, verify_series
 
 
 def ssf(close, length=None, poles=None, offset=None, **kwargs):
@@ -17,9 +17,6 @@ def ssf(close, length=None, poles=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    m = close.size
-    ssf = close.copy()
-
     if poles == 3:
         x = npPi / length # x = PI / n
         a0 = npExp(-x) # e^(-x)
@@ -31,18 +28,18 @@ def ssf(close, length=None, poles=None, offset=None, **kwargs):
         c2 = c0 + b0 # e^(-2x) + 2e^(-x)*cos(3^(.5) * x)
         c1 = 1 - c2 - c3 - c4
 
-        for i in range(0, m):
-            ssf.iloc[i] = c1 * close.iloc[i] + c2 * ssf.iloc[i - 1] + c3 * ssf.iloc[i - 2] + c4 * ssf.iloc[i - 3]
-
     else: # poles == 2
         x = npPi * npSqrt(2) / length # x = PI * 2^(.5) / n
         a0 = npExp(-x) # e^(-x)
-        a1 = -a0 * a0 # -e^(-2x)
-        b1 = 2 * a0 * npCos(x) # 2e^(-x)*cos(x)
-        c1 = 1 - a1 - b1 # e^(-2x) - 2e^(-x)*cos(x) + 1
-
-        for i in range(0, m):
-            ssf.iloc[i] = c1 * close.iloc[i] + b1 * ssf.iloc[i - 1] + a1 * ssf.iloc[i - 2]
+        c3 = -a0 * a0 # -e^(-2x)
+        c2 = 2 * a0 * npCos(x) # 2e^(-x)*cos(x)
+        c1 = 1 - c3 - c2 # e^(-2x) - 2e^(-x)*cos(x) + 1
+        c4 = 0.0
+
+    # The first bars wrap around to the last closes
+    b, a = [c1], [1, -c2, -c3, -c4][:poles + 1]
+    state = iir_state(b, a, y=close.to_numpy(dtype=float)[-poles:])
+    ssf, _ = iir(close, b, a, state)
 
     # Offset
     if offset != 0:
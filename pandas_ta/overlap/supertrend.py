@@ -1,9 +1,42 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
+from numpy import int64 as npInt64
 from numpy import nan as npNaN
+from numpy import ones as npOnes
+from numpy import zeros as npZeros
 from pandas import DataFrame
 from pandas_ta.overlap import hl2
 from pandas_ta.volatility import atr
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, kernel, verify_series
+
+
+@kernel
+def supertrend_kernel(close, upperband, lowerband):
+    """Supertrend recurrence over the ATR bands. Returns the direction,
+    trend, long and short."""
+    m = len(close)
+    dir_, trend = npOnes(m, dtype=npInt64), npZeros(m)
+    long, short = npFull(m, npNaN), npFull(m, npNaN)
+    upperband, lowerband = upperband.copy(), lowerband.copy()
+
+    for i in range(1, m):
+        if close[i] > upperband[i - 1]:
+            dir_[i] = 1
+        elif close[i] < lowerband[i - 1]:
+            dir_[i] = -1
+        else:
+            dir_[i] = dir_[i - 1]
+            if dir_[i] > 0 and lowerband[i] < lowerband[i - 1]:
+                lowerband[i] = lowerband[i - 1]
+            if dir_[i] < 0 and upperband[i] > upperband[i - 1]:
+                upperband[i] = upperband[i - 1]
+
+        if dir_[i] > 0:
+            trend[i] = long[i] = lowerband[i]
+        else:
+            trend[i] = short[i] = upperband[i]
+
+    return dir_, trend, long, short
 
 
 def supertrend(high, low, close, length=None, multiplier=None, offset=None, **kwargs):
@@ -19,31 +52,16 @@ def supertrend(high, low, close, length=None, multiplier=None, offset=None, **kw
     if high is None or low is None or close is None: return
 
     # Calculate Results
-    m = close.size
-    dir_, trend = [1] * m, [0] * m
-    long, short = [npNaN] * m, [npNaN] * m
-
     hl2_ = hl2(high, low)
     matr = multiplier * atr(high, low, close, length)
     upperband = hl2_ + matr
     lowerband = hl2_ - matr
 
-    for i in range(1, m):
-        if close.iloc[i] > upperband.iloc[i - 1]:
-            dir_[i] = 1
-        elif close.iloc[i] < lowerband.iloc[i - 1]:
-            dir_[i] = -1
-        else:
-            dir_[i] = dir_[i - 1]
-            if dir_[i] > 0 and lowerband.iloc[i] < lowerband.iloc[i - 1]:
-                lowerband.iloc[i] = lowerband.iloc[i - 1]
-            if dir_[i] < 0 and upperband.iloc[i] > upperband.iloc[i - 1]:
-                upperband.iloc[i] = upperband.iloc[i - 1]
-
-        if dir_[i] > 0:
-            trend[i] = long[i] = lowerband.iloc[i]
-        else:
-            trend[i] = short[i] = upperband.iloc[i]
+    dir_, trend, long, short = supertrend_kernel(
+        close.to_numpy(dtype=float),
+        upperband.to_numpy(dtype=float),
+        lowerband.to_numpy(dtype=float),
+    )
 
     # Prepare DataFrame to return
     _props = f"_{length}_{multiplier}"
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, symmetric_triangle, verify_series, weights
+from pandas_ta.utils import fir, get_offset, symmetric_triangle, verify_series
 
 
 def swma(close, length=None, asc=None, offset=None, **kwargs):
@@ -15,8 +15,7 @@ def swma(close, length=None, asc=None, offset=None, **kwargs):
 
     # Calculate Result
     triangle = symmetric_triangle(length, weighted=True)
-    swma = close.rolling(length, min_periods=length).apply(weights(triangle), raw=True)
-    # swma = close.rolling(length).apply(weights(triangle), raw=True)
+    swma = fir(close, triangle)
 
     # Offset
     if offset != 0:
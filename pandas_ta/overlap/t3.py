@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from .ema import ema
+from .ema import ema, ema_chain
 from pandas_ta import Imports
 from pandas_ta.utils import get_offset, verify_series
 
@@ -25,12 +25,16 @@ def t3(close, length=None, a=None, talib=None, offset=None, **kwargs):
         c3 = -6 * a**2 - 3 * a - 3 * a**3
         c4 = a**3 + 3 * a**2 + 3 * a + 1
 
-        e1 = ema(close=close, length=length, **kwargs)
-        e2 = ema(close=e1, length=length, **kwargs)
-        e3 = ema(close=e2, length=length, **kwargs)
-        e4 = ema(close=e3, length=length, **kwargs)
-        e5 = ema(close=e4, length=length, **kwargs)
-        e6 = ema(close=e5, length=length, **kwargs)
+        emas = ema_chain(close, length, 6, **kwargs)
+        if emas is None:
+            e1 = ema(close=close, length=length, **kwargs)
+            e2 = ema(close=e1, length=length, **kwargs)
+            e3 = ema(close=e2, length=length, **kwargs)
+            e4 = ema(close=e3, length=length, **kwargs)
+            e5 = ema(close=e4, length=length, **kwargs)
+            e6 = ema(close=e5, length=length, **kwargs)
+        else:
+            e1, e2, e3, e4, e5, e6 = emas
         t3 = c1 * e6 + c2 * e5 + c3 * e4 + c4 * e3
 
     # Offset
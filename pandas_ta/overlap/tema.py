@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from .ema import ema
+from .ema import ema, ema_chain
 from pandas_ta import Imports
 from pandas_ta.utils import get_offset, verify_series
 
@@ -19,9 +19,13 @@ def tema(close, length=None, talib=None, offset=None, **kwargs):
         from talib import TEMA
         tema = TEMA(close, length)
     else:
-        ema1 = ema(close=close, length=length, **kwargs)
-        ema2 = ema(close=ema1, length=length, **kwargs)
-        ema3 = ema(close=ema2, length=length, **kwargs)
+        emas = ema_chain(close, length, 3, **kwargs)
+        if emas is None:
+            ema1 = ema(close=close, length=length, **kwargs)
+            ema2 = ema(close=ema1, length=length, **kwargs)
+            ema3 = ema(close=ema2, length=length, **kwargs)
+        else:
+            ema1, ema2, ema3 = emas
         tema = 3 * (ema1 - ema2) + ema3
 
     # Offset
@@ -1,7 +1,19 @@
 # -*- coding: utf-8 -*-
 from numpy import nan as npNaN
+from numpy import zeros as npZeros
 from pandas import Series
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import get_drift, get_offset, kernel, verify_series
+
+
+@kernel
+def vidya_kernel(close, abs_cmo, alpha, length):
+    """VIDYA recurrence, an ema scaled by the absolute CMO. Zero until
+    'length'."""
+    m = len(close)
+    vidya = npZeros(m)
+    for i in range(length, m):
+        vidya[i] = alpha * abs_cmo[i] * close[i] + vidya[i - 1] * (1 - alpha * abs_cmo[i])
+    return vidya
 
 
 def vidya(close, length=None, drift=None, offset=None, **kwargs):
@@ -29,12 +41,10 @@ def vidya(close, length=None, drift=None, offset=None, **kwargs):
         return (pos_sum - neg_sum) / (pos_sum + neg_sum)
 
     # Calculate Result
-    m = close.size
     alpha = 2 / (length + 1)
     abs_cmo = _cmo(close, length, drift).abs()
-    vidya = Series(0, index=close.index)
-    for i in range(length, m):
-        vidya.iloc[i] = alpha * abs_cmo.iloc[i] * close.iloc[i] + vidya.iloc[i - 1] * (1 - alpha * abs_cmo.iloc[i])
+    vidya = vidya_kernel(close.to_numpy(dtype=float), abs_cmo.to_numpy(dtype=float), alpha, length)
+    vidya = Series(vidya, index=close.index)
     vidya.replace({0: npNaN}, inplace=True)
 
     # Offset
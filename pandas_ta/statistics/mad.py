@@ -1,24 +1,20 @@
 # -*- coding: utf-8 -*-
-from numpy import fabs as npfabs
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_mad, verify_series
 
 
-def mad(close, length=None, offset=None, **kwargs):
+def mad(close, length=None, median=None, offset=None, **kwargs):
     """Indicator: Mean Absolute Deviation"""
     # Validate Arguments
     length = int(length) if length and length > 0 else 30
     min_periods = int(kwargs["min_periods"]) if "min_periods" in kwargs and kwargs["min_periods"] is not None else length
+    median = bool(median)
     close = verify_series(close, max(length, min_periods))
     offset = get_offset(offset)
 
     if close is None: return
 
     # Calculate Result
-    def mad_(series):
-        """Mean Absolute Deviation"""
-        return npfabs(series - series.mean()).mean()
-
-    mad = close.rolling(length, min_periods=min_periods).apply(mad_, raw=True)
+    mad = rolling_mad(close, length, min_periods, median).copy()
 
     # Offset
     if offset != 0:
@@ -31,7 +27,7 @@ def mad(close, length=None, offset=None, **kwargs):
         mad.fillna(method=kwargs["fill_method"], inplace=True)
 
     # Name & Category
-    mad.name = f"MAD_{length}"
+    mad.name = f"MAD{'m' if median else ''}_{length}"
     mad.category = "statistics"
 
     return mad
@@ -40,19 +36,30 @@ def mad(close, length=None, offset=None, **kwargs):
 mad.__doc__ = \
 """Rolling Mean Absolute Deviation
 
+The average distance of the values of the period from their mean or, with
+'median', the Median Absolute Deviation from their median, which is robust
+to outliers. Scaled by 1.4826, it estimates the standard deviation of
+normally distributed values for robust z scores.
+
 Sources:
+    https://en.wikipedia.org/wiki/Average_absolute_deviation
+    https://en.wikipedia.org/wiki/Median_absolute_deviation
 
 Calculation:
     Default Inputs:
-        length=30
+        length=30, median=False
     mad = close.rolling(length).mad()
+    if median:
+        mad = close.rolling(length).apply(median(abs(x - median(x))))
 
 Args:
     close (pd.Series): Series of 'close's
     length (int): It's period. Default: 30
+    median (bool): Median Absolute Deviation. Default: False
     offset (int): How many periods to offset the result. Default: 0
 
 Kwargs:
+    min_periods (int, optional): Values required for a result. Default: length
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
 
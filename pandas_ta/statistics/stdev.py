@@ -2,9 +2,10 @@
 from numpy import sqrt as npsqrt
 from .variance import variance
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import cached, get_offset, verify_series
 
 
+@cached
 def stdev(close, length=None, ddof=None, talib=None, offset=None, **kwargs):
     """Indicator: Standard Deviation"""
     # Validate Arguments
@@ -0,0 +1,1621 @@
+# -*- coding: utf-8 -*-
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+from inspect import signature
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+from math import isfinite, isnan, log, sqrt
+from sys import float_info as sflt
+from threading import RLock
+
+from numpy import abs as npAbs
+from numpy import array as npArray
+from numpy import concatenate as npConcatenate
+from numpy import flatnonzero as npFlatnonzero
+from numpy import full as npFull
+from numpy import generic as npGeneric
+from numpy import inf as npInf
+from numpy import isnan as npIsnan
+from numpy import maximum as npMaximum
+from numpy import minimum as npMinimum
+from numpy import nanmax as npNanmax
+from numpy import nanmin as npNanmin
+from numpy import nansum as npNansum
+from numpy import ndarray as npNdarray
+from numpy import ndim as npNdim
+from numpy import nan as npNaN
+from numpy import where as npWhere
+from numpy import zeros as npZeros
+from pandas import Series, Timestamp
+
+from pandas_ta import Imports
+from pandas_ta.engine import RENAME_KWARGS
+from pandas_ta.overlap.jma import JMA as _JMA
+from pandas_ta.overlap.jma import JMA_STATE, jma_kernel
+from pandas_ta.overlap.kama import kama
+from pandas_ta.overlap.mcgd import MCGD as _MCGD
+from pandas_ta.overlap.mcgd import mcgd_kernel
+from pandas_ta.overlap.supertrend import supertrend
+from pandas_ta.overlap.vidya import vidya
+from pandas_ta.sweep import sweep_params
+from pandas_ta.trend.psar import psar
+from pandas_ta.utils import call_key, get_drift
+
+# TA Lib's test of zero, TA_IS_ZERO
+TAL_EPSILON = 1e-14
+
+
+class Stream(ABC):
+    """Streaming Indicator
+
+    The state of an indicator, updated a bar at a time in constant time for
+    live data. Once warmed up, its values are those of the indicator's
+    function over the same bars, to rounding, in the same mode: TA Lib's
+    when installed unless talib=False. The bars are expected without gaps,
+    and leading NaNs are skipped as TA Lib does.
+
+    >>> rsi = ta.stream.RSI(length=14).seed(df["close"])
+    >>> value = rsi.update(close)
+
+    A Stream takes the sources named by 'inputs', a float each, and returns
+    a float or, for several columns, a tuple of them. Its checkpoint() is
+    JSON that restore() continues from in another process.
+    """
+
+    __slots__ = ()
+    inputs = ("close",)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({', '.join(self.columns)})"
+
+    @property
+    @abstractmethod
+    def columns(self) -> list:
+        """The names of the values, those of the indicator's columns."""
+
+    @property
+    def lookback(self) -> int:
+        """The last bars that seed() needs, None for all of them."""
+        return None
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Clears the state."""
+
+    @abstractmethod
+    def update(self, *bar):
+        """Returns the values of the next bar."""
+
+    def seed(self, *sources, values: list = None):
+        """Resets the state and updates it with the bars of the 'sources',
+        the Series or arrays of a batch run, to continue from them. Returns
+        itself.
+
+        Recursive Streams compute their state over all the bars at once,
+        rather than a bar at a time, and some continue from 'values', the
+        arrays of their columns in the batch run, None for those it did not
+        keep."""
+        self.reset()
+        values = [npArray(s, dtype=float) for s in sources]
+        start = 0 if self.lookback is None else max(values[0].size - self.lookback, 0)
+        for bar in zip(*[v[start:].tolist() for v in values]):
+            self.update(*bar)
+        return self
+
+    def checkpoint(self) -> dict:
+        """Returns the state, of JSON types, for restore() to continue the
+        Stream where it stopped, in another process."""
+        return _encode(self)
+
+    def dumps(self) -> str:
+        """Returns the checkpoint() as JSON."""
+        return jsonDumps(self.checkpoint())
+
+
+class EWM(object):
+    """pandas' ewm(alpha, adjust, min_periods).mean(), a value at a time"""
+
+    __slots__ = ("alpha", "adjust", "min_periods", "weighted", "old_wt", "nobs")
+
+    def __init__(self, alpha: float, adjust: bool = True, min_periods: int = 0):
+        self.alpha = alpha
+        self.adjust = adjust
+        self.min_periods = min_periods
+        self.weighted, self.old_wt, self.nobs = npNaN, 1.0, 0
+
+    def update(self, value: float) -> float:
+        observed = value == value
+        self.nobs += observed
+        if self.weighted == self.weighted:
+            self.old_wt *= 1 - self.alpha
+            if observed:
+                new_wt = 1.0 if self.adjust else self.alpha
+                # avoid numerical errors on constant series
+                if self.weighted != value:
+                    self.weighted = (self.old_wt * self.weighted + new_wt * value) / (self.old_wt + new_wt)
+                self.old_wt = self.old_wt + new_wt if self.adjust else 1.0
+        elif observed:
+            self.weighted = value
+        return self.weighted if self.nobs >= self.min_periods else npNaN
+
+    def seed(self, values, weighted: float = None):
+        """Sets the state to that after the 'values' array, by pandas' ewm()
+        unless its last 'weighted' mean is given. Returns itself."""
+        values = npArray(values, dtype=float)
+        observed = npFlatnonzero(values == values)
+        self.nobs = observed.size
+        if not observed.size:
+            self.weighted, self.old_wt = npNaN, 1.0
+            return self
+        if weighted is None or weighted != weighted:
+            weighted = Series(values).ewm(alpha=self.alpha, adjust=self.adjust).mean().iat[-1]
+        # Decayed every bar after the first observation, and with 'adjust'
+        # the sum of the weights of the observations
+        decays = (1 - self.alpha) ** (values.size - 1 - observed)
+        self.weighted = float(weighted)
+        self.old_wt = float(decays.sum()) if self.adjust else float(decays[-1])
+        return self
+
+
+class SMA(Stream):
+    """Simple Moving Average, see sma()
+
+    Args:
+        length (int): It's period. Default: 10
+        talib (bool): TA Lib's mode when installed. Default: True
+
+    Kwargs:
+        min_periods (int): Without TA Lib. Default: length
+    """
+
+    __slots__ = ("length", "min_periods", "window", "total", "since")
+
+    def __init__(self, length: int = None, talib: bool = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 10
+        min_periods = kwargs.get("min_periods")
+        self.min_periods = self.length if _mode_tal(talib) or min_periods is None else int(min_periods)
+        self.reset()
+
+    @property
+    def columns(self) -> list:
+        return [f"SMA_{self.length}"]
+
+    @property
+    def lookback(self) -> int:
+        return self.length
+
+    def reset(self) -> None:
+        self.window = deque(maxlen=self.length)
+        self.total, self.since = 0.0, 0
+
+    def update(self, close: float) -> float:
+        if not self.window and isnan(close): return npNaN
+        self.total, self.since = _slide(self.window, close, self.total, self.since)
+        count = len(self.window)
+        return self.total / count if count >= self.min_periods else npNaN
+
+
+class EMA(Stream):
+    """Exponential Moving Average, see ema()
+
+    Args:
+        length (int): It's period. Default: 10
+        talib (bool): TA Lib's mode when installed. Default: True
+
+    Kwargs:
+        adjust (bool): Without TA Lib. Default: False
+        sma (bool): Without TA Lib, seeds with the sma of the first 'length'
+            values. Default: True
+    """
+
+    __slots__ = ("length", "mode_tal", "sma", "ewm", "count", "valid", "total", "value")
+
+    def __init__(self, length: int = None, talib: bool = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 10
+        self.mode_tal = _mode_tal(talib)
+        self.sma = self.mode_tal or kwargs.get("sma", True)
+        self.ewm = EWM(2.0 / (self.length + 1), bool(kwargs.get("adjust", False)) and not self.mode_tal)
+        self.reset()
+
+    @property
+    def columns(self) -> list:
+        return [f"EMA_{self.length}"]
+
+    def reset(self) -> None:
+        self.ewm.weighted, self.ewm.old_wt, self.ewm.nobs = npNaN, 1.0, 0
+        self.count, self.valid, self.total, self.value = 0, 0, 0.0, npNaN
+
+    def update(self, close: float) -> float:
+        if self.mode_tal:
+            if not self.count and isnan(close): return npNaN
+            self.count += 1
+            if self.count <= self.length:
+                self.total += close
+                if self.count < self.length: return npNaN
+                self.value = self.total / self.length
+            else:
+                self.value = (close - self.value) * self.ewm.alpha + self.value
+            return self.value
+
+        # The sma seed is the mean of the values among the first 'length'
+        if self.sma and self.count < self.length:
+            self.count += 1
+            if close == close:
+                self.total += close
+                self.valid += 1
+            if self.count < self.length: return npNaN
+            close = self.total / self.valid if self.valid else npNaN
+        return self.ewm.update(close)
+
+    def seed(self, close, values: list = None):
+        self.reset()
+        x = npArray(close, dtype=float)
+        last = _last(values, 0)
+        if self.mode_tal:
+            x = _trim(x)
+            if x.size <= self.length: return Stream.seed(self, x)
+            self.count, self.total = x.size, float(x[:self.length].sum())
+            self.value = last if last == last else float(_tal_ewm(x, self.ewm.alpha, self.length)[-1])
+            return self
+
+        if self.sma:
+            if x.size < self.length: return Stream.seed(self, x)
+            head = x[:self.length]
+            self.count, self.valid = self.length, int((head == head).sum())
+            self.total = float(npNansum(head))
+            mean = self.total / self.valid if self.valid else npNaN
+            x = npConcatenate(([mean], x[self.length:]))
+        self.ewm.seed(x, last)
+        return self
+
+
+class RMA(Stream):
+    """wildeR's Moving Average, see rma()
+
+    Args:
+        length (int): It's period. Default: 10
+    """
+
+    __slots__ = ("length", "ewm")
+
+    def __init__(self, length: int = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 10
+        self.reset()
+
+    @property
+    def columns(self) -> list:
+        return [f"RMA_{self.length}"]
+
+    def reset(self) -> None:
+        self.ewm = EWM(1.0 / self.length, True, self.length)
+
+    def update(self, close: float) -> float:
+        return self.ewm.update(close)
+
+    def seed(self, close, values: list = None):
+        self.reset()
+        self.ewm.seed(close, _last(values, 0))
+        return self
+
+
+class RSI(Stream):
+    """Relative Strength Index, see rsi()
+
+    Args:
+        length (int): It's period. Default: 14
+        scalar (float): How much to magnify, without TA Lib. Default: 100
+        talib (bool): TA Lib's mode when installed. Default: True
+        drift (int): The difference period, without TA Lib. Default: 1
+    """
+
+    __slots__ = ("length", "scalar", "mode_tal", "drift", "closes", "count", "gain", "loss", "gains", "losses")
+
+    def __init__(self, length: int = None, scalar: float = None, talib: bool = None, drift: int = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 14
+        self.scalar = float(scalar) if scalar else 100
+        self.mode_tal = _mode_tal(talib)
+        self.drift = 1 if self.mode_tal else get_drift(drift)
+        self.reset()
+
+    @property
+    def columns(self) -> list:
+        return [f"RSI_{self.length}"]
+
+    def reset(self) -> None:
+        self.closes = deque(maxlen=self.drift)
+        self.count, self.gain, self.loss = 0, 0.0, 0.0
+        self.gains, self.losses = RMA(self.length), RMA(self.length)
+
+    def update(self, close: float) -> float:
+        closes = self.closes
+        if not closes and isnan(close): return npNaN
+        change = close - closes[0] if len(closes) == self.drift else npNaN
+        closes.append(close)
+
+        if not self.mode_tal:
+            gain = self.gains.update(max(change, 0.0) if change == change else change)
+            loss = self.losses.update(min(change, 0.0) if change == change else change)
+            total = gain + abs(loss)
+            return self.scalar * gain / total if total != 0 else npNaN
+
+        # TA Lib seeds Wilder's averages with those of the first changes
+        if change != change: return npNaN
+        length = self.length
+        self.count += 1
+        if self.count > length:
+            self.gain *= length - 1
+            self.loss *= length - 1
+        if change < 0:
+            self.loss -= change
+        else:
+            self.gain += change
+        if self.count < length: return npNaN
+        self.gain /= length
+        self.loss /= length
+        total = self.gain + self.loss
+        return 100 * (self.gain / total) if not -TAL_EPSILON < total < TAL_EPSILON else 0.0
+
+    def seed(self, close, values: list = None):
+        self.reset()
+        x = _trim(npArray(close, dtype=float))
+        self.closes.extend(x[-self.drift:].tolist())
+        change = npFull(x.size, npNaN)
+        change[self.drift:] = x[self.drift:] - x[:-self.drift]
+        if not self.mode_tal:
+            self.gains.ewm.seed(npMaximum(change, 0.0))
+            self.losses.ewm.seed(npMinimum(change, 0.0))
+            return self
+
+        change = change[change == change]
+        gains, losses = npMaximum(change, 0.0), -npMinimum(change, 0.0)
+        self.count = change.size
+        if self.count < self.length:
+            self.gain, self.loss = float(gains.sum()), float(losses.sum())
+        else:
+            self.gain = float(_tal_ewm(gains, 1.0 / self.length, self.length)[-1])
+            self.loss = float(_tal_ewm(losses, 1.0 / self.length, self.length)[-1])
+        return self
+
+
+class MACD(Stream):
+    """Moving Average, Convergence/Divergence, see macd()
+
+    Args:
+        fast (int): The short period. Default: 12
+        slow (int): The long period. Default: 26
+        signal (int): The signal period. Default: 9
+        talib (bool): TA Lib's mode when installed. Default: True
+
+    Returns:
+        tuple: MACD, histogram and signal.
+    """
+
+    __slots__ = ("fast", "slow", "signal", "mode_tal", "emas", "count", "totals", "values")
+
+    def __init__(self, fast: int = None, slow: int = None, signal: int = None, talib: bool = None, **kwargs):
+        self.fast = int(fast) if fast and fast > 0 else 12
+        self.slow = int(slow) if slow and slow > 0 else 26
+        self.signal = int(signal) if signal and signal > 0 else 9
+        if self.slow < self.fast:
+            self.fast, self.slow = self.slow, self.fast
+        self.mode_tal = _mode_tal(talib)
+        self.reset()
+
+    @property
+    def columns(self) -> list:
+        _props = f"_{self.fast}_{self.slow}_{self.signal}"
+        return [f"MACD{_props}", f"MACDh{_props}", f"MACDs{_props}"]
+
+    def reset(self) -> None:
+        self.emas = [EMA(self.fast), EMA(self.slow), EMA(self.signal)]
+        self.count, self.totals, self.values = 0, [0.0, 0.0, 0.0], [npNaN, npNaN, npNaN]
+
+    def update(self, close: float) -> tuple:
+        if not self.mode_tal:
+            fastma, slowma, signalma = self.emas
+            macd = fastma.update(close) - slowma.update(close)
+            # The signal starts from the first MACD
+            if not signalma.count and isnan(macd): return macd, npNaN, npNaN
+            signal = signalma.update(macd)
+            return macd, macd - signal, signal
+
+        # TA Lib seeds the fast ema from the last 'fast' closes of the slow
+        # one's seed, and the signal from the first 'signal' MACDs
+        if not self.count and isnan(close): return npNaN, npNaN, npNaN
+        fast, slow, signal = self.fast, self.slow, self.signal
+        totals, values = self.totals, self.values
+        self.count += 1
+        if self.count <= slow:
+            totals[1] += close
+            if self.count > slow - fast:
+                totals[0] += close
+            if self.count < slow: return npNaN, npNaN, npNaN
+            values[0], values[1] = totals[0] / fast, totals[1] / slow
+        else:
+            values[0] = (close - values[0]) * (2.0 / (fast + 1)) + values[0]
+            values[1] = (close - values[1]) * (2.0 / (slow + 1)) + values[1]
+
+        macd = values[0] - values[1]
+        count = self.count - slow + 1
+        if count <= signal:
+            totals[2] += macd
+            if count < signal: return npNaN, npNaN, npNaN
+            values[2] = totals[2] / signal
+        else:
+            values[2] = (macd - values[2]) * (2.0 / (signal + 1)) + values[2]
+        return macd, macd - values[2], values[2]
+
+    def seed(self, close, values: list = None):
+        self.reset()
+        x = npArray(close, dtype=float)
+        if not self.mode_tal:
+            fastma, slowma, signalma = self.emas
+            macd = _ema_values(fastma, x) - _ema_values(slowma, x)
+            fastma.seed(x)
+            slowma.seed(x)
+            signalma.seed(_trim(macd), values=[_column(values, 2)])
+            return self
+
+        x = _trim(x)
+        fast, slow, signal = self.fast, self.slow, self.signal
+        if x.size < slow + signal: return Stream.seed(self, x)
+        fastma = _tal_ewm(x[slow - fast:], 2.0 / (fast + 1), fast)
+        slowma = _tal_ewm(x, 2.0 / (slow + 1), slow)
+        macd = fastma - slowma
+        self.count = x.size
+        self.totals = [float(x[slow - fast:slow].sum()), float(x[:slow].sum()), float(macd[:signal].sum())]
+        self.values = [float(fastma[-1]), float(slowma[-1]), float(_tal_ewm(macd, 2.0 / (signal + 1), signal)[-1])]
+        return self
+
+
+class STDEV(Stream):
+    """Standard Deviation, see stdev()
+
+    Args:
+        length (int): It's period. Default: 30
+        ddof (int): Delta Degrees of Freedom, without TA Lib. Default: 1
+        talib (bool): TA Lib's mode when installed. Default: True
+    """
+
+    __slots__ = ("length", "ddof", "window", "total", "squares", "since")
+
+    def __init__(self, length: int = None, ddof: int = None, talib: bool = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 30
+        self.ddof = int(ddof) if isinstance(ddof, int) and 0 <= ddof < self.length else 1
+        # Its variance is TA Lib's, of the population, when installed
+        if Imports["talib"]: self.ddof = 0
+        self.reset()
+
+    @property
+    def columns(self) -> list:
+        return [f"STDEV_{self.length}"]
+
+    @property
+    def lookback(self) -> int:
+        return self.length
+
+    def reset(self) -> None:
+        self.window = deque(maxlen=self.length)
+        self.total, self.squares, self.since = 0.0, 0.0, 0
+
+    def update(self, close: float) -> float:
+        if not self.window and isnan(close): return npNaN
+        self.total, self.squares, self.since = _slide_squares(self.window, close, self.total, self.squares, self.since)
+        if len(self.window) < self.length: return npNaN
+        return _deviation(self.total, self.squares, self.length, self.ddof)
+
+
+class BBANDS(Stream):
+    """Bollinger Bands, see bbands()
+
+    Args:
+        length (int): The short period. Default: 5
+        std (int): The long period. Default: 2
+        ddof (int): Degrees of Freedom to use, without TA Lib. Default: 0
+        mamode (str): "sma", "ema" or "rma". Default: "sma"
+        talib (bool): TA Lib's mode when installed. Default: True
+
+    Returns:
+        tuple: lower, mid, upper, bandwidth and percent.
+    """
+
+    __slots__ = ("length", "std", "ddof", "mamode", "mode_tal", "ma", "window", "total", "squares", "since")
+
+    def __init__(self, length: int = None, std: float = None, ddof: int = 0, mamode: str = None, talib: bool = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 5
+        self.std = float(std) if std and std > 0 else 2.0
+        self.mamode = mamode.lower() if isinstance(mamode, str) else "sma"
+        self.ddof = int(ddof) if ddof >= 0 and ddof < self.length else 1
+        self.mode_tal = _mode_tal(talib)
+        # stdev() is TA Lib's, of the population, when installed
+        if Imports["talib"]: self.ddof = 0
+        self.reset()
+
+    @property
+    def columns(self) -> list:
+        _props = f"_{self.length}_{self.std}"
+        return [f"BBL{_props}", f"BBM{_props}", f"BBU{_props}", f"BBB{_props}", f"BBP{_props}"]
+
+    def reset(self) -> None:
+        if self.mode_tal:
+            self.ma = EMA(self.length) if self.mamode == "ema" else SMA(self.length)
+        else:
+            self.ma = MAMODES.get(self.mamode, EMA)(self.length)
+        self.window = deque(maxlen=self.length)
+        self.total, self.squares, self.since = 0.0, 0.0, 0
+
+    def update(self, close: float) -> tuple:
+        mid = self.ma.update(close)
+        if not self.window and isnan(close): return (npNaN,) * 5
+        self.total, self.squares, self.since = _slide_squares(self.window, close, self.total, self.squares, self.since)
+        if len(self.window) < self.length or mid != mid: return (npNaN,) * 5
+
+        deviations = self.std * _deviation(self.total, self.squares, self.length, self.ddof)
+        lower, upper = mid - deviations, mid + deviations
+        ulr = _non_zero(upper - lower)
+        return lower, mid, upper, 100 * ulr / mid if mid else npNaN, _non_zero(close - lower) / ulr
+
+    def seed(self, close, values: list = None):
+        self.reset()
+        x = npArray(close, dtype=float)
+        self.ma.seed(x, values=[_column(values, 1)])
+        # The window of the deviation, as STDEV's lookback
+        for value in x[-self.length:].tolist():
+            if not self.window and isnan(value): continue
+            self.total, self.squares, self.since = _slide_squares(self.window, value, self.total, self.squares, self.since)
+        return self
+
+
+class TRUE_RANGE(Stream):
+    """True Range, see true_range()
+
+    Args:
+        talib (bool): TA Lib's mode when installed. Default: True
+        drift (int): The shift period, without TA Lib. Default: 1
+    """
+
+    __slots__ = ("drift", "mode_tal", "closes")
+    inputs = ("high", "low", "close")
+
+    def __init__(self, talib: bool = None, drift: int = None, **kwargs):
+        self.mode_tal = _mode_tal(talib)
+        self.drift = 1 if self.mode_tal else get_drift(drift)
+        self.reset()
+
+    @property
+    def columns(self) -> list:
+        return [f"TRUERANGE_{self.drift}"]
+
+    @property
+    def lookback(self) -> int:
+        return self.drift
+
+    def reset(self) -> None:
+        self.closes = deque(maxlen=self.drift)
+
+    def update(self, high: float, low: float, close: float) -> float:
+        closes = self.closes
+        if not closes and isnan(close): return npNaN
+        prev_close = closes[0] if len(closes) == self.drift else npNaN
+        closes.append(close)
+        if prev_close != prev_close: return npNaN
+
+        high_low_range = high - low if self.mode_tal else _non_zero(high - low)
+        return max(abs(high_low_range), abs(high - prev_close), abs(prev_close - low))
+
+
+class ATR(Stream):
+    """Average True Range, see atr()
+
+    Args:
+        length (int): It's period. Default: 14
+        mamode (str): "sma", "ema" or "rma", without TA Lib. Default: "rma"
+        talib (bool): TA Lib's mode when installed. Default: True
+        drift (int): The difference period. Default: 1
+
+    Kwargs:
+        percent (bool): Return as percentage. Default: False
+    """
+
+    __slots__ = ("length", "mamode", "mode_tal", "drift", "percent", "tr", "ma", "count", "value")
+    inputs = ("high", "low", "close")
+
+    def __init__(self, length: int = None, mamode: str = None, talib: bool = None, drift: int = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 14
+        self.mamode = mamode.lower() if mamode and isinstance(mamode, str) else "rma"
+        self.mode_tal = _mode_tal(talib)
+        self.drift = get_drift(drift)
+        self.percent = bool(kwargs.get("percent", False))
+        self.reset()
+
+    @property
+    def columns(self) -> list:
+        return [f"ATR{self.mamode[0]}_{self.length}{'p' if self.percent else ''}"]
+
+    def reset(self) -> None:
+        if self.mode_tal:
+            self.tr, self.ma = TRUE_RANGE(talib=True), None
+        else:
+            self.tr, self.ma = TRUE_RANGE(drift=self.drift), MAMODES.get(self.mamode, EMA)(self.length)
+        self.count, self.value = 0, npNaN
+
+    def update(self, high: float, low: float, close: float) -> float:
+        tr = self.tr.update(high, low, close)
+        if self.ma is not None:
+            atr = self.ma.update(tr)
+        else:
+            # TA Lib seeds Wilder's average with that of the first ranges
+            atr, length = npNaN, self.length
+            if tr == tr:
+                self.count += 1
+                if self.count <= length:
+                    self.value = (0.0 if self.count == 1 else self.value) + tr
+                    if self.count == length:
+                        self.value /= length
+                        atr = self.value
+                else:
+                    self.value = (self.value * (length - 1) + tr) / length
+                    atr = self.value
+        return atr * 100 / close if self.percent else atr
+
+    def seed(self, high, low, close, values: list = None):
+        self.reset()
+        high, low, close = npArray(high, dtype=float), npArray(low, dtype=float), npArray(close, dtype=float)
+        tr = _true_ranges(self.tr, high, low, close)
+        self.tr.seed(high, low, close)
+        values = None if self.percent else values
+        if self.ma is not None:
+            self.ma.seed(tr, values=values)
+            return self
+
+        tr = tr[tr == tr]
+        self.count = tr.size
+        if self.count < self.length:
+            self.value = float(tr.sum()) if self.count else npNaN
+        else:
+            last = _last(values, 0)
+            self.value = last if last == last else float(_tal_ewm(tr, 1.0 / self.length, self.length)[-1])
+        return self
+
+
+class MOM(Stream):
+    """Momentum, see mom()
+
+    Args:
+        length (int): It's period. Default: 10
+        talib (bool): TA Lib's mode when installed. Default: True
+    """
+
+    __slots__ = ("length", "window")
+
+    def __init__(self, length: int = None, talib: bool = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 10
+        self.reset()
+
+    @property
+    def columns(self) -> list:
+        return [f"MOM_{self.length}"]
+
+    @property
+    def lookback(self) -> int:
+        return self.length + 1
+
+    def reset(self) -> None:
+        self.window = deque(maxlen=self.length + 1)
+
+    def update(self, close: float) -> float:
+        if not self.window and isnan(close): return npNaN
+        self.window.append(close)
+        return close - self.window[0] if len(self.window) > self.length else npNaN
+
+
+class ROC(Stream):
+    """Rate of Change, see roc()
+
+    Args:
+        length (int): It's period. Default: 10
+        scalar (float): How much to magnify, without TA Lib. Default: 100
+        talib (bool): TA Lib's mode when installed. Default: True
+    """
+
+    __slots__ = ("length", "scalar", "mode_tal", "window")
+
+    def __init__(self, length: int = None, scalar: float = None, talib: bool = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 10
+        self.scalar = float(scalar) if scalar and scalar > 0 else 100
+        self.mode_tal = _mode_tal(talib)
+        self.reset()
+
+    @property
+    def columns(self) -> list:
+        return [f"ROC_{self.length}"]
+
+    @property
+    def lookback(self) -> int:
+        return self.length + 1
+
+    def reset(self) -> None:
+        self.window = deque(maxlen=self.length + 1)
+
+    def update(self, close: float) -> float:
+        if not self.window and isnan(close): return npNaN
+        self.window.append(close)
+        if len(self.window) <= self.length: return npNaN
+        prev_close = self.window[0]
+        if self.mode_tal:
+            return (close / prev_close - 1.0) * 100.0 if prev_close != 0 else 0.0
+        change = close - prev_close
+        if prev_close == 0:
+            return change * npInf if change != 0 else npNaN
+        return self.scalar * change / prev_close
+
+
+@lru_cache(maxsize=None)
+def _jma_constants(_length: int, phase: float) -> tuple:
+    """JMA's static variables, as jma_kernel() computes them: pr, pow1, bet,
+    beta and max_volty."""
+    length = 0.5 * (_length - 1)
+    pr = 0.5 if phase < -100 else 2.5 if phase > 100 else 1.5 + phase * 0.01
+    length1 = max((log(sqrt(length)) / log(2.0)) + 2.0, 0) if length > 0 else 0.0
+    pow1 = max(length1 - 2.0, 0.5)
+    length2 = length1 * sqrt(length)
+    bet = length2 / (length2 + 1)
+    beta = 0.45 * (_length - 1) / (0.45 * (_length - 1) + 2.0)
+    max_volty = length1 ** (1 / pow1)
+    return pr, pow1, bet, beta, max_volty
+
+
+def _kernel_update(stream, cls, values):
+    """Updates 'stream' by the Kernel of 'cls' with a sequence of values,
+    keeping its state a list for the scalar updates."""
+    stream.state = npArray(stream.state, dtype=float)
+    result = cls.update(stream, values)
+    stream.state = stream.state.tolist()
+    return result
+
+
+class JMA(_JMA, Stream):
+    """Jurik Moving Average, see jma() and ta.JMA
+
+    A value is updated in Python floats, as jma_kernel() does, and a
+    sequence of values by the Kernel."""
+
+    __slots__ = ()
+
+    @property
+    def columns(self) -> list:
+        return [f"JMA_{self.length}_{self.phase}"]
+
+    def reset(self) -> None:
+        self.state = [0.0] * JMA_STATE
+
+    def seed(self, close, values: list = None):
+        _, state = jma_kernel(npArray(close, dtype=float), self.length, self.phase, npZeros(JMA_STATE))
+        self.state = npArray(state, dtype=float).tolist()
+        return self
+
+    def update(self, close):
+        if hasattr(close, "__len__") and npNdim(close) != 0:
+            return _kernel_update(self, _JMA, close)
+
+        state = self.state if isinstance(self.state, list) else self._list()
+        i = int(state[0])
+        if i == 0:
+            state[0], state[1] = 1.0, close
+            state[2] = state[3] = state[6] = close
+            return close if self.length <= 1 else npNaN
+
+        pr, pow1, bet, beta, max_volty = _jma_constants(self.length, self.phase)
+        ma1, uBand, lBand, det0, det1, jma, v_sum, v_total = state[1:9]
+
+        # Price volatility
+        del1, del2 = close - uBand, close - lBand
+        abs1, abs2 = abs(del1), abs(del2)
+        volty = (abs2 if abs2 > abs1 else abs1) if abs1 != abs2 else 0.0
+
+        # Relative price volatility factor
+        k = 9 + i % 10
+        v_sum += (volty - state[k]) / 10
+        state[k] = volty
+        k = 19 + i % 66
+        v_total += v_sum - state[k]
+        state[k] = v_sum
+        avg_volty = v_total / (i + 1 if i < 66 else 66)
+        d_volty = 0 if avg_volty == 0 else volty / avg_volty
+        r_volty = d_volty if d_volty < max_volty else max_volty
+        r_volty = r_volty if r_volty > 1.0 else 1.0
+
+        # Jurik volatility bands, dynamic factor and the three stages
+        power = r_volty ** pow1
+        kv = bet ** sqrt(power)
+        uBand = close if (del1 > 0) else close - (kv * del1)
+        lBand = close if (del2 < 0) else close - (kv * del2)
+        alpha = beta ** power
+        ma1 = ((1 - alpha) * close) + (alpha * ma1)
+        det0 = ((close - ma1) * (1 - beta)) + (beta * det0)
+        ma2 = ma1 + pr * det0
+        det1 = ((ma2 - jma) * (1 - alpha) * (1 - alpha)) + (alpha * alpha * det1)
+        jma = jma + det1
+
+        state[0:9] = i + 1.0, ma1, uBand, lBand, det0, det1, jma, v_sum, v_total
+        return jma if i >= self.length - 1 else npNaN
+
+    def _list(self) -> list:
+        """The state, restored as an array, as the list update() keeps."""
+        self.state = npArray(self.state, dtype=float).tolist()
+        return self.state
+
+
+class MCGD(_MCGD, Stream):
+    """McGinley Dynamic, see mcgd() and ta.MCGD
+
+    A value is updated in Python floats, as mcgd_kernel() does, and a
+    sequence of values by the Kernel."""
+
+    __slots__ = ()
+
+    @property
+    def columns(self) -> list:
+        return [f"MCGD_{self.length}"]
+
+    def reset(self) -> None:
+        self.state = [0.0] * 3
+
+    def seed(self, close, values: list = None):
+        _, state = mcgd_kernel(npArray(close, dtype=float), self.length, self.c, npZeros(3))
+        self.state = npArray(state, dtype=float).tolist()
+        return self
+
+    def update(self, close):
+        if hasattr(close, "__len__") and npNdim(close) != 0:
+            return _kernel_update(self, _MCGD, close)
+
+        i, prev, last = self.state
+        if i == 0 or close != close or last != last:
+            # The first close, or a restart after a NaN
+            self.state = [i + 1, close, close]
+            return close if i == 0 else npNaN
+
+        # IEEE results, like NumPy's, of zero divisors and overflows
+        ratio = close / prev if prev != 0 else close * npInf
+        ratio *= ratio
+        denom = self.c * self.length * ratio * ratio
+        prev += (close - prev) / denom if denom != 0 else (close - prev) * npInf
+        self.state = [i + 1, prev, close]
+        return prev
+
+
+class KAMA(Stream):
+    """Kaufman's Adaptive Moving Average, see kama()
+
+    Args:
+        length (int): It's period. Default: 10
+        fast (int): Fast MA period. Default: 2
+        slow (int): Slow MA period. Default: 30
+        drift (int): The difference period. Default: 1
+    """
+
+    __slots__ = ("length", "fast", "slow", "drift", "closes", "diffs", "total", "since", "value")
+
+    def __init__(self, length: int = None, fast: int = None, slow: int = None, drift: int = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 10
+        self.fast = int(fast) if fast and fast > 0 else 2
+        self.slow = int(slow) if slow and slow > 0 else 30
+        self.drift = get_drift(drift)
+        self.reset()
+
+    @property
+    def columns(self) -> list:
+        return [f"KAMA_{self.length}_{self.fast}_{self.slow}"]
+
+    def reset(self) -> None:
+        self.closes = deque(maxlen=max(self.length, self.drift) + 1)
+        self.diffs = deque(maxlen=self.length)
+        self.total, self.since, self.value = 0.0, 0, npNaN
+
+    def update(self, close: float) -> float:
+        closes, length = self.closes, self.length
+        count = len(closes)
+        if count >= self.drift:
+            self.total, self.since = _slide(self.diffs, abs(_non_zero(close - closes[-self.drift])), self.total, self.since)
+        closes.append(close)
+        if count < length:
+            self.value = 0.0 if count == length - 1 else npNaN
+            return self.value
+
+        fr, sr = 2 / (self.fast + 1), 2 / (self.slow + 1)
+        er = abs(_non_zero(close - closes[-length - 1])) / self.total if len(self.diffs) == length else npNaN
+        x = er * (fr - sr) + sr
+        sc = x * x
+        self.value = sc * close + (1 - sc) * self.value
+        return self.value
+
+    def seed(self, close, values: list = None):
+        self.reset()
+        x = npArray(close, dtype=float)
+        if x.size <= self.length: return Stream.seed(self, x)
+        last = _last(values, 0)
+        if last != last:
+            result = kama(Series(x), self.length, self.fast, self.slow, self.drift)
+            if result is None: return Stream.seed(self, x)
+            last = result.iat[-1]
+
+        diffs = x[self.drift:] - x[:-self.drift]
+        self.closes.extend(x[-self.closes.maxlen:].tolist())
+        self.diffs.extend(npAbs(npWhere(diffs == 0, diffs + sflt.epsilon, diffs))[-self.length:].tolist())
+        self.total, self.value = sum(self.diffs), float(last)
+        return self
+
+
+class PSAR(Stream):
+    """Parabolic Stop and Reverse, see psar()
+
+    On its second bar, psar() compares the SAR with the last bar of the
+    series in place of the bar before the first, which the Stream does not
+    know, so it uses the first. The values are the same once it reverses.
+
+    Args:
+        af0 (float): Initial Acceleration Factor. Default: 0.02
+        af (float): Acceleration Factor. Default: 0.02
+        max_af (float): Maximum Acceleration Factor. Default: 0.2
+
+    Returns:
+        tuple: long, short, acceleration factor and reversal.
+    """
+
+    __slots__ = ("af0", "af", "max_af", "count", "falling", "sar", "ep", "acceleration", "highs", "lows")
+    inputs = ("high", "low")
+
+    def __init__(self, af0: float = None, af: float = None, max_af: float = None, **kwargs):
+        self.af = float(af) if af and af > 0 else 0.02
+        self.af0 = float(af0) if af0 and af0 > 0 else self.af
+        self.max_af = float(max_af) if max_af and max_af > 0 else 0.2
+        self.reset()
+
+    @property
+    def columns(self) -> list:
+        _params = f"_{self.af0}_{self.max_af}"
+        return [f"PSARl{_params}", f"PSARs{_params}", f"PSARaf{_params}", f"PSARr{_params}"]
+
+    def reset(self) -> None:
+        self.count, self.falling, self.sar, self.ep, self.acceleration = 0, False, npNaN, npNaN, self.af
+        self.highs, self.lows = deque(maxlen=2), deque(maxlen=2)
+
+    def update(self, high: float, low: float) -> tuple:
+        highs, lows = self.highs, self.lows
+        self.count += 1
+        if self.count == 1:
+            highs.append(high)
+            lows.append(low)
+            return npNaN, npNaN, self.af0, 0
+        if self.count == 2:
+            # Falling if the first -DM is positive
+            up, dn = high - highs[-1], lows[-1] - low
+            self.falling = (dn if dn > up and dn > 0 else 0) >= sflt.epsilon
+            self.sar, self.ep = (highs[-1], lows[-1]) if self.falling else (lows[-1], highs[-1])
+
+        sar, ep, af = self.sar, self.ep, self.acceleration
+        _sar = sar + af * (ep - sar)
+        if self.falling:
+            reverse = high > _sar
+            if low < ep:
+                ep = low
+                af = min(af + self.af0, self.max_af)
+            _sar = max(highs[-1], highs[0], _sar)
+        else:
+            reverse = low < _sar
+            if high > ep:
+                ep = high
+                af = min(af + self.af0, self.max_af)
+            _sar = min(lows[-1], lows[0], _sar)
+
+        if reverse:
+            _sar = ep
+            af = self.af0
+            self.falling = not self.falling
+            ep = low if self.falling else high
+
+        self.sar, self.ep, self.acceleration = _sar, ep, af
+        highs.append(high)
+        lows.append(low)
+        if self.falling:
+            return npNaN, _sar, af, int(reverse)
+        return _sar, npNaN, af, int(reverse)
+
+    def seed(self, high, low, values: list = None):
+        """Continues from the SAR, the acceleration factor and the last
+        reversal of the batch run, of psar() without 'values'."""
+        self.reset()
+        high, low = npArray(high, dtype=float), npArray(low, dtype=float)
+        if high.size < 3: return Stream.seed(self, high, low)
+        if values is None or any(x is None for x in values[:4]):
+            result = psar(Series(high), Series(low), af0=self.af0, af=self.af, max_af=self.max_af)
+            if result is None: return Stream.seed(self, high, low)
+            values = result.to_numpy(dtype=float).T
+        long, short, af, reversal = [npArray(x, dtype=float) for x in values[:4]]
+
+        # The extreme point since the last reversal
+        reversals = npFlatnonzero(reversal == 1)
+        since = reversals[-1] if reversals.size else 0
+        self.count, self.falling, self.acceleration = high.size, bool(short[-1] == short[-1]), float(af[-1])
+        self.sar = float(short[-1] if self.falling else long[-1])
+        extremes = low[since:] if self.falling else high[since:]
+        if extremes[0] == extremes[0]:
+            self.ep = float(npNanmin(extremes) if self.falling else npNanmax(extremes))
+        self.highs.extend(high[-2:].tolist())
+        self.lows.extend(low[-2:].tolist())
+        return self
+
+
+class SUPERTREND(Stream):
+    """Supertrend, see supertrend()
+
+    Args:
+        length (int): length for ATR calculation. Default: 7
+        multiplier (float): Coefficient for upper and lower band distance to
+            midrange. Default: 3.0
+
+    Returns:
+        tuple: trend, direction, long and short.
+    """
+
+    __slots__ = ("length", "multiplier", "atr", "count", "direction", "upper", "lower")
+    inputs = ("high", "low", "close")
+
+    def __init__(self, length: int = None, multiplier: float = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 7
+        self.multiplier = float(multiplier) if multiplier and multiplier > 0 else 3.0
+        self.reset()
+
+    @property
+    def columns(self) -> list:
+        _props = f"_{self.length}_{self.multiplier}"
+        return [f"SUPERT{_props}", f"SUPERTd{_props}", f"SUPERTl{_props}", f"SUPERTs{_props}"]
+
+    def reset(self) -> None:
+        self.atr = ATR(self.length)
+        self.count, self.direction, self.upper, self.lower = 0, 1, npNaN, npNaN
+
+    def update(self, high: float, low: float, close: float) -> tuple:
+        hl2, matr = 0.5 * (high + low), self.multiplier * self.atr.update(high, low, close)
+        upper, lower = hl2 + matr, hl2 - matr
+        self.count += 1
+        if self.count == 1:
+            self.upper, self.lower = upper, lower
+            return 0.0, 1, npNaN, npNaN
+
+        if close > self.upper:
+            direction = 1
+        elif close < self.lower:
+            direction = -1
+        else:
+            direction = self.direction
+            if direction > 0 and lower < self.lower:
+                lower = self.lower
+            if direction < 0 and upper > self.upper:
+                upper = self.upper
+
+        self.direction, self.upper, self.lower = direction, upper, lower
+        if direction > 0:
+            return lower, direction, lower, npNaN
+        return upper, direction, npNaN, upper
+
+    def seed(self, high, low, close, values: list = None):
+        """Continues from the direction and the band of the trend of the
+        batch run, of supertrend() without 'values'."""
+        self.reset()
+        high, low, close = npArray(high, dtype=float), npArray(low, dtype=float), npArray(close, dtype=float)
+        if close.size < 2: return Stream.seed(self, high, low, close)
+        if values is None or any(x is None for x in values[1:4]):
+            result = supertrend(Series(high), Series(low), Series(close), self.length, self.multiplier)
+            if result is None: return Stream.seed(self, high, low, close)
+            values = result.to_numpy(dtype=float).T
+
+        # The bands of the last bar, the trend's as the batch run left it
+        self.atr.seed(high[:-1], low[:-1], close[:-1])
+        hl2, matr = 0.5 * (high[-1] + low[-1]), self.multiplier * self.atr.update(high[-1], low[-1], close[-1])
+        self.count, self.direction = close.size, int(values[1][-1])
+        self.upper, self.lower = hl2 + matr, hl2 - matr
+        if self.direction > 0:
+            self.lower = float(values[2][-1])
+        else:
+            self.upper = float(values[3][-1])
+        return self
+
+
+class VIDYA(Stream):
+    """Variable Index Dynamic Average, see vidya()
+
+    Args:
+        length (int): It's period. Default: 14
+        drift (int): The difference period. Default: 1
+    """
+
+    __slots__ = ("length", "drift", "closes", "gains", "losses", "gain", "loss", "since", "count", "value")
+
+    def __init__(self, length: int = None, drift: int = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 14
+        self.drift = get_drift(drift)
+        self.reset()
+
+    @property
+    def columns(self) -> list:
+        return [f"VIDYA_{self.length}"]
+
+    def reset(self) -> None:
+        self.closes = deque(maxlen=self.drift)
+        self.gains, self.losses = deque(maxlen=self.length), deque(maxlen=self.length)
+        self.gain, self.loss, self.since, self.count, self.value = 0.0, 0.0, 0, 0, 0.0
+
+    def update(self, close: float) -> float:
+        closes = self.closes
+        if len(closes) == self.drift:
+            mom = close - closes[0]
+            gain, since = _slide(self.gains, max(mom, 0.0), self.gain, self.since)
+            self.loss, self.since = _slide(self.losses, abs(min(mom, 0.0)), self.loss, self.since)
+            self.gain = gain
+        closes.append(close)
+        self.count += 1
+        if self.count <= self.length: return npNaN
+
+        total = self.gain + self.loss
+        if len(self.gains) == self.length and total != 0:
+            alpha = 2 / (self.length + 1) * abs(self.gain - self.loss) / total
+            self.value = alpha * close + self.value * (1 - alpha)
+        else:
+            self.value = npNaN
+        return self.value if self.value != 0 else npNaN
+
+    def seed(self, close, values: list = None):
+        self.reset()
+        x = npArray(close, dtype=float)
+        if x.size <= self.length: return Stream.seed(self, x)
+        last = _last(values, 0)
+        if last != last:
+            result = vidya(Series(x), self.length, self.drift)
+            if result is None: return Stream.seed(self, x)
+            last = result.iat[-1]
+
+        mom = x[self.drift:] - x[:-self.drift]
+        self.closes.extend(x[-self.drift:].tolist())
+        self.gains.extend(npMaximum(mom, 0.0)[-self.length:].tolist())
+        self.losses.extend(npAbs(npMinimum(mom, 0.0))[-self.length:].tolist())
+        self.gain, self.loss, self.count, self.value = sum(self.gains), sum(self.losses), x.size, float(last)
+        return self
+
+
+# The moving averages of 'mamode'
+MAMODES = {"ema": EMA, "rma": RMA, "sma": SMA}
+
+# The Streams of the indicators
+STREAMS = {
+    "atr": ATR, "bbands": BBANDS, "ema": EMA, "jma": JMA, "kama": KAMA,
+    "macd": MACD, "mcgd": MCGD, "mom": MOM, "psar": PSAR, "rma": RMA,
+    "roc": ROC, "rsi": RSI, "sma": SMA, "stdev": STDEV,
+    "supertrend": SUPERTREND, "true_range": TRUE_RANGE, "vidya": VIDYA,
+}
+
+# The classes of the states of the checkpoints
+CHECKPOINTS = {x.__name__: x for x in [EWM, *STREAMS.values()]}
+
+# The bar's sources of the indicators
+SOURCES = ("open", "high", "low", "close", "volume")
+# The keys of a Strategy's indicator that are not its Stream's arguments
+_STRATEGY_KEYS = ("kind", "params", "append") + RENAME_KWARGS
+# The terminal states of advance(), by their (key, index label)
+STATE_CACHE_SIZE = 256
+_states = {}
+_lock = RLock()
+
+
+def indicator_streams(ind: dict) -> list:
+    """Returns the (stream, sources, names, positions, key) nodes of a
+    Strategy's indicator 'ind': its Stream, one per value when swept, the
+    columns of its sources, the columns df.ta.strategy() would append and the
+    positions of their values in the Stream's. None when the indicator has no
+    Stream or has an offset or fills."""
+    from pandas_ta.core import AnalysisIndicators
+
+    kind = ind.get("kind")
+    if kind not in STREAMS or ind.get("offset") or "fillna" in ind or "fill_method" in ind: return
+
+    # As the DataFrame method would be called
+    params = ind["params"] if isinstance(ind.get("params"), tuple) else ()
+    names = [p for p in signature(getattr(AnalysisIndicators, kind)).parameters if p not in ("self", "kwargs")]
+    kwargs = {**dict(zip(names, params)), **{k: v for k, v in ind.items() if k not in _STRATEGY_KEYS}}
+    kwargs.pop("offset", None)
+    stream = STREAMS[kind]
+    sources = tuple(kwargs[x] if isinstance(kwargs.get(x), str) else x for x in stream.inputs)
+    for x in SOURCES:
+        if isinstance(kwargs.get(x), str): kwargs.pop(x)
+
+    swept = sweep_params(kwargs)
+    if len(swept) > 1: return
+    if len(swept):
+        calls = [{**kwargs, swept[0]: v} for v in kwargs.pop(swept[0])]
+    else:
+        calls = [kwargs]
+
+    delimiter = ind.get("delimiter", "_")
+    prefix = f"{ind['prefix']}{delimiter}" if "prefix" in ind else ""
+    suffix = f"{delimiter}{ind['suffix']}" if "suffix" in ind else ""
+    col_names = ind.get("col_names")
+    if col_names is not None and not isinstance(col_names, tuple):
+        col_names = (col_names,)
+
+    nodes = []
+    for call in calls:
+        key = call_key(kind, {**call, "sources": sources})
+        if key is None: return
+        try:
+            stream = STREAMS[kind](**call)
+        except TypeError:
+            print(f"[X] The stream of {kind} does not take: {', '.join(call)}")
+            return
+        columns = stream.columns
+        positions = None
+        if len(columns) > 1:
+            positions = list(range(len(columns)))
+            if ind.get("col_numbers") is not None and not len(swept):
+                positions = [int(n) for n in ind["col_numbers"]]
+        names = [columns[i] for i in positions] if positions is not None else columns
+        names = [prefix + name + suffix for name in names]
+        if col_names is not None and not len(swept):
+            if len(col_names) < len(names):
+                print(f"Not enough col_names were specified : got {len(col_names)}, expected {len(names)}.")
+                return
+            names = list(col_names[:len(names)])
+        nodes.append((stream, sources, names, positions, key))
+    return nodes
+
+
+def resume(node: tuple, start: int, index, last: list) -> Stream:
+    """Returns the Stream of an indicator_streams() 'node' in the terminal
+    state cached by an advance() that ended at the 'index' label before
+    'start', when its values there were 'last', else the node's Stream to
+    seed."""
+    stream, key = node[0], node[4]
+    with _lock:
+        cached = _states.pop((key, index[start - 1]), None) if start > 0 else None
+    if cached is not None and _same(cached[1], last):
+        return cached[0]
+    return stream
+
+
+def advance(node: tuple, sources: list, start: int, stream: Stream, index, outputs: dict) -> list:
+    """Returns the values of the columns of an indicator_streams() 'node' over
+    the bars of the 'sources' arrays from the position 'start'. The 'stream'
+    of resume() continues from its state or, when it is the node's, is seeded
+    with the bars before 'start' and the 'outputs' arrays of its columns, by
+    name, there. The terminal state is cached, by the last 'index' label, for
+    the next call."""
+    _, _, names, positions, key = node
+    if stream is node[0]:
+        values = [None] * len(stream.columns)
+        for i, name in enumerate(names):
+            values[positions[i] if positions is not None else i] = outputs[name][:start]
+        stream.seed(*[x[:start] for x in sources], values=values)
+
+    values = [stream.update(*bar) for bar in zip(*[x[start:].tolist() for x in sources])]
+    values = [[row[i] for i in positions] for row in values] if positions is not None else [[x] for x in values]
+    if len(values):
+        with _lock:
+            _cache(_states, (key, index[-1]), (stream, values[-1]))
+    return values
+
+
+def _cache(cache: dict, key, value) -> None:
+    """Sets the 'key' of a 'cache' of advance() to 'value', first evicting
+    the oldest key when it holds STATE_CACHE_SIZE."""
+    if len(cache) >= STATE_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+
+
+def watermark(values) -> int:
+    """Returns the position of the last value of the array 'values' that is
+    not NaN, -1 when there is none."""
+    valid = npFlatnonzero(~npIsnan(values))
+    return int(valid[-1]) if valid.size else -1
+
+
+def restore(checkpoint) -> Stream:
+    """Returns the Stream of a checkpoint(), given as a dict or as its JSON,
+    which continues where the checkpointed Stream stopped.
+
+    >>> saved = rsi.dumps()
+    >>> rsi = ta.stream.restore(saved)  # In a new process
+    """
+    try:
+        if isinstance(checkpoint, (str, bytes, bytearray)):
+            checkpoint = jsonLoads(checkpoint)
+        if checkpoint.get("stream") in CHECKPOINTS:
+            return _decode(checkpoint)
+    except (AttributeError, KeyError, TypeError, ValueError):
+        pass
+    print("[X] Not the checkpoint of a Stream.")
+
+
+class StreamingStrategy(object):
+    """Streaming Strategy
+
+    Compiles the indicators of a Strategy into their Streams and advances
+    them all a bar at a time, for live data. The values are keyed by the
+    columns that df.ta.strategy() would append, so that research and
+    production share one definition. An indicator's source can be a column
+    of the bar, like {"close": "volume"}, or of another indicator of the
+    Strategy, like {"close": "SMA_10"}.
+
+    >>> live = ta.StreamingStrategy(strategy).seed(df)
+    >>> row = live.push(open, high, low, close, volume, ts)
+    >>> row["RSI_14"]
+
+    Indicators without a Stream, or with an offset or fills, are listed in
+    'excluded' and left out.
+
+    Args:
+        strategy (Strategy | list): A Strategy or its 'ta' list of dicts.
+    """
+
+    __slots__ = ("name", "nodes", "columns", "excluded", "ts")
+
+    def __init__(self, strategy):
+        ta = getattr(strategy, "ta", strategy)
+        self.name = getattr(strategy, "name", "Custom")
+        self.nodes, self.columns, self.excluded, self.ts = [], [], [], None
+        if not isinstance(ta, list):
+            print("[X] StreamingStrategy requires a Strategy with a 'ta' list of dicts.")
+            return
+
+        nodes = []
+        for ind in ta:
+            compiled = indicator_streams(ind)
+            if compiled is None:
+                self.excluded.append(ind.get("kind"))
+                continue
+            nodes.extend(compiled)
+            self.columns.extend(name for node in compiled for name in node[2] if name not in self.columns)
+
+        # The indicators of other indicators follow them
+        available = set(SOURCES)
+        while len(nodes):
+            ready = [node for node in nodes if available.issuperset(node[1])]
+            if not len(ready):
+                missing = sorted(set(x for node in nodes for x in node[1]) - available)
+                print(f"[X] StreamingStrategy sources not found: {', '.join(missing)}")
+                self.excluded.extend(node[0].__class__.__name__.lower() for node in nodes)
+                self.columns = [name for name in self.columns if name in available]
+                break
+            self.nodes.extend(ready)
+            available.update(name for node in ready for name in node[2])
+            nodes = [node for node in nodes if node not in ready]
+
+    def __repr__(self):
+        return f"StreamingStrategy({self.name}, columns={len(self.columns)})"
+
+    def push(self, open_: float, high: float, low: float, close: float, volume: float = npNaN, ts=None) -> dict:
+        """Returns the values of the next bar, keyed by column."""
+        row = {"open": open_, "high": high, "low": low, "close": close, "volume": volume}
+        for stream, sources, names, positions, _ in self.nodes:
+            values = stream.update(*[row[x] for x in sources])
+            if positions is None:
+                row[names[0]] = values
+            else:
+                for name, i in zip(names, positions):
+                    row[name] = values[i]
+        self.ts = ts
+        return {name: row[name] for name in self.columns}
+
+    def checkpoint(self) -> dict:
+        """Returns the states of the indicators and the last 'ts', of JSON
+        types, for restore() to continue where they stopped, in another
+        process."""
+        return {
+            "strategy": self.name, "columns": self.columns, "ts": _encode(self.ts),
+            "streams": [node[0].checkpoint() for node in self.nodes],
+        }
+
+    def dumps(self) -> str:
+        """Returns the checkpoint() as JSON."""
+        return jsonDumps(self.checkpoint())
+
+    def restore(self, checkpoint):
+        """Continues the indicators from the checkpoint() of a
+        StreamingStrategy of the same Strategy, given as a dict or as its
+        JSON. Returns itself.
+
+        >>> saved = live.dumps()
+        >>> live = ta.StreamingStrategy(strategy).restore(saved)  # In a new process
+        """
+        try:
+            if isinstance(checkpoint, (str, bytes, bytearray)):
+                checkpoint = jsonLoads(checkpoint)
+            streams = [_decode(x) for x in checkpoint["streams"]]
+            ts = _decode(checkpoint["ts"])
+        except (AttributeError, KeyError, TypeError, ValueError):
+            streams, ts = None, None
+        if (
+            streams is None or checkpoint["columns"] != self.columns or len(streams) != len(self.nodes)
+            or any(type(x) is not type(node[0]) for x, node in zip(streams, self.nodes))
+        ):
+            print("[X] Not the checkpoint of this StreamingStrategy.")
+            return self
+        self.nodes = [(x, *node[1:]) for x, node in zip(streams, self.nodes)]
+        self.ts = ts
+        return self
+
+    def seed(self, df):
+        """Resets the indicators and continues them from the bars of 'df', the
+        DataFrame of a batch run, and from their columns there. Returns
+        itself."""
+        bars = {x: df[x] if x in df.columns else npFull(df.shape[0], npNaN) for x in SOURCES}
+        columns = set() if df.columns.has_duplicates else set(df.columns)
+        if all(x in bars or x in columns for node in self.nodes for x in node[1]):
+            for stream, sources, names, positions, _ in self.nodes:
+                values = [None] * len(stream.columns)
+                for i, name in enumerate(names):
+                    if name in columns:
+                        values[positions[i] if positions is not None else i] = df[name].to_numpy(dtype=float)
+                stream.seed(*[bars[x] if x in bars else df[x] for x in sources], values=values)
+        else:
+            for node in self.nodes:
+                node[0].reset()
+            for bar in zip(*[npArray(bars[x], dtype=float).tolist() for x in SOURCES]):
+                self.push(*bar)
+        self.ts = df.index[-1] if df.shape[0] else None
+        return self
+
+
+def _encode(x):
+    """The value 'x' of a state as JSON types."""
+    if isinstance(x, (EWM, Stream)):
+        slots = [k for cls in type(x).mro() for k in getattr(cls, "__slots__", ())]
+        return {"stream": type(x).__name__, "state": {k: _encode(getattr(x, k)) for k in slots}}
+    if isinstance(x, deque):
+        return {"deque": [_encode(v) for v in x], "maxlen": x.maxlen}
+    if isinstance(x, npNdarray):
+        return {"array": [_encode(v) for v in x.tolist()]}
+    if isinstance(x, (list, tuple)):
+        return [_encode(v) for v in x]
+    if isinstance(x, datetime):
+        return {"timestamp": Timestamp(x).isoformat()}
+    if isinstance(x, npGeneric):
+        x = x.item()
+    if isinstance(x, float) and not isfinite(x):
+        return {"float": repr(x)}
+    return x
+
+
+def _decode(x):
+    """The value of a state from the JSON types of _encode()."""
+    if isinstance(x, list):
+        return [_decode(v) for v in x]
+    if not isinstance(x, dict):
+        return x
+    if "stream" in x:
+        cls = CHECKPOINTS[x["stream"]]
+        stream = cls.__new__(cls)
+        for k, v in x["state"].items():
+            setattr(stream, k, _decode(v))
+        return stream
+    if "deque" in x:
+        return deque([_decode(v) for v in x["deque"]], maxlen=x["maxlen"])
+    if "array" in x:
+        return npArray([_decode(v) for v in x["array"]], dtype=float)
+    if "timestamp" in x:
+        return Timestamp(x["timestamp"])
+    return float(x["float"])
+
+
+def _same(a: list, b: list) -> bool:
+    """Whether the values of 'a' and 'b' are equal, NaNs included."""
+    return len(a) == len(b) and all(x == y or (isnan(x) and isnan(y)) for x, y in zip(a, b))
+
+
+def _mode_tal(talib) -> bool:
+    """Whether an indicator given 'talib' is TA Lib's."""
+    return Imports["talib"] and (bool(talib) if isinstance(talib, bool) else True)
+
+
+def _non_zero(x: float) -> float:
+    """non_zero_range() of a difference."""
+    return x + sflt.epsilon if x == 0 else x
+
+
+def _column(values: list, i: int):
+    """The 'i'th array of the 'values' of seed(), None without it."""
+    return values[i] if values is not None and len(values) > i else None
+
+
+def _last(values: list, i: int) -> float:
+    """The last value of the 'i'th array of the 'values' of seed(), NaN
+    without it."""
+    column = _column(values, i)
+    return float(column[-1]) if column is not None and len(column) else npNaN
+
+
+def _trim(x: npNdarray) -> npNdarray:
+    """The array 'x' from its first value that is not NaN."""
+    valid = npFlatnonzero(x == x)
+    return x[valid[0]:] if valid.size else x[:0]
+
+
+def _tal_ewm(x: npNdarray, alpha: float, length: int) -> npNdarray:
+    """TA Lib's exponential average of the array 'x' by 'alpha', from its
+    bar 'length' - 1 that is the mean of the first 'length' values. NaN
+    from the first NaN, as TA Lib does not skip them."""
+    values = x[length - 1:].copy()
+    values[0] = x[:length].mean()
+    result = Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    nans = npFlatnonzero(values != values)
+    if nans.size: result[nans[0]:] = npNaN
+    return result
+
+
+def _ema_values(ema: EMA, x: npNdarray) -> npNdarray:
+    """The values of the reset Stream 'ema' over the array 'x'."""
+    values = npFull(x.size, npNaN)
+    if ema.mode_tal:
+        first = x.size - _trim(x).size
+        if x.size - first >= ema.length:
+            values[first + ema.length - 1:] = _tal_ewm(x[first:], ema.ewm.alpha, ema.length)
+        return values
+    if ema.sma:
+        if x.size < ema.length: return values
+        head = x[:ema.length]
+        valid = int((head == head).sum())
+        x = npConcatenate(([float(npNansum(head)) / valid if valid else npNaN], x[ema.length:]))
+    values[values.size - x.size:] = Series(x).ewm(alpha=ema.ewm.alpha, adjust=ema.ewm.adjust).mean().to_numpy()
+    return values
+
+
+def _true_ranges(tr: TRUE_RANGE, high: npNdarray, low: npNdarray, close: npNdarray) -> npNdarray:
+    """The values of the reset Stream 'tr' over the arrays of the bars."""
+    ranges, drift = npFull(close.size, npNaN), tr.drift
+    first = close.size - _trim(close).size
+    if close.size - first <= drift: return ranges
+    prev_close, high, low = close[first:-drift], high[first + drift:], low[first + drift:]
+    high_low_range = high - low
+    if not tr.mode_tal:
+        high_low_range = npWhere(high_low_range == 0, high_low_range + sflt.epsilon, high_low_range)
+    # Python's max(), the first of the largest
+    ranges_ = npAbs(high_low_range)
+    for x in (npAbs(high - prev_close), npAbs(prev_close - low)):
+        ranges_ = npWhere(x > ranges_, x, ranges_)
+    ranges_[prev_close != prev_close] = npNaN
+    ranges[first + drift:] = ranges_
+    return ranges
+
+
+def _slide(window: deque, value: float, total: float, since: int) -> tuple:
+    """Appends 'value' to the full or filling 'window' and its running sum,
+    which is summed again every window so that its rounding error does not
+    accumulate."""
+    if len(window) == window.maxlen: total -= window[0]
+    window.append(value)
+    since += 1
+    if since == window.maxlen:
+        return sum(window), 0
+    return total + value, since
+
+
+def _slide_squares(window: deque, value: float, total: float, squares: float, since: int) -> tuple:
+    """_slide() with the running sum of squares."""
+    if len(window) == window.maxlen: squares -= window[0] * window[0]
+    total, since = _slide(window, value, total, since)
+    if since == 0:
+        return total, sum(x * x for x in window), 0
+    return total, squares + value * value, since
+
+
+def _deviation(total: float, squares: float, length: int, ddof: int) -> float:
+    """The standard deviation of a window from its sums. TA Lib's, of the
+    population, is zero when its variance is not positive."""
+    mean = total / length
+    if ddof == 0:
+        variance = squares / length - mean * mean
+        return sqrt(variance) if variance >= TAL_EPSILON else 0.0
+    variance = (squares - total * mean) / (length - ddof)
+    return sqrt(variance) if variance > 0 else 0.0
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+from numpy import arange as npArange
+from numpy import array as npArray
+from numpy import concatenate as npConcatenate
+from numpy import cumsum as npCumsum
+from numpy import errstate as npErrstate
+from numpy import finfo as npFinfo
+from numpy import flatnonzero as npFlatnonzero
+from numpy import full as npFull
+from numpy import isnan as npIsnan
+from numpy import maximum as npMaximum
+from numpy import nan as npNaN
+from numpy import ndarray as npNdarray
+from numpy import sqrt as npSqrt
+from pandas import DataFrame, Series, concat
+
+import pandas_ta
+from pandas_ta import Imports
+from pandas_ta.utils import get_offset, verify_series
+
+# Indicators swept over 'length' in a single pass: (name prefix, category)
+SWEEP_KERNELS = {
+    "ema": ("EMA", "overlap"),
+    "rma": ("RMA", "overlap"),
+    "rsi": ("RSI", "momentum"),
+    "sma": ("SMA", "overlap"),
+    "stdev": ("STDEV", "statistics"),
+    "variance": ("VAR", "statistics"),
+    "wma": ("WMA", "overlap"),
+}
+
+# Rows per block of the window kernels' cumulative sums
+SWEEP_BLOCK = 1024
+# Lengths per block of the recursions' results, written together
+SWEEP_COLUMNS = 32
+
+def sweep(kind, *sources, **kwargs) -> DataFrame:
+    """Parameter Sweep
+
+    Computes an indicator over many values of one of its parameters and
+    returns the results side by side, one column per value. The parameter
+    to sweep is the keyword argument given an iterable of values, the
+    others are passed to every call.
+
+    The 'length' sweeps of sma, wma, stdev and variance share one
+    cumulative sum pass over the source. Those of ema, rma and rsi call TA
+    Lib or pandas' ewm once per length on the shared source arrays, in the
+    mode (TA Lib or not) the indicator would use, and write each column in
+    place. Other indicators, parameters or sources with gaps are computed
+    one value at a time. Repeated values are computed once.
+
+    >>> ta.sweep("sma", df["close"], length=range(5, 400))
+    >>> ta.sweep("macd", df["close"], fast=[8, 12, 16])
+
+    Args:
+        kind (str | callable): Indicator name or function.
+        *sources (pd.Series): The indicator's source Series.
+
+    Kwargs:
+        offset (int): How many periods to offset the result. Default: 0
+        fillna (value, optional): pd.DataFrame.fillna(value)
+        fill_method (value, optional): Type of fill method
+
+    Returns:
+        pd.DataFrame: A column per value or None.
+    """
+    swept = sweep_params(kwargs)
+    if len(swept) != 1: return
+    param = swept[0]
+    # Once each, in the given order
+    values = list(dict.fromkeys(kwargs.pop(param)))
+    if not len(values): return
+
+    result = None
+    if isinstance(kind, str) and kind in SWEEP_KERNELS and param == "length" and len(sources) == 1:
+        result = _sweep_lengths(kind, sources[0], values, kwargs)
+
+    if result is None:
+        fn = getattr(pandas_ta, kind, None) if isinstance(kind, str) else kind
+        if not callable(fn): return
+        result = _sweep_each(fn, sources, param, values, kwargs)
+
+    return result
+
+
+def sweep_params(kwargs: dict) -> list:
+    """Returns the keyword arguments of an indicator given an iterable of
+    values to sweep."""
+    return [
+        k for k, v in kwargs.items()
+        if k not in ("col_names", "col_numbers", "params")
+        and isinstance(v, (list, tuple, range, npNdarray))
+    ]
+
+
+def _sweep_each(fn, sources: tuple, param: str, values: list, kwargs: dict) -> DataFrame:
+    """Computes the indicator 'fn' one value at a time."""
+    results = [fn(*sources, **{**kwargs, param: v}) for v in values]
+    results = [r for r in results if r is not None]
+    if not len(results): return
+
+    result = concat(results, axis=1)
+    result.name = f"{fn.__name__.upper()}_SWEEP"
+    result.category = getattr(results[0], "category", None)
+    return result
+
+
+def _sweep_lengths(kind: str, close, lengths: list, kwargs: dict) -> DataFrame:
+    """Computes a 'length' sweep of a SWEEP_KERNELS indicator, or returns None
+    when the source or arguments require the indicator itself."""
+    lengths = [int(n) for n in lengths if n and n > 0]
+    minimum = 2 if kind == "variance" else 1
+    close = verify_series(close)
+    offset = get_offset(kwargs.get("offset"))
+    talib = kwargs.get("talib")
+    mode_tal = Imports["talib"] and (bool(talib) if isinstance(talib, bool) else True)
+
+    if close is None: return
+    if "min_periods" in kwargs and kind in ("sma", "variance"): return
+    lengths = [n for n in lengths if n >= minimum]
+    if kind == "ema" and not mode_tal:
+        if kwargs.get("adjust", False) or not kwargs.get("sma", True): return
+    if kind == "rsi" and not mode_tal and kwargs.get("drift") not in (None, 1): return
+
+    # Gaps are handled differently by each indicator, only the leading
+    # NaNs are skipped as a later start.
+    x = close.to_numpy(dtype=float)
+    valid = ~npIsnan(x)
+    if not valid.any(): return
+    first = int(valid.argmax())
+    if not valid[first:].all(): return
+    if first > 0 and kind == "ema" and not mode_tal: return
+
+    lengths = [n for n in lengths if n <= x.size and (kind != "rsi" or n < x.size)]
+    if not len(lengths): return
+    lengths = npArray(lengths)
+    prefix, category = SWEEP_KERNELS[kind]
+
+    # Calculate Result
+    columns = [f"{prefix}_{n}" for n in lengths]
+    # A row per length, the columns of the result
+    values = npFull((lengths.size, x.size), npNaN)
+    if kind in ("sma", "wma", "stdev", "variance"):
+        # TA Lib's, and stdev's variance when installed, are of the population
+        ddof = kwargs.get("ddof")
+        population = mode_tal or (kind == "stdev" and Imports["talib"])
+        ddof = [0 if population else ddof if isinstance(ddof, int) and 0 <= ddof < n else 1 for n in lengths]
+        _window(kind, x[first:], lengths, ddof, values[:, first:])
+    elif kind == "rsi":
+        scalar = 100 if mode_tal else float(kwargs.get("scalar") or 100)
+        _rsi(x[first:], lengths, scalar, mode_tal, values[:, first:])
+    else:
+        _ewm(x[first:], lengths, kind, mode_tal, values[:, first:])
+
+    result = DataFrame(values.T, index=close.index, columns=columns)
+
+    # Offset
+    if offset != 0:
+        result = result.shift(offset)
+
+    # Handle fills
+    if "fillna" in kwargs:
+        result.fillna(kwargs["fillna"], inplace=True)
+    if "fill_method" in kwargs:
+        result.fillna(method=kwargs["fill_method"], inplace=True)
+
+    # Name & Category
+    result.name = f"{prefix}_SWEEP"
+    result.category = category
+    return result
+
+
+def _window(kind: str, x: npNdarray, lengths: npNdarray, ddof: list, out: npNdarray) -> None:
+    """Rolling window kernels of all the 'lengths', into the rows of 'out',
+    from the differences of cumulative sums of the source. The sums are
+    taken over blocks of SWEEP_BLOCK rows, plus the longest window, and
+    centred on the block's mean to bound the cancellation error and the
+    working memory."""
+    size, longest = x.size, int(lengths.max())
+    for b0 in range(0, size, SWEEP_BLOCK):
+        b1 = min(b0 + SWEEP_BLOCK, size)
+        a = max(b0 - longest + 1, 0)
+        ref = x[a:b1].mean()
+        c = x[a:b1] - ref
+        s1 = npConcatenate(([0.0], npCumsum(c)))
+        if kind == "wma":
+            index = npArange(c.size, dtype=float)
+            s2 = npConcatenate(([0.0], npCumsum(index * c)))
+        elif kind in ("stdev", "variance"):
+            s2 = npConcatenate(([0.0], npCumsum(c * c)))
+            tolerance = 64 * npFinfo(float).eps * s2[-1]
+
+        for i, n in enumerate(lengths):
+            t0 = max(b0, n - 1)  # first complete window ending in the block
+            if t0 >= b1: continue
+            hi, lo = slice(t0 - a + 1, b1 - a + 1), slice(t0 - a + 1 - n, b1 - a + 1 - n)
+            window = s1[hi] - s1[lo]
+            if kind == "sma":
+                row = window / n + ref
+            elif kind == "wma":
+                # sum (j - start + 1) * x[j] = sum j * x[j] - (start - 1) * sum x[j]
+                row = s2[hi] - s2[lo] - (index[lo] - 1) * window
+                row = row / (0.5 * n * (n + 1)) + ref
+            else:
+                row = s2[hi] - s2[lo] - window * window / n
+                # Sums of squares within the cumulative sums' rounding error
+                # of zero are recomputed from the window, like a flat one
+                noisy = npFlatnonzero(row < tolerance)
+                if noisy.size:
+                    ends = noisy + t0 - a
+                    w = c[ends[:, None] - npArange(n)]
+                    row[noisy] = ((w - w.mean(axis=1, keepdims=True)) ** 2).sum(axis=1)
+                row = row / (n - ddof[i])
+                if kind == "stdev":
+                    row = npSqrt(row)
+            out[i, t0:b1] = row
+
+
+def _ewm(x: npNdarray, lengths: npNdarray, kind: str, mode_tal: bool, out: npNdarray) -> None:
+    """The ema or rma of each length, into the rows of 'out', as ema() and
+    rma() compute them: TA Lib's ema, or pandas' ewm of the source, seeded
+    with the sma of its first 'length' values for the ema."""
+    if mode_tal and kind == "ema":
+        from talib import EMA
+        for i, n in enumerate(lengths):
+            out[i] = EMA(x, n)
+        return
+
+    source = Series(x)
+    for i0 in range(0, lengths.size, SWEEP_COLUMNS):
+        block = []
+        for n in lengths[i0:i0 + SWEEP_COLUMNS]:
+            if kind == "ema":
+                seeded = x.copy()
+                seeded[:n - 1], seeded[n - 1] = npNaN, x[:n].mean()
+                block.append(Series(seeded).ewm(span=n, adjust=False).mean().to_numpy())
+            else:
+                block.append(source.ewm(alpha=1.0 / n, min_periods=n).mean().to_numpy())
+        out[i0:i0 + len(block)] = block
+
+
+def _rsi(x: npNdarray, lengths: npNdarray, scalar: float, mode_tal: bool, out: npNdarray) -> None:
+    """The rsi of each length, into the rows of 'out', as rsi() computes it:
+    TA Lib's, or the ratio of pandas' ewms of the gains and losses, which
+    share one call per length."""
+    if mode_tal:
+        from talib import RSI
+        for i, n in enumerate(lengths):
+            out[i] = RSI(x, n)
+        return
+
+    change = x[1:] - x[:-1]
+    changes = DataFrame({"gain": npMaximum(change, 0), "loss": npMaximum(-change, 0)})
+    with npErrstate(divide="ignore", invalid="ignore"):
+        for i, n in enumerate(lengths):
+            up, down = changes.ewm(alpha=1.0 / n, min_periods=n).mean().to_numpy().T
+            out[i, 1:] = scalar * up / (up + down)
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
-from pandas_ta.utils import recent_maximum_index, recent_minimum_index
+from pandas_ta.utils import get_offset, rolling_minmax, verify_series
 
 
 def aroon(high, low, length=None, scalar=None, talib=None, offset=None, **kwargs):
@@ -23,8 +22,8 @@ def aroon(high, low, length=None, scalar=None, talib=None, offset=None, **kwargs
         aroon_down, aroon_up = AROON(high, low, length)
         aroon_osc = AROONOSC(high, low, length)
     else:
-        periods_from_hh = high.rolling(length + 1).apply(recent_maximum_index, raw=True)
-        periods_from_ll = low.rolling(length + 1).apply(recent_minimum_index, raw=True)
+        periods_from_hh = rolling_minmax(high, length + 1)[2]
+        periods_from_ll = rolling_minmax(low, length + 1)[3]
 
         aroon_up = aroon_down = scalar
         aroon_up *= 1 - (periods_from_hh / length)
@@ -2,7 +2,7 @@
 from numpy import log10 as npLog10
 from numpy import log as npLn
 from pandas_ta.volatility import atr
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import get_drift, get_offset, rolling_minmax, verify_series
 
 
 def chop(high, low, close, length=None, atr_length=None, ln=None, scalar=None, drift=None, offset=None, **kwargs):
@@ -21,7 +21,7 @@ def chop(high, low, close, length=None, atr_length=None, ln=None, scalar=None, d
     if high is None or low is None or close is None: return
 
     # Calculate Result
-    diff = high.rolling(length).max() - low.rolling(length).min()
+    diff = rolling_minmax(high, length)[0] - rolling_minmax(low, length)[1]
 
     atr_ = atr(high=high, low=low, close=close, length=atr_length)
     atr_sum = atr_.rolling(length).sum()
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
 from pandas_ta.volatility import atr
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_minmax, verify_series
 
 
 def cksp(high, low, close, p=None, x=None, q=None, tvmode=None, offset=None, **kwargs):
@@ -25,11 +25,11 @@ def cksp(high, low, close, p=None, x=None, q=None, tvmode=None, offset=None, **k
     # Calculate Result
     atr_ = atr(high=high, low=low, close=close, length=p, mamode=mamode)
 
-    long_stop_ = high.rolling(p).max() - x * atr_
-    long_stop = long_stop_.rolling(q).max()
+    long_stop_ = rolling_minmax(high, p)[0] - x * atr_
+    long_stop = rolling_minmax(long_stop_, q)[0]
 
-    short_stop_ = low.rolling(p).min() + x * atr_
-    short_stop = short_stop_.rolling(q).min()
+    short_stop_ = rolling_minmax(low, p)[1] + x * atr_
+    short_stop = rolling_minmax(short_stop_, q)[1]
 
     # Offset
     if offset != 0:
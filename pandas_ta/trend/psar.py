@@ -1,51 +1,25 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
+from numpy import int64 as npInt64
 from numpy import nan as npNaN
+from numpy import zeros as npZeros
 from pandas import DataFrame, Series
-from pandas_ta.utils import get_offset, verify_series, zero
+from pandas_ta.utils import get_offset, kernel, verify_series, zero
 
 
-def psar(high, low, close=None, af0=None, af=None, max_af=None, offset=None, **kwargs):
-    """Indicator: Parabolic Stop and Reverse (PSAR)"""
-    # Validate Arguments
-    high = verify_series(high)
-    low = verify_series(low)
-    af = float(af) if af and af > 0 else 0.02
-    af0 = float(af0) if af0 and af0 > 0 else af
-    max_af = float(max_af) if max_af and max_af > 0 else 0.2
-    offset = get_offset(offset)
-
-    def _falling(high, low, drift:int=1):
-        """Returns the last -DM value"""
-        # Not to be confused with ta.falling()
-        up = high - high.shift(drift)
-        dn = low.shift(drift) - low
-        _dmn = (((dn > up) & (dn > 0)) * dn).apply(zero).iloc[-1]
-        return _dmn > 0
+@kernel
+def psar_kernel(high, low, falling, sar, ep, af0, af, max_af):
+    """Parabolic SAR recurrence. Returns the long and short SAR, the
+    acceleration factor and the reversals."""
+    m = len(high)
+    long, short = npFull(m, npNaN), npFull(m, npNaN)
+    _af = npFull(m, npNaN)
+    reversal = npZeros(m, dtype=npInt64)
+    _af[:2] = af0
 
-    # Falling if the first NaN -DM is positive
-    falling = _falling(high.iloc[:2], low.iloc[:2])
-    if falling:
-        sar = high.iloc[0]
-        ep = low.iloc[0]
-    else:
-        sar = low.iloc[0]
-        ep = high.iloc[0]
-
-    if close is not None:
-        close = verify_series(close)
-        sar = close.iloc[0]
-
-    long = Series(npNaN, index=high.index)
-    short = long.copy()
-    reversal = Series(0, index=high.index)
-    _af = long.copy()
-    _af.iloc[0:2] = af0
-
-    # Calculate Result
-    m = high.shape[0]
     for row in range(1, m):
-        high_ = high.iloc[row]
-        low_ = low.iloc[row]
+        high_ = high[row]
+        low_ = low[row]
 
         if falling:
             _sar = sar + af * (ep - sar)
@@ -55,7 +29,7 @@ def psar(high, low, close=None, af0=None, af=None, max_af=None, offset=None, **k
                 ep = low_
                 af = min(af + af0, max_af)
 
-            _sar = max(high.iloc[row - 1], high.iloc[row - 2], _sar)
+            _sar = max(high[row - 1], high[row - 2], _sar)
         else:
             _sar = sar + af * (ep - sar)
             reverse = low_ < _sar
@@ -64,7 +38,7 @@ def psar(high, low, close=None, af0=None, af=None, max_af=None, offset=None, **k
                 ep = high_
                 af = min(af + af0, max_af)
 
-            _sar = min(low.iloc[row - 1], low.iloc[row - 2], _sar)
+            _sar = min(low[row - 1], low[row - 2], _sar)
 
         if reverse:
             _sar = ep
@@ -76,12 +50,56 @@ def psar(high, low, close=None, af0=None, af=None, max_af=None, offset=None, **k
 
         # Seperate long/short sar based on falling
         if falling:
-            short.iloc[row] = sar
+            short[row] = sar
         else:
-            long.iloc[row] = sar
+            long[row] = sar
+
+        _af[row] = af
+        reversal[row] = int(reverse)
+
+    return long, short, _af, reversal
 
-        _af.iloc[row] = af
-        reversal.iloc[row] = int(reverse)
+
+def psar(high, low, close=None, af0=None, af=None, max_af=None, offset=None, **kwargs):
+    """Indicator: Parabolic Stop and Reverse (PSAR)"""
+    # Validate Arguments
+    high = verify_series(high)
+    low = verify_series(low)
+    af = float(af) if af and af > 0 else 0.02
+    af0 = float(af0) if af0 and af0 > 0 else af
+    max_af = float(max_af) if max_af and max_af > 0 else 0.2
+    offset = get_offset(offset)
+
+    def _falling(high, low, drift:int=1):
+        """Returns the last -DM value"""
+        # Not to be confused with ta.falling()
+        up = high - high.shift(drift)
+        dn = low.shift(drift) - low
+        _dmn = (((dn > up) & (dn > 0)) * dn).apply(zero).iloc[-1]
+        return _dmn > 0
+
+    # Falling if the first NaN -DM is positive
+    falling = _falling(high.iloc[:2], low.iloc[:2])
+    if falling:
+        sar = high.iloc[0]
+        ep = low.iloc[0]
+    else:
+        sar = low.iloc[0]
+        ep = high.iloc[0]
+
+    if close is not None:
+        close = verify_series(close)
+        sar = close.iloc[0]
+
+    # Calculate Result
+    long, short, _af, reversal = psar_kernel(
+        high.to_numpy(dtype=float), low.to_numpy(dtype=float),
+        bool(falling), float(sar), float(ep), af0, af, max_af
+    )
+    long = Series(long, index=high.index)
+    short = Series(short, index=high.index)
+    _af = Series(_af, index=high.index)
+    reversal = Series(reversal, index=high.index)
 
     # Offset
     if offset != 0:
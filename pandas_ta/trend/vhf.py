@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from numpy import fabs as npFabs
-from pandas_ta.utils import get_drift, get_offset, non_zero_range, verify_series
+from pandas_ta.utils import get_drift, get_offset, non_zero_range, rolling_minmax, verify_series
 
 
 def vhf(close, length=None, drift=None, offset=None, **kwargs):
@@ -14,8 +14,7 @@ def vhf(close, length=None, drift=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    hcp = close.rolling(length).max()
-    lcp = close.rolling(length).min()
+    hcp, lcp = rolling_minmax(close, length)[:2]
     diff = npFabs(close.diff(drift))
     vhf  = npFabs(non_zero_range(hcp, lcp)) / diff.rolling(length).sum()
 
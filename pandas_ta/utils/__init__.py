@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
+from ._cache import *
 from ._candles import *
+from ._kernels import *
 from ._core import *
 from ._math import *
 from ._signals import *
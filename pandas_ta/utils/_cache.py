@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+from functools import wraps
+from inspect import Parameter, signature
+from threading import RLock, local
+
+from numpy import array_equal as npArrayEqual
+from numpy import ndarray as npNdArray
+from pandas import DataFrame, Series
+
+
+# Keyword arguments that only affect how a result is presented or appended
+_PRESENTATION_KWARGS = (
+    "append", "col_names", "col_numbers", "delimiter",
+    "prefix", "suffix", "timed", "verbose",
+)
+_lock = RLock()
+# The active cache and hits of each thread
+_state = local()
+
+
+class IndicatorCache(object):
+    """Indicator Cache
+
+    Holds the results of cached() indicators while it is active so that
+    indicators sharing building blocks, like 'atr', 'bbands' or an 'ema' of
+    the same source and length, compute them once. Calls are looked up by
+    their parameters and a sample of their inputs, and a hit requires the
+    inputs to equal those of the cached call.
+
+    Args:
+        maxsize (int): Maximum number of cached results. Default: 512
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = int(maxsize) if maxsize and maxsize > 0 else 512
+        self.calls = self.hits = 0
+        self.owner = None
+        self._results = {}
+
+    def __enter__(self):
+        _stack().append(_active())
+        _state.active = self
+        return self
+
+    def __exit__(self, *args):
+        _state.active = _stack().pop()
+
+    def __len__(self):
+        return len(self._results)
+
+    def clear(self) -> None:
+        with _lock:
+            self.calls = self.hits = 0
+            self._results.clear()
+
+    def get(self, key: tuple, refs: list):
+        with _lock:
+            self.calls += 1
+            for cached_refs, result in self._results.get(key, []):
+                if all(_same(a, b) for a, b in zip(cached_refs, refs)):
+                    self.hits += 1
+                    _state.hits = thread_hits() + 1
+                    return True, _copy(result)
+        return False, None
+
+    def put(self, key: tuple, result, refs: list) -> None:
+        with _lock:
+            if len(self._results) >= self.maxsize:
+                self._results.pop(next(iter(self._results)))
+            self._results.setdefault(key, []).append((refs, _copy(result)))
+
+
+def cache_scope(maxsize: int = None) -> IndicatorCache:
+    """Returns the active IndicatorCache if there is one, so nested scopes
+    share it, otherwise a new one to be used as a context manager.
+
+    >>> with cache_scope() as cache:
+    ...     squeeze = ta.squeeze(high, low, close)
+    ...     squeeze_pro = ta.squeeze_pro(high, low, close)  # Reuses bbands & kc
+    >>> cache.hits
+    """
+    active = _active()
+    return active if active is not None else IndicatorCache(maxsize)
+
+
+def worker_cache(owner) -> IndicatorCache:
+    """Returns a process wide IndicatorCache for a (multiprocessing) worker.
+    It is reset whenever the 'owner', typically the source DataFrame,
+    changes."""
+    global _worker
+    with _lock:
+        if _worker is None or _worker.owner is not owner:
+            _worker = IndicatorCache()
+            _worker.owner = owner
+        return _worker
+
+
+def release_worker_cache(owner) -> None:
+    """Drops the process wide IndicatorCache of worker_cache() if it
+    belongs to the 'owner', so that neither the owner nor the cached results
+    outlive the run that used them."""
+    global _worker
+    with _lock:
+        if _worker is not None and _worker.owner is owner:
+            _worker = None
+
+
+def thread_hits() -> int:
+    """Returns the number of cache hits of the current thread, to count the
+    hits of a task while other threads share the cache."""
+    return getattr(_state, "hits", 0)
+
+
+def cached(fn):
+    """Decorator for indicators that are commonly used as building blocks of
+    other indicators. When an IndicatorCache is active, calls with identical
+    inputs and parameters are computed once and copies of the result are
+    returned. Otherwise the indicator is called as is."""
+    sig = signature(fn)
+    name = f"{fn.__module__}.{fn.__name__}"
+
+    @wraps(fn)
+    def _cached(*args, **kwargs):
+        cache = _active()
+        if cache is None:
+            return fn(*args, **kwargs)
+
+        try:
+            arguments = sig.bind(*args, **kwargs).arguments
+        except TypeError:
+            return fn(*args, **kwargs)
+
+        refs = []
+        key = call_key(name, arguments, refs, sig)
+        if key is None:
+            return fn(*args, **kwargs)
+
+        hit, result = cache.get(key, refs)
+        if not hit:
+            result = fn(*args, **kwargs)
+            cache.put(key, result, refs)
+        return result
+
+    return _cached
+
+
+def call_key(name: str, arguments: dict, refs: list = None, sig=None, ignore: tuple = _PRESENTATION_KWARGS) -> tuple:
+    """Returns a hashable key for a call of 'name' with 'arguments'. Series
+    and DataFrames are identified by their shape, name and a sample of their
+    values and index; they are appended to 'refs' for an exact comparison.
+    None and the 'ignore'd kwargs, by default those that only affect the
+    presentation, are skipped. Returns None when an argument can not be
+    identified."""
+    refs = refs if refs is not None else []
+    items = []
+    for k, v in arguments.items():
+        if sig is not None and sig.parameters[k].kind == Parameter.VAR_KEYWORD:
+            items.extend(v.items())
+        elif sig is not None and sig.parameters[k].kind == Parameter.VAR_POSITIONAL:
+            items.extend((f"*{i}", x) for i, x in enumerate(v))
+        else:
+            items.append((k, v))
+
+    try:
+        parameters = tuple(sorted(
+            ((k, _identify(v, refs)) for k, v in items
+                if v is not None and k not in ignore),
+            key=lambda kv: kv[0]
+        ))
+    except TypeError:
+        return None
+    return (name, parameters)
+
+
+# Private
+_worker = None
+
+
+def _active():
+    return getattr(_state, "active", None)
+
+
+def _stack() -> list:
+    if not hasattr(_state, "stack"):
+        _state.stack = []
+    return _state.stack
+
+
+def _copy(result):
+    if isinstance(result, (Series, DataFrame)):
+        copy = result.copy()
+        for attr in ("name", "category"):
+            if attr in result.__dict__:
+                object.__setattr__(copy, attr, result.__dict__[attr])
+        return copy
+    if isinstance(result, tuple):
+        return tuple(_copy(x) for x in result)
+    return result
+
+
+def _identify(x, refs: list):
+    if isinstance(x, (Series, DataFrame)):
+        refs.append(x)
+        n = x.shape[0]
+        sample = [0, n // 2, n - 1] if n > 0 else []
+        values = x.values if isinstance(x, Series) else None
+        if isinstance(values, npNdArray):
+            values = values[sample].tobytes()
+        else:
+            values = id(x)
+        index = tuple(x.index[sample])
+        columns = tuple(x.columns) if isinstance(x, DataFrame) else x.name
+        return (type(x).__name__, x.shape, str(x.dtypes) if isinstance(x, DataFrame) else x.dtype.str, columns, values, index)
+    if isinstance(x, (tuple, list)):
+        return (type(x).__name__, tuple(_identify(v, refs) for v in x))
+    if isinstance(x, (dict, set, npNdArray)):
+        raise TypeError(f"{type(x).__name__} is not identifiable")
+    hash(x)
+    return (type(x).__name__, x)
+
+
+def _same(a, b) -> bool:
+    """True if the cached input 'a' equals the input 'b'."""
+    if a is b: return True
+    if not a.index.equals(b.index): return False
+    if isinstance(a, DataFrame): return a.equals(b)
+    try:
+        return npArrayEqual(a.values, b.values, equal_nan=True)
+    except TypeError:
+        return a.equals(b)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+from functools import update_wrapper
+
+from numpy import ndarray as npNdArray
+
+from pandas_ta import Imports
+
+
+KERNEL_BACKENDS = ("numba", "numpy")
+_kernel = {"backend": "numba" if Imports["numba"] else "numpy"}
+
+
+class Kernel(object):
+    """Indicator Kernel
+
+    The bar by bar loop of a path dependent indicator, written over NumPy
+    arrays and scalars only so that it runs as is or compiled by Numba, which
+    also releases the GIL. The backend is selected with kernel_backend().
+    Without Numba, the array arguments are passed as lists since indexing a
+    list returns Python floats, which are faster than NumPy scalars.
+
+    Args:
+        fn (callable): The kernel function.
+    """
+
+    def __init__(self, fn):
+        self.fn = fn
+        self._compiled = None
+        update_wrapper(self, fn)
+
+    def __call__(self, *args):
+        if _kernel["backend"] == "numba":
+            return self.compiled(*args)
+        return self.fn(*[x.tolist() if isinstance(x, npNdArray) else x for x in args])
+
+    def __repr__(self):
+        return f"Kernel({self.fn.__name__})"
+
+    @property
+    def compiled(self):
+        """The Numba compiled kernel, compiled on first use."""
+        if self._compiled is None:
+            from numba import njit
+            self._compiled = njit(cache=True, nogil=True)(self.fn)
+        return self._compiled
+
+
+def kernel(fn) -> Kernel:
+    """Decorator that makes 'fn' a Kernel."""
+    return Kernel(fn)
+
+
+def kernel_backend(backend: str = None) -> str:
+    """Returns the backend of the Kernels after setting it to 'backend' if
+    given: "numba" when installed, which is the default, or "numpy".
+
+    >>> ta.kernel_backend("numpy")
+    """
+    if isinstance(backend, str):
+        backend = backend.lower()
+        if backend not in KERNEL_BACKENDS:
+            print(f"[X] Kernel backend must be one of: {', '.join(KERNEL_BACKENDS)}")
+        elif backend == "numba" and not Imports["numba"]:
+            print("[X] Please install numba for the numba kernel backend.")
+        else:
+            _kernel["backend"] = backend
+    return _kernel["backend"]
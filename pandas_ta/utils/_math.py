@@ -4,26 +4,69 @@ from math import floor as mfloor
 from operator import mul
 from sys import float_info as sflt
 from typing import List, Optional, Tuple
+from warnings import catch_warnings, simplefilter
 
 from numpy import ones, triu
+from numpy import abs as npAbs
+from numpy import arange as npArange
+from numpy import arctan as npAtan
 from numpy import all as npAll
 from numpy import append as npAppend
+from numpy import clip as npClip
 from numpy import array as npArray
+from numpy import concatenate as npConcatenate
+from numpy import convolve as npConvolve
+from numpy import cumsum as npCumsum
 from numpy import corrcoef as npCorrcoef
 from numpy import dot as npDot
+from numpy import empty as npEmpty
 from numpy import fabs as npFabs
+from numpy import finfo as npFinfo
+from numpy import errstate as npErrstate
 from numpy import exp as npExp
+from numpy import eye as npEye
+from numpy import fft as npFft
+from numpy import flatnonzero as npFlatnonzero
+from numpy import full as npFull
+from numpy import inf as npInf
+from numpy import int64 as npInt64
+from numpy import isfinite as npIsfinite
+from numpy import isnan as npIsnan
 from numpy import log as npLog
+from numpy import matmul as npMatmul
+from numpy import maximum as npMaximum
+from numpy import minimum as npMinimum
+from numpy import nanmean as npNanmean
+from numpy import nanmedian as npNanmedian
 from numpy import nan as npNaN
+from numpy import where as npWhere
+from numpy import zeros as npZeros
 from numpy import ndarray as npNdArray
+from numpy.lib.stride_tricks import sliding_window_view
 from numpy import seterr
+from numpy import sort as npSort
 from numpy import sqrt as npSqrt
+from numpy import subtract as npSubtract
 from numpy import sum as npSum
 
 from pandas import DataFrame, Series
 
 from pandas_ta import Imports
+from ._cache import cached
 from ._core import verify_series
+from ._kernels import kernel, kernel_backend
+
+# Weights up to FIR_DIRECT are convolved directly, longer ones by FFT
+FIR_DIRECT = 512
+# Values per block of the NumPy iir, a product with its impulse response
+IIR_BLOCK = 128
+# Values per block of the cumulative sums of rolling_linreg
+LINREG_BLOCK = 1024
+# Estimated relative error of a window's variance above which rolling_linreg
+# computes its 'r' from the window itself
+LINREG_RTOL = 1e-13
+# Windows per block of rolling_mad, or values of its sorted windows / 8
+MAD_BLOCK = 1 << 14
 
 
 def combination(**kwargs: dict) -> int:
@@ -94,6 +137,57 @@ def fibonacci(n: int = 2, **kwargs: dict) -> npNdArray:
         return result
 
 
+def fir(close: Series, w) -> Series:
+    """Finite Impulse Response Filter
+
+    Applies the weights 'w', the first to the oldest value, to every window
+    of 'len(w)' values of 'close' at once, like
+    close.rolling(len(w)).apply(weights(w), raw=True). Windows that are
+    incomplete or contain a NaN are NaN. Up to FIR_DIRECT weights it is a
+    direct convolution, otherwise an FFT one of the source centred on its
+    mean.
+
+    >>> fir(close, [1, 2, 3]) / 6  # wma(close, 3)
+
+    Args:
+        close (pd.Series): Series of 'close's
+        w (list | np.ndarray | pd.Series): The weights.
+
+    Returns:
+        pd.Series: The filtered Series.
+    """
+    w = npArray(w, dtype=float).ravel()
+    close = verify_series(close)
+    if close is None: return
+
+    x = close.to_numpy(dtype=float)
+    n, m = x.size, w.size
+    result = npFull(n, npNaN)
+    if m == 0 or n < m:
+        return Series(result, index=close.index)
+
+    missing = npIsnan(x)
+    gaps = missing.any()
+    if gaps:
+        x = npWhere(missing, 0.0, x)
+
+    if m <= FIR_DIRECT or not npIsfinite(x).all():
+        result[m - 1:] = npConvolve(x, w[::-1], "valid")
+    else:
+        ref = x[~missing].mean()
+        x = npWhere(missing, 0.0, x - ref)
+        size = 1 << (n + m - 2).bit_length()
+        spectrum = npFft.rfft(x, size) * npFft.rfft(w[::-1], size)
+        result[m - 1:] = npFft.irfft(spectrum, size)[m - 1:n] + ref * w.sum()
+
+    if gaps:
+        count = npCumsum(missing)
+        count[m:] -= count[:-m].copy()
+        result[count > 0] = npNaN
+
+    return Series(result, index=close.index)
+
+
 def geometric_mean(series: Series) -> float:
     """Returns the Geometric Mean for a Series of positive values."""
     n = series.size
@@ -109,6 +203,126 @@ def geometric_mean(series: Series) -> float:
     return 0
 
 
+@kernel
+def iir_kernel(b, a, x, z):
+    """Direct form II transposed recurrence of the normalised coefficients
+    'b' and 'a' over the rows of 'x', every column at once, from the state
+    'z' of shape (order, columns). Returns the result and the final state."""
+    n, k = len(x), len(a) - 1
+    columns = len(x[0]) if n > 0 else 0
+    result = npZeros((n, columns))
+    for i in range(n):
+        row, out = x[i], result[i]
+        for c in range(columns):
+            xi = row[c]
+            yi = b[0] * xi + z[0][c] if k > 0 else b[0] * xi
+            for j in range(k - 1):
+                z[j][c] = z[j + 1][c] + b[j + 1] * xi - a[j + 1] * yi
+            if k > 0:
+                z[k - 1][c] = b[k] * xi - a[k] * yi
+            out[c] = yi
+    return result, z
+
+
+def iir(x, b, a, zi=None):
+    """Infinite Impulse Response Filter
+
+    Filters 'x' by the linear recurrence of the coefficients 'b' and 'a',
+    like scipy.signal.lfilter along its rows, every column of a 2-D 'x' at
+    once:
+
+        a[0] * y[n] = b[0] * x[n] + ... + b[M] * x[n - M]
+                      - a[1] * y[n - 1] - ... - a[N] * y[n - N]
+
+    The filter continues from the state 'zi', zero by default, and returns
+    its final one, so filtering a series in chunks equals filtering it at
+    once. NaNs propagate as they do through the recurrence.
+
+    With the numba kernel backend it is a Kernel, otherwise SciPy's lfilter
+    when installed or, by NumPy, products of blocks of IIR_BLOCK values with
+    the filter's impulse and free responses.
+
+    >>> y, state = iir(close, [alpha], [1, alpha - 1])  # An ewm from zero
+    >>> y, state = iir(more, [alpha], [1, alpha - 1], state)
+
+    Args:
+        x (pd.Series | pd.DataFrame | np.ndarray): Values, rows in time.
+        b (list | np.ndarray): The coefficients of the inputs.
+        a (list | np.ndarray): The coefficients of the outputs, a[0] != 0.
+        zi (np.ndarray): The state of a previous call or iir_state(), of
+            shape (order,) or (order, columns). Default: zeros
+
+    Returns:
+        tuple: The filtered 'x', of its type, and the final state.
+    """
+    coefficients = _iir_coefficients(b, a)
+    if coefficients is None: return
+    b, a = coefficients
+    order = a.size - 1
+
+    if isinstance(x, (Series, DataFrame)):
+        values = x.to_numpy(dtype=float)
+    else:
+        values = npArray(x, dtype=float)
+    flat = values.ndim == 1
+    if flat:
+        values = values[:, None]
+    n, columns = values.shape
+
+    z = npZeros((order, columns)) if zi is None else npArray(zi, dtype=float).reshape(order, columns).copy()
+    if order == 0:
+        y = b[0] * values
+    elif kernel_backend() == "numba":
+        y, z = iir_kernel(b, a, values, z)
+        y = y.reshape(n, columns)
+    elif Imports["scipy"]:
+        from scipy.signal import lfilter
+        y, z = lfilter(b, a, values, axis=0, zi=z)
+    else:
+        y, z = _iir_blocks(b, a, values, z)
+
+    if flat:
+        y, z = y[:, 0], z[:, 0]
+    if isinstance(x, Series):
+        y = Series(y, index=x.index)
+    elif isinstance(x, DataFrame):
+        y = DataFrame(y, index=x.index, columns=x.columns)
+    return y, z
+
+
+def iir_state(b, a, y=None, x=None) -> npNdArray:
+    """The state of iir() after the outputs 'y' and inputs 'x', the oldest
+    first, to start it from past values. Missing values are zeros.
+
+    >>> state = iir_state([alpha], [1, alpha - 1], y=[seed])
+
+    Args:
+        b (list | np.ndarray): The coefficients of the inputs.
+        a (list | np.ndarray): The coefficients of the outputs, a[0] != 0.
+        y (list | np.ndarray): The last outputs, 1-D or rows in time.
+        x (list | np.ndarray): The last inputs, 1-D or rows in time.
+
+    Returns:
+        np.ndarray: The state, of shape (order,) or (order, columns).
+    """
+    coefficients = _iir_coefficients(b, a)
+    if coefficients is None: return
+    b, a = coefficients
+    order = a.size - 1
+
+    past = [npArray([] if v is None else v, dtype=float) for v in (y, x)]
+    shape = next((v.shape[1:] for v in past if v.size), ())
+    z = npZeros((order,) + shape)
+    for j in range(order):
+        for i in range(j + 1, order + 1):
+            lag = i - j
+            if lag <= past[0].shape[0]:
+                z[j] -= a[i] * past[0][-lag]
+            if lag <= past[1].shape[0]:
+                z[j] += b[i] * past[1][-lag]
+    return z
+
+
 def linear_regression(x: Series, y: Series) -> dict:
     """Classic Linear Regression in Numpy or Scikit-Learn"""
     x, y = verify_series(x), verify_series(y)
@@ -163,6 +377,310 @@ def pascals_triangle(n: int = None, **kwargs: dict) -> npNdArray:
     return triangle
 
 
+@cached
+def rolling_linreg(close: Series, length: int = None) -> DataFrame:
+    """Rolling Linear Regression
+
+    The least squares line of every window of 'length' values of 'close'
+    against x = 1, 2, ..., length: its 'slope', 'intercept', 'angle' in
+    radians, correlation 'r', its value on the window's last bar as linreg()
+    returns it, slope * (length - 1) + intercept, as 'linreg' and the time
+    series forecast slope * length + intercept as 'tsf'.
+
+    The window sums of y, xy and y^2 are differences of cumulative sums taken
+    over blocks of LINREG_BLOCK values centred on their mean, so their error
+    does not grow with the series. The 'r' of windows whose variance is too
+    small for that error, LINREG_RTOL, is computed from the window itself,
+    and 'r' is clipped to [-1, 1]. Windows with a NaN are NaN.
+
+    >>> lr = rolling_linreg(close, 14)
+    >>> lr["slope"], lr["r"]
+
+    Args:
+        close (pd.Series): Series of 'close's
+        length (int): It's period. Default: 14
+
+    Returns:
+        pd.DataFrame: slope, intercept, angle, r, linreg and tsf columns.
+    """
+    length = int(length) if length and length > 0 else 14
+    close = verify_series(close)
+    if close is None: return
+
+    y = close.to_numpy(dtype=float)
+    n = y.size
+    x_sum = 0.5 * length * (length + 1)
+    x2_sum = x_sum * (2 * length + 1) / 3
+    divisor = length * x2_sum - x_sum * x_sum
+
+    # Window sums of the centred values, their variance and the centre
+    missing = npIsnan(y)
+    y_sum, xy_sum, variance, ref, rn = (npFull(n, npNaN) for _ in range(5))
+    for b0 in range(length - 1, n, LINREG_BLOCK):
+        b1 = min(b0 + LINREG_BLOCK, n)
+        a = b0 - length + 1
+        valid = ~missing[a:b1]
+        mean = y[a:b1][valid].mean() if valid.any() else 0.0
+        c = npWhere(valid, y[a:b1] - mean, 0.0)
+        k = npArange(c.size)
+        cs = npConcatenate(([0.0], npCumsum(c)))
+        cxs = npConcatenate(([0.0], npCumsum(k * c)))
+        c2s = npConcatenate(([0.0], npCumsum(c * c)))
+
+        hi, lo = slice(length, c.size + 1), slice(0, c.size + 1 - length)
+        window = cs[hi] - cs[lo]
+        # sum (j - start + 1) * c[j] = sum j * c[j] - (start - 1) * sum c[j]
+        xy_sum[b0:b1] = cxs[hi] - cxs[lo] - (k[lo] - 1) * window
+        var = length * (c2s[hi] - c2s[lo]) - window * window
+        num = length * xy_sum[b0:b1] - x_sum * window
+        noisy = npFlatnonzero(var * LINREG_RTOL < npFinfo(float).eps * length * c2s[-1])
+        for j in range(0, noisy.size, LINREG_BLOCK):
+            at = noisy[j:j + LINREG_BLOCK]
+            w = c[at[:, None] + npArange(length)]
+            w = w - w.mean(axis=1, keepdims=True)
+            var[at] = length * (w * w).sum(axis=1)
+            num[at] = length * (w @ (npArange(length) - 0.5 * (length - 1)))
+        y_sum[b0:b1], variance[b0:b1], ref[b0:b1], rn[b0:b1] = window, var, mean, num
+
+    if missing.any():
+        count = npCumsum(missing)
+        count[length:] -= count[:-length].copy()
+        y_sum[count > 0] = rn[count > 0] = npNaN
+
+    m = (length * xy_sum - x_sum * y_sum) / divisor
+    b = (y_sum * x2_sum - x_sum * xy_sum) / divisor + ref
+    with npErrstate(divide="ignore", invalid="ignore"):
+        r = npClip(npWhere(variance > 0, rn / npSqrt(divisor * variance), npNaN), -1.0, 1.0)
+
+    return DataFrame({
+        "slope": m, "intercept": b, "angle": npAtan(m), "r": r,
+        "linreg": m * (length - 1) + b, "tsf": m * length + b,
+    }, index=close.index)
+
+
+@kernel
+def rolling_mad_kernel(x, length, min_periods, median):
+    """The mean absolute deviation of each window from its mean or, if
+    'median', the median absolute deviation from its median, from the window
+    kept sorted. Windows with a NaN are NaN."""
+    n = x.shape[0]
+    result = npFull(n, npNaN)
+    w = npEmpty(length)
+    size = missing = 0
+
+    for i in range(n):
+        if i >= length:
+            old = x[i - length]
+            if old != old:
+                missing -= 1
+            elif median:
+                j = 0
+                while w[j] != old:
+                    j += 1
+                for k in range(j, size - 1):
+                    w[k] = w[k + 1]
+                size -= 1
+        if x[i] != x[i]:
+            missing += 1
+        elif median:
+            j = size
+            while j > 0 and w[j - 1] > x[i]:
+                w[j] = w[j - 1]
+                j -= 1
+            w[j] = x[i]
+            size += 1
+
+        count = min(i + 1, length)
+        if missing > 0 or count < min_periods:
+            continue
+
+        if median:
+            # The deviations in increasing order, outwards from the median
+            h = count // 2
+            lo, hi = (count - 1) // 2, count // 2 + count % 2
+            center = w[h] if count % 2 else 0.5 * (w[h - 1] + w[h])
+            previous = deviation = 0.0 if count % 2 else npInf
+            if count % 2:
+                lo -= 1
+            for _ in range(h + 1 - count % 2):
+                d_lo = center - w[lo] if lo >= 0 else npInf
+                d_hi = w[hi] - center if hi < count else npInf
+                previous = deviation
+                if d_lo <= d_hi:
+                    deviation = d_lo
+                    lo -= 1
+                else:
+                    deviation = d_hi
+                    hi += 1
+            result[i] = deviation if count % 2 else 0.5 * (previous + deviation)
+        else:
+            a = i - count + 1
+            center = 0.0
+            for j in range(a, i + 1):
+                center += x[j]
+            center /= count
+            deviation = 0.0
+            for j in range(a, i + 1):
+                deviation += abs(x[j] - center)
+            result[i] = deviation / count
+
+    return result
+
+
+@cached
+def rolling_mad(close: Series, length: int = None, min_periods: int = None, median: bool = False) -> Series:
+    """Rolling Mean, or Median, Absolute Deviation
+
+    The mean absolute deviation of every window of 'length' values of
+    'close' from their mean or, if 'median', the median absolute deviation
+    from their median, a robust scale. Like pandas' rolling apply, a window
+    requires 'min_periods' values and windows with a NaN are NaN.
+
+    Computed by a Kernel with Numba, otherwise with NumPy over blocks of
+    MAD_BLOCK windows: the deviations from the mean a lag at a time, or the
+    median ones from the sorted windows.
+
+    >>> mad = rolling_mad(close, 30)
+    >>> robust_z = (close - close.rolling(30).median()) / (1.4826 * rolling_mad(close, 30, median=True))
+
+    Args:
+        close (pd.Series): Series of 'close's
+        length (int): It's period. Default: 30
+        min_periods (int): Values required for a result. Default: length
+        median (bool): The median absolute deviation. Default: False
+
+    Returns:
+        pd.Series: The deviations.
+    """
+    length = int(length) if length and length > 0 else 30
+    min_periods = max(int(min_periods) if min_periods is not None else length, 1)
+    median = bool(median)
+    close = verify_series(close)
+    if close is None: return
+
+    x = close.to_numpy(dtype=float)
+    if kernel_backend() == "numba":
+        result = rolling_mad_kernel(x, length, min_periods, median)
+    else:
+        n = x.size
+        result = npFull(n, npNaN)
+        if min_periods < length:
+            # The shorter windows of the first values, padded with NaNs
+            head = min(length - 1, n)
+            w = sliding_window_view(npConcatenate((npFull(length - 1, npNaN), x[:head])), length)
+            center = npNanmedian if median else npNanmean
+            with catch_warnings():
+                # Windows of leading NaNs only are "empty" and NaN
+                simplefilter("ignore", RuntimeWarning)
+                result[:head] = center(npAbs(w - center(w, axis=1, keepdims=True)), axis=1)
+        missing = npIsnan(x)
+        if n >= length:
+            # Windows with a NaN are dropped below
+            result[length - 1:] = _rolling_mad(npWhere(missing, 0.0, x), length, median)
+
+        count = npCumsum(~missing)
+        count[length:] -= count[:-length].copy()
+        result[count < min_periods] = npNaN
+        if missing.any():
+            nans = npCumsum(missing)
+            nans[length:] -= nans[:-length].copy()
+            result[nans > 0] = npNaN
+
+    return Series(result, index=close.index)
+
+
+@kernel
+def rolling_minmax_kernel(x, length, min_periods):
+    """Monotonic deques, as ring buffers, of the indices of the candidate
+    maximums and minimums of the window. Equal values replace the earlier
+    ones so the head is the most recent of them."""
+    n = x.shape[0]
+    highest, lowest = npFull(n, npNaN), npFull(n, npNaN)
+    since_highest, since_lowest = npFull(n, npNaN), npFull(n, npNaN)
+    hq, lq = npZeros(length, dtype=npInt64), npZeros(length, dtype=npInt64)
+    h0 = h1 = l0 = l1 = count = 0
+
+    for i in range(n):
+        while h1 > h0 and hq[h0 % length] <= i - length:
+            h0 += 1
+        while l1 > l0 and lq[l0 % length] <= i - length:
+            l0 += 1
+        if i >= length and x[i - length] == x[i - length]:
+            count -= 1
+
+        if x[i] == x[i]:
+            while h1 > h0 and x[hq[(h1 - 1) % length]] <= x[i]:
+                h1 -= 1
+            hq[h1 % length] = i
+            h1 += 1
+            while l1 > l0 and x[lq[(l1 - 1) % length]] >= x[i]:
+                l1 -= 1
+            lq[l1 % length] = i
+            l1 += 1
+            count += 1
+
+        if count >= min_periods:
+            j = hq[h0 % length]
+            highest[i], since_highest[i] = x[j], i - j
+            j = lq[l0 % length]
+            lowest[i], since_lowest[i] = x[j], i - j
+
+    return highest, lowest, since_highest, since_lowest
+
+
+@cached
+def rolling_minmax(close: Series, length: int = None, min_periods: int = None) -> Tuple[Series, Series, Series, Series]:
+    """Rolling Maximum, Minimum and the periods since them
+
+    Returns the rolling max and min of 'close' and how many periods ago, 0
+    being the current one, they occurred, the most recent of equal values.
+    Like pandas' rolling max and min, NaNs are skipped and a window requires
+    'min_periods' values. Computed in O(n) regardless of the 'length', by a
+    monotonic deque Kernel with Numba or otherwise with NumPy's block prefix
+    and suffix maximums (van Herk/Gil-Werman).
+
+    >>> highest, lowest, since_highest, since_lowest = rolling_minmax(close, 14)
+
+    Args:
+        close (pd.Series): Series of 'close's
+        length (int): It's period. Default: 14
+        min_periods (int): Values required for a result. Default: length
+
+    Returns:
+        tuple: max, min, periods since the max, periods since the min
+    """
+    length = int(length) if length and length > 0 else 14
+    min_periods = int(min_periods) if min_periods is not None else length
+    close = verify_series(close)
+    if close is None: return
+
+    x = close.to_numpy(dtype=float)
+    if kernel_backend() == "numba":
+        result = rolling_minmax_kernel(x, length, max(min_periods, 1))
+        highest, lowest, since_highest, since_lowest = result
+    else:
+        missing = npIsnan(x)
+        count = npCumsum(~missing)
+        count[length:] -= count[:-length].copy()
+        incomplete = count < max(min_periods, 1)
+
+        result = []
+        for sign in (1.0, -1.0):
+            values, index = _rolling_max(npWhere(missing, -npInf, sign * x), length)
+            since = (npArange(x.size) - index).astype(float)
+            values = sign * values
+            values[incomplete] = since[incomplete] = npNaN
+            result.append((values, since))
+        (highest, since_highest), (lowest, since_lowest) = result
+
+    return (
+        Series(highest, index=close.index),
+        Series(lowest, index=close.index),
+        Series(since_highest, index=close.index),
+        Series(since_lowest, index=close.index),
+    )
+
+
 def symmetric_triangle(n: int = None, **kwargs: dict) -> Optional[List[int]]:
     """Symmetric Triangle with n >= 2
 
@@ -273,3 +791,158 @@ def _linear_regression_sklearn(x: Series, y: Series) -> dict:
         "line": a + b * x
     }
     return result
+
+
+def _rolling_max(x: npNdArray, length: int) -> Tuple[npNdArray, npNdArray]:
+    """Rolling max of 'x' and its index, the last of equal values, from the
+    running maximums of 'length' blocks forwards and backwards. A window
+    ending at 't' is the suffix of one block and the prefix of the next."""
+    n = x.size
+    blocks = -(-n // length)
+    padded = npConcatenate((x, npFull(blocks * length - n, -npInf))).reshape(blocks, length)
+    position = npArange(blocks * length).reshape(blocks, length)
+
+    # Prefix maximums and the index of their last occurrence
+    prefix = npMaximum.accumulate(padded, axis=1)
+    prefix_at = npMaximum.accumulate(npWhere(padded == prefix, position, -1), axis=1)
+
+    # Suffix maximums and the index of their last occurrence, where the
+    # reversed running maximum last increased
+    reverse = padded[:, ::-1]
+    suffix = npMaximum.accumulate(reverse, axis=1)
+    new = npConcatenate((npFull((blocks, 1), True), reverse[:, 1:] > suffix[:, :-1]), axis=1)
+    suffix_at = npMaximum.accumulate(npWhere(new, npArange(length), 0), axis=1)
+    suffix_at = (position[:, :1] + length - 1 - suffix_at)[:, ::-1]
+    suffix = suffix[:, ::-1]
+
+    prefix, prefix_at = prefix.ravel()[:n], prefix_at.ravel()[:n]
+    suffix, suffix_at = suffix.ravel()[:n], suffix_at.ravel()[:n]
+
+    # Windows [t - length + 1, t]; the first 'length - 1' are prefixes
+    values, index = prefix.copy(), prefix_at.copy()
+    if n >= length:
+        start, end = slice(0, n - length + 1), slice(length - 1, n)
+        earlier = suffix[start] > prefix[end]
+        values[end] = npWhere(earlier, suffix[start], prefix[end])
+        index[end] = npWhere(earlier, suffix_at[start], prefix_at[end])
+    return values, index
+
+
+def _rolling_mad(x: npNdArray, length: int, median: bool) -> npNdArray:
+    """The deviations of the complete windows of 'x', over blocks of
+    MAD_BLOCK windows. Those from the mean are summed a lag at a time over
+    the block. With the windows sorted, in blocks of 8 * MAD_BLOCK values,
+    the 'h' deviations from the median nearest to it are contiguous, so the
+    h-th smallest is the least of the furthest deviations of the runs of 'h'
+    values."""
+    n = x.size - length + 1
+    result = npZeros(n)
+    if median:
+        rows = max(8 * MAD_BLOCK // length, 1)
+        windows = sliding_window_view(x, length)
+        h = length // 2
+        for r0 in range(0, n, rows):
+            w = npSort(windows[r0:r0 + rows], axis=1)
+            center = 0.5 * (w[:, (length - 1) // 2] + w[:, h])
+            for k in ([h + 1] if length % 2 else [h, h + 1]):
+                deviation = npMaximum(center - w[:, 0], w[:, k - 1] - center)
+                for j in range(1, length - k + 1):
+                    npMinimum(deviation, npMaximum(center - w[:, j], w[:, j + k - 1] - center), out=deviation)
+                result[r0:r0 + w.shape[0]] += deviation
+        if not length % 2:
+            result *= 0.5
+    else:
+        buffer = npEmpty(min(MAD_BLOCK, n))
+        for r0 in range(0, n, MAD_BLOCK):
+            r1 = min(r0 + MAD_BLOCK, n)
+            center, deviation, d = npZeros(r1 - r0), result[r0:r1], buffer[:r1 - r0]
+            for k in range(length):
+                center += x[r0 + k:r1 + k]
+            center /= length
+            for k in range(length):
+                npSubtract(x[r0 + k:r1 + k], center, out=d)
+                deviation += npAbs(d, out=d)
+        result /= length
+    return result
+
+
+def _iir_coefficients(b, a) -> Tuple[npNdArray, npNdArray]:
+    """The coefficients 'b' and 'a' of iir(), normalised by a[0] and padded
+    with zeros to the same length."""
+    b, a = npArray(b, dtype=float).ravel(), npArray(a, dtype=float).ravel()
+    if not a.size or a[0] == 0:
+        print("[X] The first 'a' coefficient must be non-zero.")
+        return
+    size = max(a.size, b.size)
+    b = npConcatenate((b, npZeros(size - b.size))) / a[0]
+    a = npConcatenate((a, npZeros(size - a.size))) / a[0]
+    return b, a
+
+
+def _iir_response(b: npNdArray, a: npNdArray, size: int) -> Tuple[npNdArray, npNdArray, npNdArray]:
+    """The filter's impulse response, the states it passes through and the
+    free responses from each unit state, over 'size' steps."""
+    order = a.size - 1
+    x = npZeros((size, order + 1))
+    x[0, 0] = 1.0
+    z = npConcatenate((npZeros((order, 1)), npEye(order)), axis=1)
+    outputs, _ = iir_kernel(b, a, x, z)
+    outputs = npArray(outputs, dtype=float).reshape(size, order + 1)
+
+    # The states of the impulse response from its past inputs and outputs
+    impulse = outputs[:, 0]
+    padded = [npConcatenate((npZeros(order), v)) for v in (x[:, 0], impulse)]
+    states = npZeros((size, order))
+    for k in range(order):
+        for i in range(k + 1, order + 1):
+            lag = order - (i - k) + 1
+            states[:, k] += b[i] * padded[0][lag:lag + size] - a[i] * padded[1][lag:lag + size]
+    return impulse, states, outputs[:, 1:]
+
+
+def _iir_blocks(b: npNdArray, a: npNdArray, x: npNdArray, z: npNdArray) -> Tuple[npNdArray, npNdArray]:
+    """iir() by NumPy. Within a block, the result is the product of the
+    inputs with the impulse response plus that of the state with the free
+    responses, and so is the next state. Only the states between the blocks
+    are carried one by one. From the first non finite value, the rest is
+    filtered by the Kernel. A first order filter of a stable pole, like an
+    ewm, is pandas' ewm of its scaled inputs."""
+    n, columns = x.shape
+    order = a.size - 1
+    finite = npIsfinite(x).all(axis=1)
+    f = n if finite.all() else int(finite.argmin())
+    if f < order: f = 0
+    y = npEmpty((n, columns))
+
+    if f and order == 1 and 0 < -a[1] < 1:
+        inputs = b[0] * x[:f]
+        inputs[1:] += b[1] * x[:f - 1]
+        inputs[0] += z[0]
+        inputs[1:] /= 1 + a[1]
+        y[:f] = DataFrame(inputs).ewm(alpha=1 + a[1], adjust=False).mean().to_numpy()
+        z = iir_state(b, a, y=y[f - 1:f], x=x[f - 1:f])
+    elif f:
+        size = min(IIR_BLOCK, f)
+        impulse, states, free = _iir_response(b, a, size)
+        lags = npArange(size)[:, None] - npArange(size)
+        response = npWhere(lags >= 0, impulse[lags.clip(0)], 0.0)
+        transition = iir_state(b, a, y=free[-order:])
+
+        # The last block is padded with zeros
+        blocks = -(-f // size)
+        xb = npZeros((blocks * size, columns))
+        xb[:f] = x[:f]
+        xb = xb.reshape(blocks, size, columns)
+        zb = npEmpty((blocks, order, columns))
+        carried = npMatmul(states[::-1].T, xb)
+        for i in range(blocks):
+            zb[i] = z
+            z = transition @ z + carried[i]
+        y[:f] = (npMatmul(response, xb) + npMatmul(free, zb)).reshape(-1, columns)[:f]
+        z = iir_state(b, a, y=y[f - order:f], x=x[f - order:f])
+
+    if f < n:
+        rest, z = iir_kernel(b, a, x[f:], z)
+        y[f:] = rest.reshape(n - f, columns)
+        z = npArray(z, dtype=float).reshape(order, columns)
+    return y, z
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_minmax, verify_series
 
 
 def donchian(high, low, lower_length=None, upper_length=None, offset=None, **kwargs):
@@ -18,8 +18,8 @@ def donchian(high, low, lower_length=None, upper_length=None, offset=None, **kwa
     if high is None or low is None: return
 
     # Calculate Result
-    lower = low.rolling(lower_length, min_periods=lower_min_periods).min()
-    upper = high.rolling(upper_length, min_periods=upper_min_periods).max()
+    lower = rolling_minmax(low, lower_length, lower_min_periods)[1]
+    upper = rolling_minmax(high, upper_length, upper_min_periods)[0]
     mid = 0.5 * (lower + upper)
 
     # Handle fills
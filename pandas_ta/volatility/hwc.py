@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 from numpy import sqrt as npSqrt
+from numpy import zeros as npZeros
 from pandas import DataFrame, Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.overlap.hwma import hwma_coefficients
+from pandas_ta.utils import get_offset, iir, verify_series
 
 
 def hwc(close, na=None, nb=None, nc=None, nd=None, scalar=None, channel_eval=None, offset=None, **kwargs):
@@ -17,45 +19,25 @@ def hwc(close, na=None, nb=None, nc=None, nd=None, scalar=None, channel_eval=Non
     offset = get_offset(offset)
 
     # Calculate Result
-    last_a = last_v = last_var = 0
-    last_f = last_price = last_result = close[0]
-    lower, result, upper = [], [], []
-    chan_pct_width, chan_width = [], []
-
-    m = close.size
-    for i in range(m):
-        F = (1.0 - na) * (last_f + last_v + 0.5 * last_a) + na * close[i]
-        V = (1.0 - nb) * (last_v + last_a) + nb * (F - last_f)
-        A = (1.0 - nc) * last_a + nc * (V - last_v)
-        result.append((F + V + 0.5 * A))
-
-        var = (1.0 - nd) * last_var + nd * (last_price - last_result) * (last_price - last_result)
-        stddev = npSqrt(last_var)
-        upper.append(result[i] + scalar * stddev)
-        lower.append(result[i] - scalar * stddev)
+    # The HWMA starts at rest on the first close: F = close[0], V = A = 0
+    x = close.to_numpy(dtype=float)
+    result, _ = iir(x - x[0], *hwma_coefficients(na, nb, nc))
+    result += x[0]
+
+    # The variance of the last price about the last HWMA
+    error = npZeros(x.size)
+    error[1:] = (x[:-1] - result[:-1]) ** 2
+    var, _ = iir(error, [nd], [1, nd - 1])
+    stddev = npZeros(x.size)
+    stddev[1:] = npSqrt(var[:-1])
 
-        if channel_eval:
-            # channel width
-            chan_width.append(upper[i] - lower[i])
-            # channel percentage price position
-            chan_pct_width.append((close[i] - lower[i]) / (upper[i] - lower[i]))
-            # print('channel_eval (width|percentageWidth):', chan_width[i], chan_pct_width[i])
-
-        # update values
-        last_price = close[i]
-        last_a = A
-        last_f = F
-        last_v = V
-        last_var = var
-        last_result = result[i]
-
-    # Aggregate
     hwc = Series(result, index=close.index)
-    hwc_upper = Series(upper, index=close.index)
-    hwc_lower = Series(lower, index=close.index)
+    hwc_upper = Series(result + scalar * stddev, index=close.index)
+    hwc_lower = Series(result - scalar * stddev, index=close.index)
     if channel_eval:
-        hwc_width = Series(chan_width, index=close.index)
-        hwc_pctwidth = Series(chan_pct_width, index=close.index)
+        # channel width and percentage price position
+        hwc_width = hwc_upper - hwc_lower
+        hwc_pctwidth = (close - hwc_lower) / hwc_width
 
     # Offset
     if offset != 0:
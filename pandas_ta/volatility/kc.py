@@ -2,9 +2,10 @@
 from pandas import DataFrame
 from .true_range import true_range
 from pandas_ta.overlap import ma
-from pandas_ta.utils import get_offset, high_low_range, verify_series
+from pandas_ta.utils import cached, get_offset, high_low_range, verify_series
 
 
+@cached
 def kc(high, low, close, length=None, scalar=None, mamode=None, offset=None, **kwargs):
     """Indicator: Keltner Channels (KC)"""
     # Validate arguments
@@ -2,9 +2,10 @@
 from numpy import nan as npNaN
 from pandas import concat
 from pandas_ta import Imports
-from pandas_ta.utils import get_drift, get_offset, non_zero_range, verify_series
+from pandas_ta.utils import cached, get_drift, get_offset, non_zero_range, verify_series
 
 
+@cached
 def true_range(high, low, close, talib=None, drift=None, offset=None, **kwargs):
     """Indicator: True Range"""
     # Validate arguments
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from numpy import sqrt as npsqrt
 from pandas_ta.overlap import sma
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_minmax, verify_series
 
 
 def ui(close, length=None, scalar=None, offset=None, **kwargs):
@@ -15,7 +15,7 @@ def ui(close, length=None, scalar=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    highest_close = close.rolling(length).max()
+    highest_close = rolling_minmax(close, length)[0]
     downside = scalar * (close - highest_close)
     downside /= highest_close
     d2 = downside * downside
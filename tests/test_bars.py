@@ -0,0 +1,100 @@
+from unittest import TestCase
+
+from numpy import cumsum
+from numpy.random import default_rng
+from pandas import DataFrame, DatetimeIndex, Timestamp, concat
+from pandas.testing import assert_frame_equal
+
+from .context import pandas_ta
+
+
+class TestBars(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = default_rng(7)
+        n = 200_000
+        cls.prices = 100 + cumsum(rng.normal(0, 0.01, n))
+        cls.volumes = rng.integers(1, 100, n).astype(float)
+        cls.timestamps = DatetimeIndex(
+            Timestamp("2024-01-02 09:30").value + cumsum(rng.integers(1, 50_000_000, n))
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.prices, cls.volumes, cls.timestamps
+
+    def setUp(self): pass
+    def tearDown(self): pass
+
+
+    def build(self, kind, size, chunk, timestamps=None, **kwargs):
+        timestamps = self.timestamps if timestamps is None else timestamps
+        builder = pandas_ta.BarBuilder(kind, size, **kwargs)
+        for i in range(0, self.prices.size, chunk):
+            builder.update(self.prices[i:i + chunk], self.volumes[i:i + chunk], timestamps[i:i + chunk])
+        return builder
+
+    def test_time_bars(self):
+        trades = DataFrame({x: self.prices for x in ["open", "high", "low", "close"]}, index=self.timestamps)
+        trades["volume"] = self.volumes
+        expected = trades.resample("1min").agg(pandas_ta.CANGLE_AGG).dropna()
+        expected["trades"] = trades["close"].resample("1min").count()[expected.index]
+
+        result = self.build("time", "1min", 10_000).flush(partial=True)
+        assert_frame_equal(result, expected, check_freq=False, check_names=False)
+
+    def test_bars_timezone(self):
+        timestamps = self.timestamps.tz_localize("UTC").tz_convert("America/New_York")
+        for kind, size in [("time", "1min"), ("volume", 5000)]:
+            with self.subTest(kind=kind):
+                expected = self.build(kind, size, 10_000).flush(partial=True)
+                expected.index = expected.index.tz_localize("UTC").tz_convert(timestamps.tz)
+                result = self.build(kind, size, 10_000, timestamps=timestamps).flush(partial=True)
+                assert_frame_equal(result, expected)
+
+                builder = pandas_ta.BarBuilder(kind, size)
+                for price, volume, timestamp in zip(self.prices[:5000], self.volumes[:5000], timestamps[:5000]):
+                    builder.update(price, volume, timestamp)
+                trades = builder.flush()
+                assert_frame_equal(trades, result.iloc[:trades.shape[0]])
+
+    def test_bars(self):
+        for kind, size in [("tick", 100), ("volume", 5000), ("dollar", 500_000)]:
+            with self.subTest(kind=kind):
+                result = self.build(kind, size, 10_000).flush(partial=True)
+                assert_frame_equal(self.build(kind, size, 777).flush(partial=True), result)
+
+                builder = pandas_ta.BarBuilder(kind, size)
+                for price, volume, timestamp in zip(self.prices[:5000], self.volumes[:5000], self.timestamps[:5000]):
+                    builder.update(price, volume, timestamp)
+                trades = builder.flush()
+                assert_frame_equal(trades, result.iloc[:trades.shape[0]])
+                self.assertEqual(result["volume"].sum(), self.volumes.sum())
+
+        result = self.build("tick", 100, 10_000).flush()
+        self.assertTrue((result["trades"] == 100).all())
+        self.assertEqual(result.shape[0], self.prices.size // 100)
+
+    def test_bars_streams(self):
+        custom = pandas_ta.Strategy("Bars", ta=[{"kind": "sma", "length": 10}, {"kind": "rsi"}])
+        live = pandas_ta.StreamingStrategy(custom)
+        rsi = pandas_ta.stream.RSI()
+        batches = []
+        builder = self.build("volume", 5000, 10_000, capacity=64, streams=[live, rsi], on_batch=batches.append)
+        bars = concat(batches + [builder.flush()])
+        self.assertGreater(len(batches), 1)
+        self.assertEqual(live.ts, bars.index[-1])
+
+        self.assertEqual(builder.flush().shape[0], 0)
+        assert_frame_equal(bars, self.build("volume", 5000, 10_000).flush())
+        # As the bars updated a bar at a time
+        replayed = pandas_ta.stream.Stream.seed(pandas_ta.stream.RSI(), bars["close"])
+        self.assertEqual(rsi.checkpoint(), replayed.checkpoint())
+
+        # The next bar continues from the bars that were pushed
+        bars = concat([bars, bars.iloc[-1:]])
+        row = live.push(*bars.iloc[-1, :5])
+        bars.ta.cores = 0
+        bars.ta.strategy(custom)
+        self.assertAlmostEqual(row["SMA_10"], bars["SMA_10"].iloc[-1], places=9)
+        self.assertAlmostEqual(row["RSI_14"], bars["RSI_14"].iloc[-1], places=9)
@@ -36,3 +36,6 @@ class TestCandleExtension(TestCase):
         self.data.ta.ha(append=True)
         self.assertIsInstance(self.data, DataFrame)
         self.assertEqual(list(self.data.columns[-4:]), ["HA_open", "HA_high", "HA_low", "HA_close"])
+
+        self.data.ta.ha(timeframe="W", append=True)
+        self.assertEqual(list(self.data.columns[-4:]), ["HA_open_W", "HA_high_W", "HA_low_W", "HA_close_W"])
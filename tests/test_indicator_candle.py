@@ -3,6 +3,7 @@ from .context import pandas_ta
 
 from unittest import TestCase, skip
 import pandas.testing as pdt
+from numpy import nan as npNaN
 from pandas import DataFrame, Series
 
 import talib as tal
@@ -39,6 +40,36 @@ class TestCandle(TestCase):
         self.assertIsInstance(result, DataFrame)
         self.assertEqual(result.name, "Heikin-Ashi")
 
+        # The first order recurrence of HA_open
+        ha_close = result["HA_close"]
+        expected = 0.5 * (result["HA_open"].shift(1) + ha_close.shift(1))
+        pdt.assert_series_equal(result["HA_open"].iloc[1:], expected.iloc[1:], check_names=False)
+        self.assertEqual(result["HA_open"].iloc[0], 0.5 * (self.open.iloc[0] + self.close.iloc[0]))
+
+        # Like the recurrence, a NaN makes the later HA_opens NaN
+        close = self.close.copy()
+        close.iloc[10] = npNaN
+        result = pandas_ta.ha(self.open, self.high, self.low, close)
+        self.assertTrue(result["HA_open"].iloc[11:].isna().all())
+        self.assertFalse(result["HA_open"].iloc[:11].isna().any())
+
+    def test_ha_timeframe(self):
+        result = pandas_ta.ha(self.open, self.high, self.low, self.close, timeframe="W")
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.name, "Heikin-Ashi_W")
+        self.assertEqual(list(result.columns), ["HA_open_W", "HA_high_W", "HA_low_W", "HA_close_W"])
+        self.assertTrue(result.index.equals(self.close.index))
+
+        # The last bar of each week is the HA of the weekly bars
+        week = self.close.index.to_period("W")
+        ohlc = DataFrame({"open": self.open, "high": self.high, "low": self.low, "close": self.close})
+        weekly = ohlc.groupby(week).agg({k: v for k, v in pandas_ta.CANGLE_AGG.items() if k in ohlc})
+        expected = pandas_ta.ha(weekly["open"], weekly["high"], weekly["low"], weekly["close"])
+        last = result[~week.duplicated(keep="last")]
+        pdt.assert_frame_equal(DataFrame(last.to_numpy(), columns=expected.columns), expected.reset_index(drop=True))
+
+        self.assertIsNone(pandas_ta.ha(self.open.reset_index(drop=True), self.high, self.low, self.close.reset_index(drop=True), timeframe="W"))
+
     def test_cdl_pattern(self):
         result = pandas_ta.cdl_pattern(self.open, self.high, self.low, self.close, name="all")
         self.assertIsInstance(result, DataFrame)
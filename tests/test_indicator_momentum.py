@@ -1,7 +1,7 @@
 from .config import error_analysis, sample_data, CORRELATION, CORRELATION_THRESHOLD, VERBOSE
 from .context import pandas_ta
 
-from unittest import TestCase, skip
+from unittest import TestCase
 import pandas.testing as pdt
 from pandas import DataFrame, Series
 
@@ -484,18 +484,34 @@ class TestMomentum(TestCase):
             except Exception as ex:
                 error_analysis(result.iloc[:, 0], CORRELATION, ex, newline=False)
 
-    @skip
     def test_td_seq(self):
-        """TS Sequential: Working but SLOW implementation"""
         result = pandas_ta.td_seq(self.close)
         self.assertIsInstance(result, DataFrame)
         self.assertEqual(result.name, "TD_SEQ")
+        self.assertTrue(result.index.equals(self.close.index))
+
+        close = Series([5, 5, 5, 5, 6, 7, 8, 9, 10, 4, 3, 2, 1, 0] + list(range(20)), dtype=float)
+        result = pandas_ta.td_seq(close)
+        self.assertEqual(result["TD_SEQ_UPa"].iloc[4:9].tolist(), [1, 2, 3, 4, 5])
+        self.assertEqual(result["TD_SEQ_DNa"].iloc[9:15].tolist(), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(result["TD_SEQ_UPa"].iloc[-1], 13)
+
+        result = pandas_ta.td_seq(close, show_all=False, asint=True)
+        self.assertEqual(list(result.columns), ["TD_SEQ_UP", "TD_SEQ_DN"])
+        self.assertEqual(result["TD_SEQ_UP"].iloc[20:26].tolist(), [0, 6, 7, 8, 9, 0])
 
     def test_trix(self):
         result = pandas_ta.trix(self.close)
         self.assertIsInstance(result, DataFrame)
         self.assertEqual(result.name, "TRIX_30_9")
 
+        # The chain of emas by one filter per ema
+        result = pandas_ta.trix(self.close, talib=False)
+        ema3 = self.close
+        for _ in range(3):
+            ema3 = pandas_ta.ema(ema3, 30, talib=False)
+        pdt.assert_series_equal(result["TRIX_30_9"], 100 * ema3.pct_change(), check_names=False)
+
     def test_tsi(self):
         result = pandas_ta.tsi(self.close)
         self.assertIsInstance(result, DataFrame)
@@ -2,6 +2,7 @@ from .config import CORRELATION, CORRELATION_THRESHOLD, error_analysis, sample_d
 from .context import pandas_ta
 
 from unittest import TestCase
+from numpy import nan as npNaN
 import pandas.testing as pdt
 from pandas import DataFrame, Series
 
@@ -144,6 +145,21 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "JMA_7_0")
 
+    def test_jma_update(self):
+        expected = pandas_ta.jma(self.close, length=10, phase=20)
+
+        smoother = pandas_ta.JMA(length=10, phase=20)
+        result = Series([smoother.update(x) for x in self.close], index=self.close.index)
+        pdt.assert_series_equal(result, expected, check_names=False)
+
+        smoother = pandas_ta.JMA(length=10, phase=20)
+        head = smoother.update(self.close.iloc[:100].to_numpy())
+        tail = smoother.update(self.close.iloc[100:].to_numpy())
+        self.assertEqual(head.size, 100)
+        self.assertTrue(Series(head[:9]).isna().all())
+        result = Series(head.tolist() + tail.tolist(), index=self.close.index)
+        pdt.assert_series_equal(result, expected, check_names=False)
+
     def test_ichimoku(self):
         ichimoku, span = pandas_ta.ichimoku(self.high, self.low, self.close)
         self.assertIsInstance(ichimoku, DataFrame)
@@ -250,6 +266,22 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "MCGD_10")
 
+    def test_mcgd_update(self):
+        close = self.close.copy()
+        close.iloc[50] = npNaN
+        expected = pandas_ta.mcgd(close, length=20, c=0.6)
+
+        dynamic = pandas_ta.MCGD(length=20, c=0.6)
+        result = Series([dynamic.update(x) for x in close], index=close.index)
+        pdt.assert_series_equal(result, expected, check_names=False)
+
+        dynamic = pandas_ta.MCGD(length=20, c=0.6)
+        head = dynamic.update(close.iloc[:51].to_numpy())
+        tail = dynamic.update(close.iloc[51:].to_numpy())
+        self.assertTrue(Series(head[-1:].tolist() + tail[:1].tolist()).isna().all())
+        result = Series(head.tolist() + tail.tolist(), index=close.index)
+        pdt.assert_series_equal(result, expected, check_names=False)
+
     def test_midpoint(self):
         result = pandas_ta.midpoint(self.close, talib=False)
         self.assertIsInstance(result, Series)
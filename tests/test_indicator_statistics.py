@@ -49,6 +49,10 @@ class TestStatistics(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "MAD_30")
 
+        result = pandas_ta.mad(self.close, median=True)
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result.name, "MADm_30")
+
     def test_median(self):
         result = pandas_ta.median(self.close)
         self.assertIsInstance(result, Series)
@@ -0,0 +1,100 @@
+from math import isclose, isnan
+from unittest import skipUnless, TestCase
+
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+from .config import sample_data
+from .context import pandas_ta
+
+
+# The (sum, last value) of each column before the indicators were ported
+# onto Kernels
+EXPECTED = {
+    "psar": {"PSARl_0.02_0.2": (498925.462279, 338.286916384), "PSARs_0.02_0.2": (346291.765411, float("nan")), "PSARaf_0.02_0.2": (408.88, 0.12), "PSARr_0.02_0.2": (537.0, 0.0)},
+    "supertrend": {"SUPERT_7_3.0": (849193.689031, 340.400948421), "SUPERTd_7_3.0": (721.0, 1.0), "SUPERTl_7_3.0": (487939.11441, 340.400948421), "SUPERTs_7_3.0": (361254.574621, float("nan"))},
+    "hilo": {"HILO_13_21": (841820.240544, 335.43832381), "HILOl_13_21": (596968.436105, 335.43832381), "HILOs_13_21": (412037.849515, float("nan"))},
+    "qqe": {"QQE_14_5_4.236": (273363.856179, 72.1583892125), "QQE_14_5_4.236_RSIMA": (280680.510616, 76.3843578247), "QQEl_14_5_4.236": (149665.437292, 72.1583892125), "QQEs_14_5_4.236": (123698.418887, float("nan"))},
+    "vidya": {"VIDYA_14": (840814.714049, 334.031943507)},
+    "kama": {"KAMA_10_2_30": (846946.972299, 345.263250655)},
+    "ssf": {"SSF_10_2": (850216.602288, 347.838590183)},
+    "ssf3": {"SSF_10_3": (850222.580261, 346.79571427)},
+    "hwma": {"HWMA_0.2_0.1_0.1": (850426.800782, 348.762242238)},
+    "fisher": {"FISHERT_9_1": (2907.40728576, 4.28001375538), "FISHERTs_9_1": (2903.127272, 3.89537223919)},
+    "rsx": {"RSX_14": (285742.525936, 85.4527254917)},
+    "ebsw": {"EBSW_40_10": (813.528109861, 0.999303034697)},
+    "jma": {"JMA_7_0": (848667.076838, 346.724055617)},
+    "mcgd": {"MCGD_10": (846417.200364, 337.765648491)},
+}
+
+
+class TestKernels(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = sample_data
+        cls.high = cls.data["high"]
+        cls.low = cls.data["low"]
+        cls.close = cls.data["close"]
+        cls.backend = pandas_ta.kernel_backend()
+
+    @classmethod
+    def tearDownClass(cls):
+        pandas_ta.kernel_backend(cls.backend)
+        del cls.data
+
+    def setUp(self): pass
+    def tearDown(self):
+        pandas_ta.kernel_backend(self.backend)
+
+
+    def indicators(self) -> dict:
+        h, l, c = self.high, self.low, self.close
+        results = {
+            "psar": pandas_ta.psar(h, l, c),
+            "supertrend": pandas_ta.supertrend(h, l, c),
+            "hilo": pandas_ta.hilo(h, l, c),
+            "qqe": pandas_ta.qqe(c),
+            "vidya": pandas_ta.vidya(c),
+            "kama": pandas_ta.kama(c),
+            "ssf": pandas_ta.ssf(c),
+            "ssf3": pandas_ta.ssf(c, poles=3),
+            "hwma": pandas_ta.hwma(c),
+            "fisher": pandas_ta.fisher(h, l),
+            "rsx": pandas_ta.rsx(c),
+            "ebsw": pandas_ta.ebsw(c),
+            "jma": pandas_ta.jma(c),
+            "mcgd": pandas_ta.mcgd(c),
+        }
+        return {k: v if isinstance(v, DataFrame) else v.to_frame() for k, v in results.items()}
+
+    def assert_expected(self, results: dict):
+        for kind, columns in EXPECTED.items():
+            result = results[kind]
+            self.assertEqual(list(result.columns), list(columns))
+            for column, (total, last) in columns.items():
+                with self.subTest(kind=kind, column=column):
+                    self.assertTrue(isclose(result[column].sum(), total, rel_tol=1e-9))
+                    x = result[column].iloc[-1]
+                    self.assertTrue(isnan(x) if isnan(last) else isclose(x, last, rel_tol=1e-9))
+
+    def test_kernel_backend(self):
+        self.assertIn(pandas_ta.kernel_backend(), pandas_ta.KERNEL_BACKENDS)
+        self.assertEqual(pandas_ta.kernel_backend("numpy"), "numpy")
+        self.assertEqual(pandas_ta.kernel_backend("fortran"), "numpy")
+        if not pandas_ta.Imports["numba"]:
+            self.assertEqual(pandas_ta.kernel_backend("numba"), "numpy")
+
+    def test_numpy_kernels(self):
+        pandas_ta.kernel_backend("numpy")
+        self.assert_expected(self.indicators())
+
+    @skipUnless(pandas_ta.Imports["numba"], "numba not installed")
+    def test_numba_kernels(self):
+        pandas_ta.kernel_backend("numpy")
+        expected = self.indicators()
+        pandas_ta.kernel_backend("numba")
+        results = self.indicators()
+        self.assert_expected(results)
+        for kind in expected:
+            with self.subTest(kind=kind):
+                assert_frame_equal(results[kind], expected[kind], rtol=1e-9)
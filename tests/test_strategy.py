@@ -1,13 +1,20 @@
 # Must run seperately from the rest of the tests
 # in order to successfully run
+import asyncio
+import gc
 from multiprocessing import cpu_count
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from time import perf_counter
 
 from .config import sample_data
 from .context import pandas_ta
 
 from unittest import skip, skipUnless, TestCase
-from pandas import DataFrame
+from unittest.mock import patch
+from weakref import ref
+from pandas import DataFrame, Index, concat
+from pandas.testing import assert_frame_equal, assert_series_equal
 
 # Strategy Testing Parameters
 cores = cpu_count()
@@ -91,6 +98,80 @@ class TestStrategyMethods(TestCase):
         self.category = "All"
         self.data.ta.strategy(self.category, verbose=verbose, timed=strategy_timed)
 
+    def test_all_shared_memory(self):
+        self.category = "All with Shared Memory"
+        self.data.ta.strategy(shm=True, verbose=verbose, timed=strategy_timed)
+
+    def test_astrategy(self):
+        self.category = "Async Strategy"
+        serial = self.data.copy()
+        serial.ta.cores = 0
+        serial.ta.strategy("momentum")
+
+        async def stream(df):
+            kinds, columns = [], df.shape[1]
+            async for kind, _ in df.ta.astream("momentum"):
+                # Appended once the indicators of the wave stop reading it
+                self.assertEqual(df.shape[1], columns)
+                kinds.append(kind)
+            return kinds
+
+        df = self.data.copy()
+        kinds = asyncio.run(stream(df))
+        self.assertIn("rsi", kinds)
+        self.assertEqual(len(kinds), len(pandas_ta.Category["momentum"]))
+        self.assertTrue(df.equals(serial))
+
+        rsi = asyncio.run(pandas_ta.acompute("rsi", self.data, length=10))
+        self.assertEqual(rsi.name, "RSI_10")
+        asyncio.run(self.data.ta.astrategy(pandas_ta.CommonStrategy, verbose=verbose))
+
+        # The indicators still running after a timeout finish without
+        # keeping the DataFrame or their sub-indicators
+        self.assertRaises(asyncio.TimeoutError, asyncio.run, df.ta.astrategy(timeout=0))
+        df = ref(df)
+        gc.collect()
+        self.assertIsNone(df())
+
+    def test_all_threads(self):
+        self.category = "All with Threads"
+        self.data.ta.strategy(backend="threads", verbose=verbose, timed=strategy_timed)
+
+        # The cache of the sub-indicators does not outlive the run
+        df = self.data.iloc[:, :5].copy()
+        df.ta.strategy("momentum", backend="threads")
+        df = ref(df)
+        gc.collect()
+        self.assertIsNone(df())
+
+    def test_all_persistent_engine(self):
+        self.category = "All with a persistent Engine"
+        with pandas_ta.Engine(cores=cores) as engine:
+            self.data.ta.strategy(pandas_ta.CommonStrategy, engine=engine, verbose=verbose)
+            self.data.drop(columns=["SMA_10", "SMA_20", "SMA_50", "SMA_200", "VOL_SMA_20"], inplace=True)
+            self.data.ta.strategy(engine=engine, verbose=verbose, timed=strategy_timed)
+        self.assertFalse(engine.running)
+        self.assertRaises(RuntimeError, lambda: engine.pool)
+
+    @skipUnless(pandas_ta.has_shared_memory() and Path("/proc/self/maps").exists(), "shared memory mappings of /proc only")
+    def test_persistent_engine_releases_shared_memory(self):
+        self.category = "Persistent Engine Shared Memory"
+
+        def mappings(pid):
+            with open(f"/proc/{pid}/maps") as f:
+                return sum("/psm_" in line and "(deleted)" in line for line in f)
+
+        with pandas_ta.Engine(cores=cores) as engine:
+            for _ in range(10):
+                df = self.data[["open", "high", "low", "close", "volume"]].copy()
+                df.ta.strategy(pandas_ta.CommonStrategy, engine=engine, shm=True)
+            self.data.ta.strategy(pandas_ta.CommonStrategy, engine=engine, shm=True, verbose=verbose)
+            # Only the frame of the last run may still be attached
+            with pandas_ta.SharedFrame(self.data.iloc[:1]) as frame:
+                segments = len(frame._shms)
+            for worker in engine.pool._pool:
+                self.assertLessEqual(mappings(worker.pid), segments)
+
     # @skipUnless(verbose, "verbose mode only")
     def test_all_multiparams_strategy(self):
         self.category = "All"
@@ -109,6 +190,64 @@ class TestStrategyMethods(TestCase):
         self.category = "Common"
         self.data.ta.strategy(pandas_ta.CommonStrategy, verbose=verbose, timed=strategy_timed)
 
+    def test_common_rerun(self):
+        self.category = "Common Rerun"
+        self.data.ta.strategy(pandas_ta.CommonStrategy, verbose=verbose, timed=strategy_timed)
+        columns = list(self.data.columns)
+        self.data.ta.strategy(pandas_ta.CommonStrategy, verbose=verbose, timed=strategy_timed)
+        self.assertEqual(list(self.data.columns), columns)
+
+    def test_custom_assembly(self):
+        self.category = "Custom Assembly"
+        chunk = pandas_ta.ASSEMBLY_CHUNK
+        ta = [{"kind": "sma", "length": 5, "col_names": ("X",)}]
+        ta += [{"kind": "sma", "length": n} for n in range(6, 6 + 2 * chunk)]
+        ta += [{"kind": "ema", "length": 5, "col_names": ("X",)}]
+
+        cores = self.data.ta.cores
+        self.data.ta.cores = 0
+        self.data.ta.strategy(pandas_ta.Strategy("Assembly", ta), verbose=verbose, timed=strategy_timed)
+        self.data.ta.cores = cores
+
+        # Columns are packed as they arrive and appended in order
+        self.assertEqual(self.data.shape[1], self.init_cols + 1 + 2 * chunk)
+        self.assertEqual(self.data.columns[self.init_cols], "X")
+        self.assertEqual(self.data.columns[-1], f"SMA_{5 + 2 * chunk}")
+        assert_series_equal(self.data["X"], pandas_ta.ema(self.data["close"], 5), check_names=False)
+        self.assertLess(self.data._mgr.nblocks, chunk)
+
+        # Without pandas' private in place update, by the public insertion
+        df = self.data.iloc[:, :5].copy()
+        df.ta.cores = 0
+        with patch.object(DataFrame, "_update_inplace", side_effect=AttributeError, create=True):
+            df.ta.strategy(pandas_ta.Strategy("Assembly", ta[1:4]))
+        assert_frame_equal(df, self.data[df.columns])
+        self.assertEqual(list(df.columns[5:]), [f"SMA_{n}" for n in range(6, 9)])
+
+    def test_cost_model(self):
+        self.category = "Cost Model"
+        costs = [1, 50, 2, 40, 3]
+        self.assertEqual(pandas_ta.schedule(costs, 40), [[1], [3], [4, 2, 0]])
+
+        model = pandas_ta.CostModel().calibrate(self.data, "volatility")
+        self.assertIn("atr", model.costs)
+        self.assertGreater(model.cost("cdl_pattern", 100), model.cost("hl2", 100))
+        with TemporaryDirectory() as tmp:
+            path = f"{tmp}/costs.json"
+            model.save(path)
+            self.assertEqual(pandas_ta.CostModel.load(path).costs, model.costs)
+        self.data.ta.strategy("volatility", cost_model=model, verbose=verbose, timed=strategy_timed)
+
+    def test_select_backend(self):
+        self.category = "Select Backend"
+        select = pandas_ta.select_backend
+        self.assertEqual(select(["sma", "ema"], 5000, 1)[0], "serial")
+        self.assertEqual(select(["sma", "ema"], 50, 4)[0], "serial")
+        self.assertEqual(select(["sma", "ema", "stc"], 5000, 4)[0], "processes")
+        self.assertEqual(select(["sma", "ema", "rsi"], 5000, 4)[0], "threads")
+        self.assertIsNone(self.data.ta.strategy(backend="fibers"))
+        self.data.ta.strategy("volatility", backend="serial", verbose=verbose, timed=strategy_timed)
+
     def test_cycles_category(self):
         self.category = "Cycles"
         self.data.ta.strategy(self.category, verbose=verbose, timed=strategy_timed)
@@ -166,6 +305,25 @@ class TestStrategyMethods(TestCase):
         )
         self.data.ta.strategy(custom, verbose=verbose, timed=strategy_timed)
 
+    def test_custom_col_names_multiprocessing(self):
+        self.category = "Custom Col Names Multiprocessing"
+        custom = lambda: pandas_ta.Strategy("Custom Col Names", [
+            {"kind": "sma", "length": 5, "col_names": "S5"},
+            {"kind": "ema", "close": "S5", "length": 3, "prefix": "P"},
+            {"kind": "bbands", "col_names": ("LB", "MB", "UB", "BW", "BP")},
+            {"kind": "macd", "col_numbers": (1,), "col_names": ("MH",)},
+            {"kind": "rsi", "suffix": "S"},
+        ])
+        serial = self.data.copy()
+        serial.ta.cores = 0
+        serial.ta.strategy(custom(), verbose=verbose)
+        for backend in ["processes", "threads"]:
+            df = self.data.copy()
+            df.ta.strategy(custom(), backend=backend, verbose=verbose)
+            self.assertTrue(df.equals(serial))
+            self.assertEqual(list(df.columns), list(serial.columns))
+        self.data.ta.strategy(custom(), backend="processes", verbose=verbose, timed=strategy_timed)
+
     # @skip
     def test_custom_col_numbers_tuple(self):
         self.category = "Custom D"
@@ -198,11 +356,82 @@ class TestStrategyMethods(TestCase):
         self.data.ta.tsignals(trend=self.data["AMATe_LR_20_50_2"], append=True)
         self.assertEqual(len(self.data.columns), 13)
 
+    def test_custom_duplicates(self):
+        self.category = "Custom F"
+
+        duplicates_ta = [
+            {"kind": "sma", "length": 50},
+            {"kind": "log_return", "cumulative": True},
+            {"kind": "sma", "length": 50},
+            {"kind": "ema", "close": "CUMLOGRET_1", "length": 5},
+            {"kind": "sma", "close": "EMA_5", "length": 5},
+        ]
+        waves, duplicates = pandas_ta.engine.plan(
+            [(x["kind"], (), x) for x in duplicates_ta],
+            Index(["open", "high", "low", "close", "volume"])
+        )
+        self.assertEqual(waves, [[0, 1], [3], [4]])
+        self.assertEqual(duplicates, 1)
+
+        custom = pandas_ta.Strategy("Duplicates and Chains", duplicates_ta)
+        self.data.ta.strategy(custom, verbose=verbose, timed=strategy_timed)
+        self.assertIn("SMA_5", self.data.columns)
+
+    def test_custom_sweep(self):
+        self.category = "Custom Sweep"
+
+        sweep_ta = [
+            {"kind": "ema", "length": range(5, 10)},
+            {"kind": "bbands", "length": [10, 20], "prefix": "S"},
+            {"kind": "rsi"},
+        ]
+        custom = pandas_ta.Strategy("Sweep", sweep_ta)
+        self.data.ta.strategy(custom, verbose=verbose, timed=strategy_timed)
+        columns = list(self.data.columns)
+        self.assertEqual(columns[self.init_cols:self.init_cols + 5], [f"EMA_{n}" for n in range(5, 10)])
+        self.assertIn("S_BBL_10_2.0", columns)
+        self.assertIn("S_BBL_20_2.0", columns)
+        self.assertEqual(columns[-1], "RSI_14")
+
     # @skip
     def test_momentum_category(self):
         self.category = "Momentum"
         self.data.ta.strategy(self.category, verbose=verbose, timed=strategy_timed)
 
+    def test_custom_incremental(self):
+        self.category = "Custom Incremental"
+
+        incremental_ta = [
+            {"kind": "sma", "length": 10},
+            {"kind": "ema", "close": "SMA_10", "length": 5},
+            {"kind": "macd", "params": (8, 21, 5)},
+            {"kind": "atr", "length": [5, 14]},
+            {"kind": "bbands", "col_numbers": (0, 2)},
+            {"kind": "cci"},
+            {"kind": "mom"},
+            {"kind": "supertrend"},
+        ]
+        custom = pandas_ta.Strategy("Incremental", incremental_ta)
+        self.data.ta.strategy(custom, verbose=verbose, timed=strategy_timed)
+
+        df = self.data.iloc[:3000, :5].copy()
+        df.ta.cores = 0
+        df.ta.strategy(custom)
+        pandas_ta.stream._states.clear()
+        for end in [3001, 3002, 4000, self.data.shape[0]]:
+            df = concat([df, self.data.iloc[df.shape[0]:end, :5]])
+            df.ta.cores = 0
+            df.iloc[10, df.columns.get_loc("MOM_10")] = -1.0
+            df.iloc[10, df.columns.get_loc("SUPERT_7_3.0")] = -1.0
+            df.ta.strategy(custom, incremental=True)
+            # Only the new rows are written, without a state on the first run
+            self.assertEqual(df["MOM_10"].iloc[10], -1.0)
+            self.assertEqual(df["SUPERT_7_3.0"].iloc[10], -1.0)
+
+        df.iloc[10, df.columns.get_loc("MOM_10")] = self.data["MOM_10"].iloc[10]
+        df.iloc[10, df.columns.get_loc("SUPERT_7_3.0")] = self.data["SUPERT_7_3.0"].iloc[10]
+        assert_frame_equal(df, self.data[df.columns], check_exact=False, check_dtype=True, rtol=1e-9, atol=1e-9)
+
     # @skip
     def test_overlap_category(self):
         self.category = "Overlap"
@@ -234,6 +463,15 @@ class TestStrategyMethods(TestCase):
         self.data.ta.strategy(self.category, verbose=verbose, timed=strategy_timed)
 
     # @skipUnless(verbose, "verbose mode only")
+    def test_strategy_many(self):
+        self.category = "Strategy Many"
+        dfs = {"A": self.data, "B": self.data.iloc[:500].copy()}
+        result = pandas_ta.strategy_many(dfs, pandas_ta.CommonStrategy, cores=cores, verbose=verbose, timed=strategy_timed)
+        self.assertEqual(list(result.keys()), ["A", "B"])
+        self.assertIs(result["A"], self.data)
+        self.assertIn("VOL_SMA_20", result["B"].columns)
+        self.assertTrue(result["B"]["SMA_10"].equals(pandas_ta.sma(result["B"]["close"], 10)))
+
     def test_all_no_multiprocessing(self):
         self.category = "All with No Multiprocessing"
 
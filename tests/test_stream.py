@@ -0,0 +1,152 @@
+from math import isnan
+from unittest import TestCase
+
+from numpy import nan
+from pandas import DataFrame, Series
+from pandas.testing import assert_frame_equal
+
+from .config import sample_data
+from .context import pandas_ta
+
+
+class TestStream(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = sample_data
+        cls.cases = [
+            ("sma", {}), ("sma", {"length": 20, "talib": False, "min_periods": 5}),
+            ("ema", {}), ("ema", {"talib": False}), ("ema", {"talib": False, "sma": False}),
+            ("ema", {"talib": False, "adjust": True}), ("rma", {"length": 14}),
+            ("rsi", {}), ("rsi", {"talib": False}), ("rsi", {"talib": False, "drift": 2, "scalar": 50}),
+            ("macd", {}), ("macd", {"talib": False}), ("macd", {"fast": 5, "slow": 3, "signal": 4}),
+            ("stdev", {}), ("stdev", {"talib": False}),
+            ("bbands", {}), ("bbands", {"talib": False}), ("bbands", {"length": 20, "mamode": "ema"}),
+            ("true_range", {}), ("true_range", {"talib": False, "drift": 2}),
+            ("atr", {}), ("atr", {"talib": False}), ("atr", {"talib": False, "mamode": "sma", "percent": True}),
+            ("mom", {}), ("roc", {}), ("roc", {"talib": False}), ("jma", {}), ("mcgd", {}),
+            ("kama", {}), ("kama", {"length": 5, "fast": 3, "slow": 20}),
+            ("psar", {}), ("psar", {"af0": 0.01, "max_af": 0.1}),
+            ("supertrend", {}), ("supertrend", {"length": 10, "multiplier": 2}),
+            ("vidya", {}), ("vidya", {"length": 5}),
+        ]
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.data
+
+    def setUp(self): pass
+    def tearDown(self): pass
+
+
+    def batch(self, kind, data, **kwargs):
+        stream = pandas_ta.stream.STREAMS[kind](**kwargs)
+        result = getattr(pandas_ta, kind)(*[data[x] for x in stream.inputs], **kwargs)
+        return result.to_frame() if isinstance(result, Series) else result
+
+    def updates(self, stream, data):
+        bars = zip(*[data[x].tolist() for x in stream.inputs])
+        values = [stream.update(*bar) for bar in bars]
+        return DataFrame(values, index=data.index, columns=stream.columns)
+
+    def test_streams(self):
+        for kind, kwargs in self.cases:
+            with self.subTest(kind=kind, kwargs=kwargs):
+                expected = self.batch(kind, self.data, **kwargs)
+                result = self.updates(pandas_ta.stream.STREAMS[kind](**kwargs), self.data)
+                self.assertEqual(list(result.columns), list(expected.columns))
+                assert_frame_equal(result, expected, check_exact=False, rtol=1e-9)
+
+    def test_seed(self):
+        head, tail = self.data.iloc[:3000], self.data.iloc[3000:]
+        for kind, kwargs in self.cases:
+            with self.subTest(kind=kind, kwargs=kwargs):
+                expected = self.batch(kind, self.data, **kwargs).iloc[3000:]
+                stream = pandas_ta.stream.STREAMS[kind](**kwargs)
+                self.assertIs(stream.seed(*[head[x] for x in stream.inputs]), stream)
+                result = self.updates(stream, tail)
+                assert_frame_equal(result, expected, check_exact=False, rtol=1e-9, atol=1e-9)
+
+    def test_kernel_streams(self):
+        close = self.data["close"].to_numpy()
+        for kind, kernel in [("jma", pandas_ta.JMA), ("mcgd", pandas_ta.MCGD)]:
+            with self.subTest(kind=kind):
+                stream, expected = pandas_ta.stream.STREAMS[kind](), kernel()
+                stream.update(close[:100])
+                expected.update(close[:100])
+                self.assertIsInstance(stream.state, list)
+                result = [stream.update(x) for x in close[100:]]
+                self.assertEqual(result, [expected.update(x) for x in close[100:]])
+
+    def test_checkpoint(self):
+        head, tail = self.data.iloc[:3000], self.data.iloc[3000:]
+        for kind, kwargs in self.cases:
+            with self.subTest(kind=kind, kwargs=kwargs):
+                stream = pandas_ta.stream.STREAMS[kind](**kwargs)
+                stream.seed(*[head[x] for x in stream.inputs])
+                restored = pandas_ta.stream.restore(stream.dumps().encode())
+                self.assertIs(type(restored), type(stream))
+                self.assertEqual(restored.checkpoint(), stream.checkpoint())
+                assert_frame_equal(self.updates(restored, tail), self.updates(stream, tail))
+
+        self.assertIsNone(pandas_ta.stream.restore({"stream": "SAR"}))
+        self.assertIsNone(pandas_ta.stream.restore("{"))
+
+    def test_stream_warmup(self):
+        rsi = pandas_ta.stream.RSI(length=3)
+        values = [rsi.update(x) for x in [1.0, 2.0, 3.0, 2.0]]
+        self.assertTrue(all(isnan(x) for x in values[:-1]))
+        self.assertIsInstance(values[-1], float)
+        self.assertFalse(isnan(values[-1]))
+
+        macd = pandas_ta.stream.MACD()
+        self.assertEqual(len(macd.update(1.0)), 3)
+        self.assertEqual(repr(macd), "MACD(MACD_12_26_9, MACDh_12_26_9, MACDs_12_26_9)")
+
+        # Leading NaNs are skipped
+        sma = pandas_ta.stream.SMA(length=2)
+        self.assertTrue(isnan(sma.update(nan)))
+        self.assertTrue(isnan(sma.update(1.0)))
+        self.assertEqual(sma.update(3.0), 2.0)
+
+    def test_stream_slots(self):
+        for kind, stream in pandas_ta.stream.STREAMS.items():
+            with self.subTest(kind=kind):
+                self.assertFalse(hasattr(stream(), "__dict__"))
+
+    def test_streaming_strategy(self):
+        custom = pandas_ta.Strategy("Live", ta=[
+            {"kind": "sma", "length": 10},
+            {"kind": "sma", "close": "volume", "length": 20, "prefix": "VOL"},
+            {"kind": "ema", "close": "SMA_10", "length": 5, "suffix": "S"},
+            {"kind": "rsi"},
+            {"kind": "macd", "params": (8, 21, 5)},
+            {"kind": "bbands", "length": 20, "col_numbers": (0, 2), "col_names": ("BBL", "BBU")},
+            {"kind": "atr", "length": [5, 14]},
+            {"kind": "cci"},
+        ])
+        df = self.data.copy()
+        df.ta.strategy(custom, verbose=False)
+
+        live = pandas_ta.StreamingStrategy(custom)
+        self.assertEqual(live.excluded, ["cci"])
+        self.assertEqual(live.columns, [
+            "SMA_10", "VOL_SMA_20", "EMA_5_S", "RSI_14", "MACD_8_21_5", "MACDh_8_21_5",
+            "MACDs_8_21_5", "BBL", "BBU", "ATRr_5", "ATRr_14"
+        ])
+        bars = [self.data[x] for x in pandas_ta.stream.SOURCES]
+        result = DataFrame([live.push(*bar) for bar in zip(*bars)], index=self.data.index)
+        assert_frame_equal(result, df[live.columns], check_exact=False, rtol=1e-9)
+
+        live = pandas_ta.StreamingStrategy(custom).seed(self.data.iloc[:3000])
+        self.assertEqual(live.ts, self.data.index[2999])
+        # As a new process would
+        live = pandas_ta.StreamingStrategy(custom).restore(live.dumps())
+        self.assertEqual(live.ts, self.data.index[2999])
+        bars = [self.data[x].iloc[3000:] for x in pandas_ta.stream.SOURCES]
+        result = DataFrame([live.push(*bar) for bar in zip(*bars)], index=self.data.index[3000:])
+        assert_frame_equal(result, df[live.columns].iloc[3000:], check_exact=False, rtol=1e-9, atol=1e-9)
+
+        # The chained indicators from the columns of the batch run
+        live = pandas_ta.StreamingStrategy(custom).seed(df.iloc[:3000])
+        result = DataFrame([live.push(*bar) for bar in zip(*bars)], index=self.data.index[3000:])
+        assert_frame_equal(result, df[live.columns].iloc[3000:], check_exact=False, rtol=1e-9, atol=1e-9)
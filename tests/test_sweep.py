@@ -0,0 +1,83 @@
+from unittest import TestCase
+
+from numpy import nan
+from pandas import DataFrame, concat
+from pandas.testing import assert_frame_equal
+
+from .config import sample_data
+from .context import pandas_ta
+
+
+class TestSweep(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = sample_data
+        cls.close = cls.data["close"]
+        cls.lengths = [2, 3, 10, 31, 100]
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.data
+
+    def setUp(self): pass
+    def tearDown(self): pass
+
+
+    def assert_sweep(self, kind, close=None, lengths=None, **kwargs):
+        close = self.close if close is None else close
+        lengths = self.lengths if lengths is None else lengths
+        result = pandas_ta.sweep(kind, close, length=lengths, **kwargs)
+        expected = concat([getattr(pandas_ta, kind)(close, length=n, **kwargs) for n in lengths], axis=1)
+        self.assertIsInstance(result, DataFrame)
+        assert_frame_equal(result, expected, check_exact=False, rtol=1e-6, atol=1e-6)
+        return result
+
+    def test_sweep_kernels(self):
+        for talib in [False, True]:
+            for kind in pandas_ta.SWEEP_KERNELS:
+                with self.subTest(kind=kind, talib=talib):
+                    self.assert_sweep(kind, talib=talib)
+
+    def test_sweep_gaps(self):
+        close = self.close.copy()
+        close.iloc[:25] = nan
+        for kind in ["sma", "stdev", "rma", "rsi"]:
+            with self.subTest(kind=kind):
+                self.assert_sweep(kind, close, talib=False)
+
+        close.iloc[100] = nan
+        self.assert_sweep("sma", close, talib=False)
+
+    def test_sweep_kwargs(self):
+        result = self.assert_sweep("stdev", ddof=0, talib=False)
+        self.assertEqual(result.name, "STDEV_SWEEP")
+        self.assertEqual(result.category, "statistics")
+
+        result = self.assert_sweep("ema", talib=False, offset=2, fillna=0)
+        self.assertEqual(result.iloc[0].sum(), 0)
+
+    def test_sweep_order(self):
+        for kind in ["ema", "rsi", "sma"]:
+            with self.subTest(kind=kind):
+                self.assert_sweep(kind, lengths=[31, 2, 10], talib=False)
+                result = pandas_ta.sweep(kind, self.close, length=[10, 5, 10])
+                self.assertEqual(list(result.columns), [f"{kind.upper()}_10", f"{kind.upper()}_5"])
+
+    def test_sweep_other(self):
+        result = pandas_ta.sweep("macd", self.close, fast=[8, 12])
+        self.assertEqual(list(result.columns[:3]), ["MACD_8_26_9", "MACDh_8_26_9", "MACDs_8_26_9"])
+        self.assertEqual(result.shape[1], 6)
+        self.assertEqual(result.category, "momentum")
+
+        self.assertIsNone(pandas_ta.sweep("sma", self.close, length=10))
+        self.assertIsNone(pandas_ta.sweep("sma", self.close, length=[]))
+        self.assertIsNone(pandas_ta.sweep("sma", self.close, length=[5], talib=[True]))
+
+    def test_ext_sweep(self):
+        df = self.data.copy()
+        result = df.ta.sweep("sma", length=range(5, 10), append=True)
+        self.assertEqual(list(result.columns), [f"SMA_{n}" for n in range(5, 10)])
+        self.assertEqual(list(df.columns[-5:]), list(result.columns))
+
+        result = df.ta.sweep("atr", length=[5, 10], prefix="A")
+        self.assertEqual(list(result.columns), ["A_ATRr_5", "A_ATRr_10"])
@@ -3,9 +3,11 @@ from .context import pandas_ta
 
 from unittest import skip, TestCase
 from unittest.mock import patch
+from warnings import catch_warnings, simplefilter
 
 import numpy as np
 import numpy.testing as npt
+import pandas.testing as pdt
 from pandas import DataFrame, Series
 from pandas.api.types import is_datetime64_ns_dtype, is_datetime64tz_dtype
 
@@ -116,6 +118,28 @@ class TestUtilities(TestCase):
         result = self.utils.below_value(self.crosseddf["a"], self.crosseddf["zero"])
         self.assertIsNone(result)
 
+    def test_cache_scope(self):
+        high, low, close = self.data["high"], self.data["low"], self.data["close"]
+        expected = pandas_ta.squeeze_pro(high, low, close)
+
+        with self.utils.cache_scope() as cache:
+            pandas_ta.squeeze(high, low, close)
+            result = pandas_ta.squeeze_pro(high, low, close)
+            self.assertGreater(cache.hits, 0)
+            self.assertIs(self.utils.cache_scope(), cache)
+
+        self.assertIsNot(self.utils.cache_scope(), cache)
+        pdt.assert_frame_equal(result, expected)
+
+        # Cached results are copies
+        with self.utils.cache_scope() as cache:
+            a = pandas_ta.atr(high, low, close)
+            a.iloc[-1] = 0
+            b = pandas_ta.atr(high, low, close)
+            self.assertEqual(cache.hits, 1)
+            self.assertNotEqual(b.iloc[-1], 0)
+            self.assertEqual(b.category, "volatility")
+
     def test_combination(self):
         self.assertIsNotNone(self.utils.combination())
 
@@ -182,6 +206,19 @@ class TestUtilities(TestCase):
         npt.assert_allclose(self.utils.fibonacci(n=5, zero=False, weighted=True), np.array([1 / 12, 1 / 12, 1 / 6, 1 / 4, 5 / 12]))
 
 
+    def test_fir(self):
+        close = self.data.close.copy()
+        close.iloc[[10, 40, 41]] = np.nan
+        for length in [1, 3, 10, self.utils.FIR_DIRECT + 1]:
+            w = np.arange(1, length + 1) ** 0.5
+            result = self.utils.fir(close, w)
+            self.assertIsInstance(result, Series)
+            expected = close.rolling(length).apply(self.utils.weights(w), raw=True)
+            pdt.assert_series_equal(result, expected, check_names=False, rtol=1e-10)
+
+        result = self.utils.fir(close.iloc[:5], [1, 1, 1, 1, 1, 1])
+        self.assertTrue(result.isna().all())
+
     def test_geometric_mean(self):
         returns = pandas_ta.percent_return(self.data.close)
         result = self.utils.geometric_mean(returns)
@@ -213,6 +250,39 @@ class TestUtilities(TestCase):
         self.assertIsInstance(result, str)
         self.assertTrue("SSE" in result)
 
+    def test_iir(self):
+        x = np.random.default_rng(1).standard_normal((600, 2)).cumsum(axis=0)
+        x[450, 1] = np.nan
+        def lfilter(b, a, x, y):
+            for n in range(x.shape[0]):
+                y[n] = sum(b[i] * x[n - i] for i in range(len(b)) if n >= i)
+                y[n] -= sum(a[i] * y[n - i] for i in range(1, len(a)) if n >= i)
+            return y
+
+        backend = pandas_ta.kernel_backend()
+        for kernel_backend in ["numpy", "numba"]:
+            if kernel_backend == "numba" and not pandas_ta.Imports["numba"]: continue
+            pandas_ta.kernel_backend(kernel_backend)
+            for b, a in [([0.2], [1, -0.8]), ([0.5, -0.5], [1, 0.5]), ([1, 2, 1], [4, -2, 0.5]), ([0.1, 0.2, 0.1, 0.3], [1, -1.2, 0.5, -0.1])]:
+                expected = lfilter(np.array(b) / a[0], np.array(a) / a[0], x, np.empty_like(x))
+                result, state = self.utils.iir(x, b, a)
+                npt.assert_allclose(result, expected, rtol=1e-9, atol=1e-9)
+
+                # In chunks, from the state of the previous one
+                head, z = self.utils.iir(x[:300], b, a)
+                tail, _ = self.utils.iir(x[300:], b, a, z)
+                npt.assert_allclose(np.concatenate((head, tail)), result, rtol=1e-9, atol=1e-9)
+
+                # From past values
+                z = self.utils.iir_state(b, a, y=expected[:300], x=x[:300])
+                tail, _ = self.utils.iir(x[300:], b, a, z)
+                npt.assert_allclose(tail, result[300:], rtol=1e-9, atol=1e-9)
+
+                series, _ = self.utils.iir(Series(x[:, 0]), b, a)
+                self.assertIsInstance(series, Series)
+                npt.assert_allclose(series, expected[:, 0], rtol=1e-9, atol=1e-9)
+        pandas_ta.kernel_backend(backend)
+
     def test_linear_regression(self):
         x = Series([1, 2, 3, 4, 5])
         y = Series([1.8, 2.1, 2.7, 3.2, 4])
@@ -263,6 +333,83 @@ class TestUtilities(TestCase):
         npt.assert_array_equal(self.utils.pascals_triangle(n=5, weighted=True), array_5w)
         npt.assert_array_equal(self.utils.pascals_triangle(n=5, weighted=True, inverse=True), array_5iw)
 
+    def test_rolling_linreg(self):
+        close = self.data.close.copy()
+        close.iloc[40] = np.nan
+        length = 10
+        result = self.utils.rolling_linreg(close, length)
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(list(result.columns), ["slope", "intercept", "angle", "r", "linreg", "tsf"])
+        self.assertTrue(result.iloc[:length - 1].isna().all().all())
+        self.assertTrue(result.iloc[40:40 + length].isna().all().all())
+
+        x = np.arange(1, length + 1)
+        for i in [length - 1, 39, 50, close.size - 1]:
+            y = close.iloc[i - length + 1:i + 1].to_numpy()
+            m, b = np.polyfit(x, y, 1)
+            row = result.iloc[i]
+            self.assertAlmostEqual(row["slope"], m)
+            self.assertAlmostEqual(row["intercept"], b)
+            self.assertAlmostEqual(row["angle"], np.arctan(m))
+            self.assertAlmostEqual(row["r"], np.corrcoef(x, y)[0, 1])
+            self.assertAlmostEqual(row["linreg"], m * (length - 1) + b)
+            self.assertAlmostEqual(row["tsf"], m * length + b)
+
+        # Two points are on their line; r is within [-1, 1]
+        pair = self.utils.rolling_linreg(self.data.close, 2)["r"].dropna()
+        npt.assert_array_equal(pair.abs(), 1.0)
+        self.assertTrue((result["r"].dropna().abs() <= 1).all())
+
+        flat = self.utils.rolling_linreg(Series([2.0] * 8 + [1.0, 3.0]), 4)
+        self.assertTrue(flat["r"].iloc[3:8].isna().all())
+        npt.assert_allclose(flat["slope"].iloc[3:8], 0, atol=1e-12)
+
+    def test_rolling_mad(self):
+        close = self.data.close.copy()
+        close.iloc[[10, 40, 41]] = np.nan
+        mean_ad = lambda x: np.fabs(x - x.mean()).mean()
+        median_ad = lambda x: np.median(np.fabs(x - np.median(x)))
+        backend = pandas_ta.kernel_backend()
+        for kernel_backend in ["numpy", "numba"]:
+            if kernel_backend == "numba" and not pandas_ta.Imports["numba"]: continue
+            pandas_ta.kernel_backend(kernel_backend)
+            for length, min_periods in [(1, None), (4, None), (5, None), (30, 3), (50, 0)]:
+                rolling = close.rolling(length, min_periods=min_periods)
+                for median, fn in [(False, mean_ad), (True, median_ad)]:
+                    result = self.utils.rolling_mad(close, length, min_periods, median)
+                    pdt.assert_series_equal(result, rolling.apply(fn, raw=True), check_names=False)
+
+        # Windows of leading NaNs only are NaN without warnings
+        close.iloc[:3] = np.nan
+        pandas_ta.kernel_backend("numpy")
+        with catch_warnings():
+            simplefilter("error", RuntimeWarning)
+            for median, fn in [(False, mean_ad), (True, median_ad)]:
+                result = self.utils.rolling_mad(close, 5, 1, median)
+                pdt.assert_series_equal(result, close.rolling(5, min_periods=1).apply(fn, raw=True), check_names=False)
+        pandas_ta.kernel_backend(backend)
+
+        # A value has no deviation from itself
+        self.assertTrue((self.utils.rolling_mad(self.data.close, 1) == 0).all())
+
+    def test_rolling_minmax(self):
+        close = self.data.close.round(0)
+        close.iloc[[10, 40, 41]] = np.nan
+        backend = pandas_ta.kernel_backend()
+        for kernel_backend in ["numpy", "numba"]:
+            if kernel_backend == "numba" and not pandas_ta.Imports["numba"]: continue
+            pandas_ta.kernel_backend(kernel_backend)
+            for length, min_periods in [(1, None), (5, None), (14, 3), (50, 0)]:
+                highest, lowest, since_highest, since_lowest = self.utils.rolling_minmax(close, length, min_periods)
+                rolling = close.rolling(length, min_periods=min_periods)
+                pdt.assert_series_equal(highest, rolling.max(), check_names=False)
+                pdt.assert_series_equal(lowest, rolling.min(), check_names=False)
+                if min_periods is None:
+                    # Periods since the most recent max and min
+                    pdt.assert_series_equal(since_highest, rolling.apply(self.utils.recent_maximum_index, raw=True), check_names=False)
+                    pdt.assert_series_equal(since_lowest, rolling.apply(self.utils.recent_minimum_index, raw=True), check_names=False)
+        pandas_ta.kernel_backend(backend)
+
     def test_symmetric_triangle(self):
         npt.assert_array_equal(self.utils.symmetric_triangle(), np.array([1,1]))
         npt.assert_array_equal(self.utils.symmetric_triangle(weighted=True), np.array([0.5, 0.5]))